@@ -7,28 +7,339 @@ SOLID Principles Applied:
     - OCP: New endpoints can be added without modifying existing ones
     - DIP: Depends on AIService abstraction, not concrete implementations
 """
-from fastapi import APIRouter, HTTPException, status
-from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import Any, Dict, List, Optional, Tuple, Type
+import hashlib
+import httpx
+import orjson
+from pydantic import BaseModel, ValidationError
 
-from app.schemas.ai_schemas import AIRequest, AIResponse
+from app.schemas.ai_schemas import (
+    AIBatchRequest,
+    AIBatchResponse,
+    AIRequest,
+    AIResponse,
+    CostEstimateBatchRequest,
+)
+from app.schemas.registry_schemas import (
+    CapabilityModelsResponse,
+    CostEstimateBatchResponse,
+    CostEstimateResponse,
+    ModelSpecResponse,
+    PromptTemplatesResponse,
+    ProviderModelsResponse,
+    ProvidersResponse,
+    ProviderStatusResponse,
+    ProviderSummary,
+    TokenValidationResponse,
+    UnblockResponse,
+)
 from app.services.ai_service import AIService
 from app.services.prompt_manager import PromptManager
-from app.core.quota_tracker import QuotaTracker
+from app.core.admission import get_admission
+from app.core.http_client import get_http_client
 from app.core.model_registry import (
     get_model_spec,
     get_models_by_provider,
     get_models_by_capability,
     get_model_summary,
     validate_token_count,
-    estimate_cost,
-    ModelCapability
+    estimate_cost_batch,
+    ModelCapability,
+    ModelSpec,
+    MODEL_REGISTRY
 )
 
-router = APIRouter()
+# Dynamic payloads are encoded with orjson; static ones are pre-serialized below
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+# ============================================================================
+# PRECOMPUTED PAYLOADS
+# ============================================================================
+# The provider list, prompt templates and model registry are static for the
+# lifetime of the process, so the reference endpoints below serve JSON bodies
+# built and serialized once at import instead of on every request. Each body
+# carries a strong ETag so polling clients get an empty 304 when unchanged.
+
+# Pre-serialized JSON body and its quoted ETag
+_StaticJSON = Tuple[bytes, str]
+
+# Static payloads never change within a process; let clients reuse them briefly
+_STATIC_CACHE_CONTROL = "public, max-age=60"
+
+def _provider_model_entry(spec: ModelSpec) -> Dict[str, Any]:
+    """
+    Build the per-model entry used by the provider models endpoint.
+    
+    Args:
+        spec: Model specification from the registry
+    
+    Returns:
+        Dict with the public fields of the model
+    
+    Source/Caller:
+        - Called by: Module import (payload precomputation)
+    """
+    return {
+        "model_id": spec.model_id,
+        "display_name": spec.display_name,
+        "context_window": spec.context_window,
+        "max_output_tokens": spec.max_output_tokens,
+        "capabilities": [c.value for c in spec.capabilities],
+        "cost_per_1k_input": spec.cost_per_1k_input,
+        "cost_per_1k_output": spec.cost_per_1k_output,
+        "recommended_for": spec.recommended_for,
+        "notes": spec.notes
+    }
+
+
+def _model_spec_entry(spec: ModelSpec) -> Dict[str, Any]:
+    """
+    Build the detailed specification payload for a single model.
+    
+    Args:
+        spec: Model specification from the registry
+    
+    Returns:
+        Dict with the complete model specification
+    
+    Source/Caller:
+        - Called by: Module import (payload precomputation)
+    """
+    return {
+        "model_id": spec.model_id,
+        "provider": spec.provider,
+        "display_name": spec.display_name,
+        "context_window": spec.context_window,
+        "max_output_tokens": spec.max_output_tokens,
+        "supports_system_message": spec.supports_system_message,
+        "capabilities": [c.value for c in spec.capabilities],
+        "cost_per_1k_input": spec.cost_per_1k_input,
+        "cost_per_1k_output": spec.cost_per_1k_output,
+        "recommended_for": spec.recommended_for,
+        "notes": spec.notes
+    }
+
+
+def _capability_model_entry(spec: ModelSpec) -> Dict[str, Any]:
+    """
+    Build the condensed entry used by the capability filter endpoint.
+    
+    Args:
+        spec: Model specification from the registry
+    
+    Returns:
+        Dict with identifying fields and input cost of the model
+    
+    Source/Caller:
+        - Called by: Module import (payload precomputation)
+    """
+    return {
+        "model_id": spec.model_id,
+        "provider": spec.provider,
+        "display_name": spec.display_name,
+        "context_window": spec.context_window,
+        "cost_per_1k_input": spec.cost_per_1k_input
+    }
+
+
+def _static_json(payload: Any, option: Optional[int] = None) -> _StaticJSON:
+    """
+    Serialize a static payload and derive its ETag.
+    
+    Args:
+        payload: JSON-serializable payload
+        option: Optional orjson option flags
+    
+    Returns:
+        Tuple of the encoded body and its quoted strong ETag
+    
+    Source/Caller:
+        - Called by: Module import (payload precomputation)
+    """
+    body = orjson.dumps(payload, option=option)
+    
+    return body, f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+def _json_response(static: _StaticJSON, if_none_match: Optional[str]) -> Response:
+    """
+    Serve a pre-serialized JSON body, or 304 if the client already has it.
+    
+    Args:
+        static: Encoded body and ETag from _static_json
+        if_none_match: Value of the client's If-None-Match header, if any
+    
+    Returns:
+        Response: 304 with no body when an ETag matches, else the body as-is
+    
+    Source/Caller:
+        - Called by: Reference endpoints serving precomputed payloads
+    """
+    body, etag = static
+    headers = {"ETag": etag, "Cache-Control": _STATIC_CACHE_CONTROL}
+    
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+_PROVIDERS_JSON: _StaticJSON = _static_json({
+    "providers": AIService.get_supported_providers()
+})
+
+# Template names are str-enum members; OPT_NON_STR_KEYS serializes them by value
+_TEMPLATES_JSON: _StaticJSON = _static_json(
+    {"templates": PromptManager.list_templates()},
+    option=orjson.OPT_NON_STR_KEYS
+)
+
+_MODEL_SUMMARY_JSON: _StaticJSON = _static_json(get_model_summary())
+
+_PROVIDER_MODELS_JSON: Dict[str, _StaticJSON] = {
+    provider: _static_json({
+        "provider": provider,
+        "models": [_provider_model_entry(m) for m in get_models_by_provider(provider)]
+    })
+    for provider in {spec.provider for spec in MODEL_REGISTRY.values()}
+}
+
+_MODEL_SPEC_JSON: Dict[str, _StaticJSON] = {
+    model_id: _static_json(_model_spec_entry(spec))
+    for model_id, spec in MODEL_REGISTRY.items()
+}
+
+def _capability_payload(capability: ModelCapability) -> Dict[str, Any]:
+    """
+    Build the capability filter payload for one capability.
+    
+    Args:
+        capability: Capability to filter models by
+    
+    Returns:
+        Dict with the capability, model count and condensed model entries
+    
+    Source/Caller:
+        - Called by: Module import (payload precomputation)
+    """
+    models = get_models_by_capability(capability)
+    
+    return {
+        "capability": capability.value,
+        "model_count": len(models),
+        "models": [_capability_model_entry(m) for m in models]
+    }
+
+
+_CAPABILITY_MODELS_JSON: Dict[str, _StaticJSON] = {
+    capability.value: _static_json(_capability_payload(capability))
+    for capability in ModelCapability
+}
+
+_VALID_CAPABILITIES: List[str] = [c.value for c in ModelCapability]
+
+
+# ============================================================================
+# REQUEST BODY PARSING
+# ============================================================================
+# /process validates its JSON body straight from the raw bytes with
+# model_validate_json, instead of FastAPI's json.loads + model_validate.
+# Since the body is no longer a declared parameter, its schema is attached to
+# the route's OpenAPI entry explicitly.
+
+def _inline_schema_refs(node: Any, defs: Dict[str, Any]) -> Any:
+    """
+    Replace local "$defs" references in a JSON schema with their definitions.
+    
+    Args:
+        node: Schema node to resolve
+        defs: The schema's "$defs" table
+    
+    Returns:
+        Self-contained copy of the node
+    
+    Source/Caller:
+        - Called by: Module import, to build the /process request body schema
+    """
+    if isinstance(node, dict):
+        if "$ref" in node:
+            return _inline_schema_refs(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+        return {key: _inline_schema_refs(value, defs) for key, value in node.items()}
+    
+    if isinstance(node, list):
+        return [_inline_schema_refs(item, defs) for item in node]
+    
+    return node
+
+
+def _request_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build the OpenAPI requestBody entry for a model parsed by hand.
+    
+    Args:
+        model: Pydantic model describing the body
+    
+    Returns:
+        Dict suitable for a route's openapi_extra
+    
+    Source/Caller:
+        - Called by: Module import
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema_refs(schema, defs)}},
+        }
+    }
+
+
+_AI_REQUEST_OPENAPI: Dict[str, Any] = _request_body_openapi(AIRequest)
+
+
+async def _parse_ai_request(request: Request) -> AIRequest:
+    """
+    Parse and validate the /process body in one pass from the raw bytes.
+    
+    Args:
+        request: Incoming HTTP request
+    
+    Returns:
+        AIRequest: Validated request payload
+    
+    Raises:
+        RequestValidationError: If the body is not valid JSON or fails
+        validation (rendered as 422, same as a declared body parameter)
+    
+    Source/Caller:
+        - Called by: process_ai_request via Depends
+    """
+    body = await request.body()
+    
+    try:
+        return AIRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)],
+            body=body
+        )
 
 
-@router.post("/process", response_model=AIResponse)
-async def process_ai_request(request: AIRequest) -> AIResponse:
+@router.post("/process", response_model=AIResponse, openapi_extra=_AI_REQUEST_OPENAPI)
+async def process_ai_request(
+    request: AIRequest = Depends(_parse_ai_request),
+    http_client: Optional[httpx.AsyncClient] = Depends(get_http_client)
+) -> AIResponse:
     """
     Process an AI request with specified provider and parameters.
     
@@ -39,9 +350,18 @@ async def process_ai_request(request: AIRequest) -> AIResponse:
             - input_data: JSON data to process
             - model_config: Optional model parameters
             - model_name: Optional specific model override
+            - stream: Stream the output as Server-Sent Events
+        http_client (Optional[httpx.AsyncClient]): Shared upstream client from app state
     
     Returns:
-        AIResponse: AI response with content and usage stats
+        AIResponse: AI response with content and usage stats, or a
+        text/event-stream of delta/done/error events when `stream` is set
+    
+    Provider calls are admitted through the provider's admission controller,
+    so at most `max_concurrent_requests_per_provider` calls per provider are
+    in flight; additional calls wait for a free slot. A micro-batched request
+    shares its packed call's slot. A streamed request holds its slot until
+    the stream has been fully sent or the client disconnects.
     
     Raises:
         HTTPException: 
@@ -58,14 +378,78 @@ async def process_ai_request(request: AIRequest) -> AIResponse:
         - SRP: Only handles HTTP layer, delegates to AIService
         - DIP: Depends on AIService interface
     """
-    return await AIService.process_ai_request(request)
+    if not request.stream:
+        # AIService takes the slot for the provider call itself
+        return await AIService.process_ai_request(request, http_client)
+    
+    admission = get_admission(request.provider.value)
+    
+    await admission.acquire()
+    try:
+        events = await AIService.stream_ai_request(request, http_client)
+    except BaseException:
+        await admission.release()
+        raise
+    
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        background=BackgroundTask(admission.release)
+    )
 
 
-@router.get("/providers")
-async def get_providers() -> Dict[str, list[str]]:
+@router.post("/process/batch", response_model=AIBatchResponse)
+async def process_ai_batch(
+    request: AIBatchRequest,
+    http_client: Optional[httpx.AsyncClient] = Depends(get_http_client)
+) -> Dict[str, Any]:
+    """
+    Process several AI requests in one HTTP call.
+    
+    Requests sharing provider, model, instruction prompt and config are
+    packed into as few provider calls as possible; the rest run
+    concurrently. Each request succeeds or fails on its own.
+    
+    Args:
+        request (AIBatchRequest): Batch payload containing:
+            - requests: 1-100 AI requests (stream must be false)
+        http_client (Optional[httpx.AsyncClient]): Shared upstream client from app state
+    
+    Returns:
+        Dict: Per-request results (status_code plus response or error) in
+        request order, and the summed token usage
+    
+    Raises:
+        HTTPException: 422 if the batch payload is invalid
+    
+    Source/Caller:
+        - Called by: Frontend client applications classifying many records
+        - Input Source: HTTP POST request body
+    
+    SOLID Principle Applied:
+        - SRP: Only handles HTTP layer, delegates to AIService
+    """
+    results = await AIService.process_ai_batch(request.requests, http_client)
+    
+    return {
+        "results": [
+            {"status_code": result.status_code, "error": result.detail}
+            if isinstance(result, HTTPException)
+            else {"status_code": status.HTTP_200_OK, "response": result}
+            for result in results
+        ],
+        "usage": AIService.total_usage(results)
+    }
+
+
+@router.get("/providers", response_model=ProvidersResponse)
+async def get_providers(if_none_match: Optional[str] = Header(default=None)) -> Response:
     """
     Get list of supported AI providers.
     
+    Args:
+        if_none_match: ETag from the If-None-Match header; a match returns 304
+    
     Returns:
         Dict[str, list[str]]: Dictionary with supported providers list
     
@@ -76,13 +460,11 @@ async def get_providers() -> Dict[str, list[str]]:
         - SRP: Only handles HTTP layer
         - DIP: Depends on AIService interface
     """
-    return {
-        "providers": AIService.get_supported_providers()
-    }
+    return _json_response(_PROVIDERS_JSON, if_none_match)
 
 
-@router.get("/status")
-async def get_provider_status() -> Dict[str, any]:
+@router.get("/status", response_model=ProviderStatusResponse)
+async def get_provider_status() -> Dict[str, Any]:
     """
     Get status of all AI providers including blocked status.
     
@@ -100,10 +482,10 @@ async def get_provider_status() -> Dict[str, any]:
         - SRP: Only handles HTTP layer
         - DIP: Depends on AIService interface
     """
-    return AIService.get_provider_status()
+    return await AIService.fetch_provider_status()
 
 
-@router.post("/unblock/{provider}")
+@router.post("/unblock/{provider}", response_model=UnblockResponse)
 async def unblock_provider(provider: str) -> Dict[str, str]:
     """
     Manually unblock a provider (admin operation).
@@ -120,8 +502,7 @@ async def unblock_provider(provider: str) -> Dict[str, str]:
     SOLID Principle Applied:
         - SRP: Only handles HTTP layer
     """
-    quota_tracker = QuotaTracker()
-    quota_tracker.manually_unblock_provider(provider)
+    await AIService.unblock_provider(provider)
     
     return {
         "message": f"Provider {provider} has been unblocked",
@@ -129,11 +510,14 @@ async def unblock_provider(provider: str) -> Dict[str, str]:
     }
 
 
-@router.get("/prompt-templates")
-async def get_prompt_templates() -> Dict[str, Dict[str, str]]:
+@router.get("/prompt-templates", response_model=PromptTemplatesResponse)
+async def get_prompt_templates(if_none_match: Optional[str] = Header(default=None)) -> Response:
     """
     Get available prompt templates.
     
+    Args:
+        if_none_match: ETag from the If-None-Match header; a match returns 304
+    
     Returns:
         Dict[str, Dict[str, str]]: Dictionary of template names and descriptions
     
@@ -144,16 +528,17 @@ async def get_prompt_templates() -> Dict[str, Dict[str, str]]:
         - SRP: Only handles HTTP layer
         - DIP: Depends on PromptManager interface
     """
-    return {
-        "templates": PromptManager.list_templates()
-    }
+    return _json_response(_TEMPLATES_JSON, if_none_match)
 
 
-@router.get("/models")
-async def get_all_models() -> Dict[str, any]:
+@router.get("/models", response_model=Dict[str, ProviderSummary])
+async def get_all_models(if_none_match: Optional[str] = Header(default=None)) -> Response:
     """
     Get all available AI models with their specifications.
     
+    Args:
+        if_none_match: ETag from the If-None-Match header; a match returns 304
+    
     Returns:
         Dict containing model summary by provider
     
@@ -165,16 +550,20 @@ async def get_all_models() -> Dict[str, any]:
         - SRP: Only handles HTTP layer
         - DIP: Depends on model registry interface
     """
-    return get_model_summary()
+    return _json_response(_MODEL_SUMMARY_JSON, if_none_match)
 
 
-@router.get("/models/{provider}")
-async def get_provider_models(provider: str) -> Dict[str, List]:
+@router.get("/models/{provider}", response_model=ProviderModelsResponse)
+async def get_provider_models(
+    provider: str,
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Get all models for a specific provider.
     
     Args:
         provider: Provider name (gemini, openai, claude, deepseek, vertex_ai)
+        if_none_match: ETag from the If-None-Match header; a match returns 304
     
     Returns:
         Dict with list of model specifications
@@ -188,40 +577,28 @@ async def get_provider_models(provider: str) -> Dict[str, List]:
     SOLID Principle Applied:
         - SRP: Only handles HTTP layer
     """
-    models = get_models_by_provider(provider)
+    static = _PROVIDER_MODELS_JSON.get(provider)
     
-    if not models:
+    if static is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Provider '{provider}' not found or has no models"
         )
     
-    return {
-        "provider": provider,
-        "models": [
-            {
-                "model_id": m.model_id,
-                "display_name": m.display_name,
-                "context_window": m.context_window,
-                "max_output_tokens": m.max_output_tokens,
-                "capabilities": [c.value for c in m.capabilities],
-                "cost_per_1k_input": m.cost_per_1k_input,
-                "cost_per_1k_output": m.cost_per_1k_output,
-                "recommended_for": m.recommended_for,
-                "notes": m.notes
-            }
-            for m in models
-        ]
-    }
+    return _json_response(static, if_none_match)
 
 
-@router.get("/models/spec/{model_id}")
-async def get_model_specification(model_id: str) -> Dict[str, any]:
+@router.get("/models/spec/{model_id}", response_model=ModelSpecResponse)
+async def get_model_specification(
+    model_id: str,
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Get detailed specification for a specific model.
     
     Args:
         model_id: Model identifier
+        if_none_match: ETag from the If-None-Match header; a match returns 304
     
     Returns:
         Dict with complete model specification
@@ -236,35 +613,23 @@ async def get_model_specification(model_id: str) -> Dict[str, any]:
     SOLID Principle Applied:
         - SRP: Only handles HTTP layer
     """
-    spec = get_model_spec(model_id)
+    static = _MODEL_SPEC_JSON.get(model_id)
     
-    if not spec:
+    if static is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Model '{model_id}' not found"
         )
     
-    return {
-        "model_id": spec.model_id,
-        "provider": spec.provider,
-        "display_name": spec.display_name,
-        "context_window": spec.context_window,
-        "max_output_tokens": spec.max_output_tokens,
-        "supports_system_message": spec.supports_system_message,
-        "capabilities": [c.value for c in spec.capabilities],
-        "cost_per_1k_input": spec.cost_per_1k_input,
-        "cost_per_1k_output": spec.cost_per_1k_output,
-        "recommended_for": spec.recommended_for,
-        "notes": spec.notes
-    }
+    return _json_response(static, if_none_match)
 
 
-@router.post("/models/validate-tokens")
+@router.post("/models/validate-tokens", response_model=TokenValidationResponse)
 async def validate_tokens(
     model_id: str,
     input_tokens: int,
     requested_output_tokens: int
-) -> Dict[str, any]:
+) -> Dict[str, Any]:
     """
     Validate if token counts are within model limits.
     
@@ -299,12 +664,12 @@ async def validate_tokens(
     }
 
 
-@router.post("/models/estimate-cost")
+@router.post("/models/estimate-cost", response_model=CostEstimateResponse)
 async def estimate_request_cost(
     model_id: str,
     input_tokens: int,
     output_tokens: int
-) -> Dict[str, any]:
+) -> Dict[str, Any]:
     """
     Estimate cost for a model request.
     
@@ -331,9 +696,10 @@ async def estimate_request_cost(
             detail=f"Model '{model_id}' not found"
         )
     
-    total_cost = estimate_cost(model_id, input_tokens, output_tokens)
+    # Single lookup: the breakdown and total come from the same spec
     input_cost = (input_tokens / 1000) * spec.cost_per_1k_input
     output_cost = (output_tokens / 1000) * spec.cost_per_1k_output
+    total_cost = input_cost + output_cost
     
     return {
         "model_id": model_id,
@@ -353,13 +719,69 @@ async def estimate_request_cost(
     }
 
 
-@router.get("/models/by-capability/{capability}")
-async def get_models_by_capability_endpoint(capability: str) -> Dict[str, List]:
+@router.post("/models/estimate-cost/batch", response_model=CostEstimateBatchResponse)
+async def estimate_request_cost_batch(request: CostEstimateBatchRequest) -> Dict[str, Any]:
+    """
+    Estimate costs for several model requests at once.
+    
+    Args:
+        request: Parallel lists of model IDs, input tokens and output tokens
+    
+    Returns:
+        Dict with per-request estimates and the combined total
+    
+    Raises:
+        HTTPException: 404 if any model is not found
+    
+    Source/Caller:
+        - Called by: Frontend for comparing models side by side
+        - Called by: Budget tracking systems
+    
+    SOLID Principle Applied:
+        - SRP: Only handles HTTP layer
+    """
+    try:
+        costs = estimate_cost_batch(
+            request.model_ids,
+            request.input_tokens,
+            request.output_tokens
+        )
+    except KeyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Model '{e.args[0]}' not found"
+        )
+    
+    return {
+        "estimates": [
+            {
+                "model_id": model_id,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_cost_usd": cost
+            }
+            for model_id, input_tokens, output_tokens, cost in zip(
+                request.model_ids,
+                request.input_tokens,
+                request.output_tokens,
+                costs.round(6).tolist()
+            )
+        ],
+        "total_cost_usd": round(float(costs.sum()), 6)
+    }
+
+
+@router.get("/models/by-capability/{capability}", response_model=CapabilityModelsResponse)
+async def get_models_by_capability_endpoint(
+    capability: str,
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
     """
     Get all models supporting a specific capability.
     
     Args:
         capability: Capability name (text_generation, vision, code_generation, etc.)
+        if_none_match: ETag from the If-None-Match header; a match returns 304
     
     Returns:
         Dict with list of models supporting the capability
@@ -373,27 +795,12 @@ async def get_models_by_capability_endpoint(capability: str) -> Dict[str, List]:
     SOLID Principle Applied:
         - SRP: Only handles HTTP layer
     """
-    try:
-        capability_enum = ModelCapability(capability)
-    except ValueError:
+    static = _CAPABILITY_MODELS_JSON.get(capability)
+    
+    if static is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid capability: {capability}. Valid options: {[c.value for c in ModelCapability]}"
+            detail=f"Invalid capability: {capability}. Valid options: {_VALID_CAPABILITIES}"
         )
     
-    models = get_models_by_capability(capability_enum)
-    
-    return {
-        "capability": capability,
-        "model_count": len(models),
-        "models": [
-            {
-                "model_id": m.model_id,
-                "provider": m.provider,
-                "display_name": m.display_name,
-                "context_window": m.context_window,
-                "cost_per_1k_input": m.cost_per_1k_input
-            }
-            for m in models
-        ]
-    }
+    return _json_response(static, if_none_match)
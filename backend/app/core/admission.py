@@ -0,0 +1,130 @@
+"""
+Admission Control Module
+Bounds the number of in-flight AI requests per provider.
+
+SOLID Principles Applied:
+    - SRP: Only handles admission of concurrent requests
+    - OCP: New providers get a controller on first use, no registration needed
+    - ISP: Minimal acquire/release/resize interface
+"""
+import asyncio
+from typing import Dict
+
+from app.core.config import get_settings
+
+
+class Admission:
+    """
+    Counter-based admission controller for one AI provider.
+    
+    Uses an explicit in-flight counter guarded by an asyncio.Condition rather
+    than an asyncio.Semaphore, so the concurrency limit can be changed at
+    runtime without mutating semaphore internals.
+    
+    Attributes:
+        in_flight (int): Number of requests currently admitted
+        max_concurrent (int): Maximum number of requests admitted at once
+        _cond (asyncio.Condition): Condition guarding the counter
+    
+    SOLID Principle Applied:
+        - SRP: Only tracks and limits in-flight requests
+    """
+    
+    def __init__(self, max_concurrent: int):
+        """
+        Initialize admission controller.
+        
+        Args:
+            max_concurrent: Maximum number of concurrently admitted requests
+        
+        Raises:
+            ValueError: If max_concurrent is less than 1
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        
+        self.in_flight = 0
+        self.max_concurrent = max_concurrent
+        self._cond = asyncio.Condition()
+    
+    async def acquire(self) -> None:
+        """
+        Wait until a slot is free and take it.
+        
+        Source/Caller:
+            - Called by: API route handlers before calling AIService
+        
+        SOLID Principle Applied:
+            - SRP: Only handles admission
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.max_concurrent)
+            self.in_flight += 1
+    
+    async def release(self) -> None:
+        """
+        Release a slot and wake one waiting request.
+        
+        Source/Caller:
+            - Called by: API route handlers once the AI request finished or failed
+        
+        SOLID Principle Applied:
+            - SRP: Only handles release
+        """
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify(1)
+    
+    async def resize(self, max_concurrent: int) -> None:
+        """
+        Change the concurrency limit at runtime.
+        
+        Raising the limit wakes all waiters so they can re-check the predicate;
+        lowering it lets in-flight requests drain before new ones are admitted.
+        
+        Args:
+            max_concurrent: New maximum number of concurrently admitted requests
+        
+        Raises:
+            ValueError: If max_concurrent is less than 1
+        
+        Source/Caller:
+            - Called by: Admin tooling or adaptive rate-limit handling
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        
+        async with self._cond:
+            self.max_concurrent = max_concurrent
+            self._cond.notify_all()
+
+
+# One controller per provider, created on first use
+_admissions: Dict[str, Admission] = {}
+
+
+def get_admission(provider: str) -> Admission:
+    """
+    Get the admission controller for a provider.
+    
+    Args:
+        provider: Name of the AI provider
+    
+    Returns:
+        Admission: Shared controller for the provider
+    
+    Source/Caller:
+        - Called by: API route handlers
+    
+    SOLID Principle Applied:
+        - SRP: Only resolves the controller for a provider
+    """
+    admission = _admissions.get(provider)
+    
+    if admission is None:
+        admission = _admissions.setdefault(
+            provider,
+            Admission(get_settings().max_concurrent_requests_per_provider)
+        )
+    
+    return admission
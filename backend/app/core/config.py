@@ -3,7 +3,7 @@ Core Configuration for DataCrunch API
 
 This module manages environment variables and application settings.
 """
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
@@ -11,6 +11,9 @@ class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
     
+    Settings are frozen once loaded; use get_settings() to obtain the shared
+    instance instead of constructing Settings directly.
+    
     Attributes:
         app_name (str): Application name
         debug (bool): Debug mode flag
@@ -27,6 +30,13 @@ class Settings(BaseSettings):
         vertex_ai_project_id (str): Google Cloud project ID for Vertex AI
         vertex_ai_location (str): Vertex AI location/region
         vertex_ai_credentials_path (str): Path to service account JSON file
+        max_concurrent_requests_per_provider (int): In-flight AI requests admitted per provider
+        batch_pack_size (int): Most batch items packed into one provider call
+        micro_batch_wait_ms (int): Window for coalescing concurrent single requests (0 = off)
+        quota_backend (str): Where provider quota blocks are shared ("memory" or "redis")
+        quota_refresh_seconds (float): Maximum age of a worker's local copy of Redis quota blocks
+        http_max_connections (int): Connection cap of the shared upstream HTTP client
+        http_max_keepalive_connections (int): Idle connections kept open for reuse
     """
     app_name: str = "DataCrunch API"
     debug: bool = True
@@ -54,9 +64,28 @@ class Settings(BaseSettings):
     vertex_ai_location: str = "us-central1"
     vertex_ai_credentials_path: str = ""
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    # Admission Control
+    max_concurrent_requests_per_provider: int = 10
+    
+    # Batch Processing (items sharing provider, model, prompt and config per call)
+    batch_pack_size: int = 20
+    # Opt-in: single /process requests wait this long for same-key partners
+    micro_batch_wait_ms: int = 0
+    
+    # Quota Tracking ("memory" = per process, "redis" = shared across workers)
+    quota_backend: str = "memory"
+    quota_refresh_seconds: float = 5.0
+    
+    # Shared Upstream HTTP Client (keep max_connections >= admission limit x providers)
+    http_max_connections: int = 200
+    http_max_keepalive_connections: int = 50
+    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        frozen=True,
+        extra="ignore"
+    )
 
 
 @lru_cache()
@@ -71,6 +100,3 @@ def get_settings() -> Settings:
         - Called by: All modules requiring configuration
     """
     return Settings()
-
-
-settings = get_settings()
@@ -7,9 +7,18 @@ SOLID Principles Applied:
     - OCP: New error types can be added without modifying existing code
     - ISP: Minimal, focused error classes
 """
+import re
+import sys
+import time
 from enum import Enum
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import TYPE_CHECKING, Optional, Dict, Any, Final, Pattern, Set, Tuple, cast
+
+if TYPE_CHECKING:
+    # datetime is only needed when a timestamp is read; imported lazily there
+    from datetime import datetime
+
+# RFC 3339 UTC layout used for serialized error timestamps
+_TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
 class ErrorType(str, Enum):
@@ -51,14 +60,28 @@ class AIServiceError(Exception):
         message (str): Human-readable error message
         details (Dict): Additional error context
         provider (str): AI provider that caused the error
-        timestamp (datetime): When the error occurred
+        timestamp (datetime): When the error occurred (UTC, derived from _ts)
         is_retryable (bool): Whether the operation can be retried
+        _ts (float): Epoch seconds captured at construction
+    
+    The creation time is stored as a raw float and only converted to a
+    datetime or string when read, keeping construction cheap during error
+    storms from a failing provider.
     
     SOLID Principle Applied:
         - SRP: Only represents error state and metadata
         - LSP: Can be used anywhere Exception is expected
     """
     
+    __slots__ = ("error_type", "message", "details", "provider", "_ts", "is_retryable")
+    
+    error_type: ErrorType
+    message: str
+    details: Dict[str, Any]
+    provider: Optional[str]
+    is_retryable: bool
+    _ts: float
+    
     def __init__(
         self,
         error_type: ErrorType,
@@ -84,11 +107,23 @@ class AIServiceError(Exception):
         self.message = message
         self.details = details or {}
         self.provider = provider
-        self.timestamp = datetime.utcnow()
+        self._ts = time.time()
         self.is_retryable = is_retryable
         
         super().__init__(self.message)
     
+    @property
+    def timestamp(self) -> "datetime":
+        """
+        When the error occurred.
+        
+        Returns:
+            datetime: Timezone-aware UTC creation time
+        """
+        from datetime import datetime, timezone
+        
+        return datetime.fromtimestamp(self._ts, tz=timezone.utc)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert error to dictionary for API responses.
@@ -104,7 +139,7 @@ class AIServiceError(Exception):
             "message": self.message,
             "details": self.details,
             "provider": self.provider,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp.strftime(_TIMESTAMP_FORMAT),
             "is_retryable": self.is_retryable
         }
 
@@ -120,6 +155,8 @@ class QuotaExceededError(AIServiceError):
         - SRP: Only represents quota exceeded state
     """
     
+    __slots__ = ()
+    
     def __init__(self, provider: str, message: str = "API quota exceeded", **kwargs):
         super().__init__(
             error_type=ErrorType.QUOTA_EXCEEDED,
@@ -141,8 +178,10 @@ class RateLimitError(AIServiceError):
         - SRP: Only represents rate limit state
     """
     
+    __slots__ = ()
+    
     def __init__(self, provider: str, retry_after: Optional[int] = None, **kwargs):
-        details = kwargs.get("details", {})
+        details = kwargs.pop("details", None) or {}
         details["retry_after_seconds"] = retry_after
         
         super().__init__(
@@ -166,6 +205,8 @@ class InvalidInputError(AIServiceError):
         - SRP: Only represents invalid input state
     """
     
+    __slots__ = ()
+    
     def __init__(self, message: str, **kwargs):
         super().__init__(
             error_type=ErrorType.INVALID_INPUT,
@@ -186,6 +227,8 @@ class APIConnectionError(AIServiceError):
         - SRP: Only represents connection error state
     """
     
+    __slots__ = ()
+    
     def __init__(self, provider: str, message: str, **kwargs):
         super().__init__(
             error_type=ErrorType.API_CONNECTION_ERROR,
@@ -196,6 +239,69 @@ class APIConnectionError(AIServiceError):
         )
 
 
+# Canonical provider names, interned so errors, logs and quota tracking share
+# one string object per provider and compare by identity on dict lookups
+_PROVIDER_NAMES: Final[Dict[str, str]] = {
+    name: sys.intern(name)
+    for name in ("gemini", "openai", "claude", "deepseek", "vertex_ai")
+}
+
+
+# Keyword groups used to classify provider errors, in priority order.
+# When an error message matches several groups, the earliest group wins.
+_ERROR_CATEGORY_KEYWORDS: Final[Tuple[Tuple[str, Tuple[str, ...]], ...]] = (
+    ("quota", ("quota", "exceeded", "limit exceeded", "insufficient_quota")),
+    ("rate_limit", ("rate limit", "too many requests", "429")),
+    ("auth", ("authentication", "unauthorized", "api key", "401", "403")),
+    ("connection", ("connection", "timeout", "unreachable", "network")),
+)
+
+# Single case-insensitive alternation with one named group per category, so
+# classification is one regex sweep instead of a keyword scan per category.
+_ERROR_CATEGORY_PATTERN: Final[Pattern[str]] = re.compile(
+    "|".join(
+        f"(?P<{category}>{'|'.join(re.escape(k) for k in keywords)})"
+        for category, keywords in _ERROR_CATEGORY_KEYWORDS
+    ),
+    re.IGNORECASE
+)
+
+_ERROR_CATEGORY_PRIORITY: Final[Tuple[str, ...]] = tuple(category for category, _ in _ERROR_CATEGORY_KEYWORDS)
+
+
+def _classify_error_message(error_str: str) -> Optional[str]:
+    """
+    Classify a provider error message into a keyword category.
+    
+    Args:
+        error_str: String representation of the provider exception
+    
+    Returns:
+        Optional[str]: Highest-priority matching category, or None if no keyword matches
+    
+    Source/Caller:
+        - Called by: handle_provider_error
+    
+    SOLID Principle Applied:
+        - SRP: Only classifies error text
+        - OCP: New categories are added to _ERROR_CATEGORY_KEYWORDS
+    """
+    matched: Set[str] = set()
+    
+    for match in _ERROR_CATEGORY_PATTERN.finditer(error_str):
+        # Every alternative sits in a named group, so lastgroup is never None
+        category = cast(str, match.lastgroup)
+        if category == _ERROR_CATEGORY_PRIORITY[0]:
+            return category
+        matched.add(category)
+    
+    for category in _ERROR_CATEGORY_PRIORITY:
+        if category in matched:
+            return category
+    
+    return None
+
+
 def handle_provider_error(e: Exception, provider: str) -> AIServiceError:
     """
     Convert provider-specific exceptions to AIServiceError.
@@ -214,45 +320,48 @@ def handle_provider_error(e: Exception, provider: str) -> AIServiceError:
         - SRP: Only handles error conversion
         - OCP: New provider errors can be added without modifying existing logic
     """
-    error_str = str(e).lower()
+    original_error = str(e)
+    category = _classify_error_message(original_error)
+    provider = _PROVIDER_NAMES.get(provider, provider)
+    details = {"original_error": original_error}
     
     # Check for quota exceeded
-    if any(keyword in error_str for keyword in ["quota", "exceeded", "limit exceeded", "insufficient_quota"]):
+    if category == "quota":
         return QuotaExceededError(
             provider=provider,
-            details={"original_error": str(e)}
+            details=details
         )
     
     # Check for rate limit
-    if any(keyword in error_str for keyword in ["rate limit", "too many requests", "429"]):
+    if category == "rate_limit":
         return RateLimitError(
             provider=provider,
-            details={"original_error": str(e)}
+            details=details
         )
     
     # Check for authentication errors
-    if any(keyword in error_str for keyword in ["authentication", "unauthorized", "api key", "401", "403"]):
+    if category == "auth":
         return AIServiceError(
             error_type=ErrorType.MISSING_API_KEY,
             message=f"Authentication failed for {provider}",
             provider=provider,
             is_retryable=False,
-            details={"original_error": str(e)}
+            details=details
         )
     
     # Check for connection errors
-    if any(keyword in error_str for keyword in ["connection", "timeout", "unreachable", "network"]):
+    if category == "connection":
         return APIConnectionError(
             provider=provider,
             message=f"Connection error with {provider}",
-            details={"original_error": str(e)}
+            details=details
         )
     
     # Generic processing error
     return AIServiceError(
         error_type=ErrorType.PROCESSING_ERROR,
-        message=f"Error processing request with {provider}: {str(e)}",
+        message=f"Error processing request with {provider}: {original_error}",
         provider=provider,
         is_retryable=True,
-        details={"original_error": str(e)}
+        details=details
     )
@@ -0,0 +1,59 @@
+"""
+HTTP Client Module
+Owns the process-wide HTTP client shared by provider SDKs.
+
+SOLID Principles Applied:
+    - SRP: Only creates and exposes the shared HTTP client
+    - DIP: Adapters receive the client instead of constructing their own
+"""
+from typing import Optional
+
+import httpx
+from fastapi import Request
+
+from app.core.config import get_settings
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP/2 client used for upstream provider calls.
+    
+    Keep-alive connections are reused across requests, so concurrent
+    generations to the same provider share TLS sessions and, over HTTP/2,
+    a single multiplexed connection.
+    
+    Returns:
+        httpx.AsyncClient: Client sized from the HTTP pool settings
+    
+    Source/Caller:
+        - Called by: Application lifespan startup (app.main)
+    
+    SOLID Principle Applied:
+        - SRP: Only builds the client
+    """
+    settings = get_settings()
+    
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections
+        )
+    )
+
+
+def get_http_client(request: Request) -> Optional[httpx.AsyncClient]:
+    """
+    FastAPI dependency returning the shared HTTP client.
+    
+    Args:
+        request: Incoming request, used to reach application state
+    
+    Returns:
+        Optional[httpx.AsyncClient]: Shared client, or None when the app was
+        started without its lifespan (adapters then use SDK defaults)
+    
+    Source/Caller:
+        - Called by: API route handlers via Depends
+    """
+    return getattr(request.app.state, "http", None)
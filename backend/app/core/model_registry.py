@@ -16,9 +16,14 @@ SOLID Principle Applied:
     - SRP: Only manages model metadata and specifications
     - OCP: New models can be added without modifying existing code
 """
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, replace
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
 
 
 class ModelCapability(str, Enum):
@@ -35,7 +40,7 @@ class ModelCapability(str, Enum):
     STREAMING = "streaming"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelSpec:
     """
     Specification for an AI model.
@@ -47,11 +52,14 @@ class ModelSpec:
         context_window (int): Maximum context length in tokens
         max_output_tokens (int): Maximum output tokens per request
         supports_system_message (bool): Whether model supports system messages
-        capabilities (List[ModelCapability]): List of model capabilities
+        capabilities (Tuple[ModelCapability, ...]): Model capabilities
         cost_per_1k_input (float): Cost per 1K input tokens in USD
         cost_per_1k_output (float): Cost per 1K output tokens in USD
-        recommended_for (List[str]): Use cases this model excels at
+        recommended_for (Tuple[str, ...]): Use cases this model excels at
         notes (str): Additional notes or limitations
+    
+    Specs are immutable and live for the whole process, so they can be shared
+    and cached freely.
     """
     model_id: str
     provider: str
@@ -59,17 +67,57 @@ class ModelSpec:
     context_window: int
     max_output_tokens: int
     supports_system_message: bool = True
-    capabilities: List[ModelCapability] = None
+    capabilities: Tuple[ModelCapability, ...] = (ModelCapability.TEXT_GENERATION,)
     cost_per_1k_input: float = 0.0
     cost_per_1k_output: float = 0.0
-    recommended_for: List[str] = None
+    recommended_for: Tuple[str, ...] = ()
     notes: str = ""
-    
-    def __post_init__(self):
-        if self.capabilities is None:
-            self.capabilities = [ModelCapability.TEXT_GENERATION]
-        if self.recommended_for is None:
-            self.recommended_for = []
+
+
+# ============================================================================
+# SHARED CAPABILITY SETS
+# ============================================================================
+# Canonical capability combinations. Specs reference these tuples instead of
+# each allocating an equal copy; provider names and other string literals are
+# already shared, since the compiler merges equal constants within a module.
+
+_CAPS_CODE_TOOLS = (
+    ModelCapability.TEXT_GENERATION,
+    ModelCapability.CODE_GENERATION,
+    ModelCapability.FUNCTION_CALLING,
+    ModelCapability.JSON_MODE,
+    ModelCapability.STREAMING
+)
+_CAPS_VISION = (
+    ModelCapability.TEXT_GENERATION,
+    ModelCapability.VISION,
+    ModelCapability.STREAMING
+)
+_CAPS_MULTIMODAL_TOOLS = (
+    ModelCapability.TEXT_GENERATION,
+    ModelCapability.CODE_GENERATION,
+    ModelCapability.VISION,
+    ModelCapability.FUNCTION_CALLING,
+    ModelCapability.JSON_MODE,
+    ModelCapability.STREAMING
+)
+_CAPS_CODE_VISION = (
+    ModelCapability.TEXT_GENERATION,
+    ModelCapability.CODE_GENERATION,
+    ModelCapability.VISION,
+    ModelCapability.STREAMING
+)
+_CAPS_CODE_FUNCTIONS = (
+    ModelCapability.TEXT_GENERATION,
+    ModelCapability.CODE_GENERATION,
+    ModelCapability.FUNCTION_CALLING,
+    ModelCapability.STREAMING
+)
+_CAPS_CODE = (
+    ModelCapability.TEXT_GENERATION,
+    ModelCapability.CODE_GENERATION,
+    ModelCapability.STREAMING
+)
 
 
 # ============================================================================
@@ -84,21 +132,15 @@ GEMINI_MODELS = {
         context_window=32_768,
         max_output_tokens=8_192,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.FUNCTION_CALLING,
-            ModelCapability.JSON_MODE,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE_TOOLS,
         cost_per_1k_input=0.00025,  # $0.25 per 1M tokens
         cost_per_1k_output=0.0005,  # $0.50 per 1M tokens
-        recommended_for=[
+        recommended_for=(
             "General data analysis",
             "Text summarization",
             "Code generation",
             "Question answering"
-        ],
+        ),
         notes="Free tier available with rate limits. Fast and efficient for most tasks."
     ),
     
@@ -109,18 +151,14 @@ GEMINI_MODELS = {
         context_window=16_384,
         max_output_tokens=8_192,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.VISION,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_VISION,
         cost_per_1k_input=0.00025,
         cost_per_1k_output=0.0005,
-        recommended_for=[
+        recommended_for=(
             "Image analysis",
             "Chart interpretation",
             "Visual data extraction"
-        ],
+        ),
         notes="Can process images and text. Limited to 16 images per request."
     ),
     
@@ -131,22 +169,15 @@ GEMINI_MODELS = {
         context_window=1_048_576,  # 1M tokens!
         max_output_tokens=8_192,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.VISION,
-            ModelCapability.FUNCTION_CALLING,
-            ModelCapability.JSON_MODE,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_MULTIMODAL_TOOLS,
         cost_per_1k_input=0.0035,  # $3.50 per 1M for <128K tokens
         cost_per_1k_output=0.0105,  # $10.50 per 1M
-        recommended_for=[
+        recommended_for=(
             "Large document analysis",
             "Long conversation context",
             "Complex reasoning tasks",
             "Multi-document synthesis"
-        ],
+        ),
         notes="Extremely large context window. Higher cost but handles massive inputs."
     ),
     
@@ -157,19 +188,14 @@ GEMINI_MODELS = {
         context_window=1_048_576,
         max_output_tokens=8_192,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.VISION,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE_VISION,
         cost_per_1k_input=0.00035,  # $0.35 per 1M
         cost_per_1k_output=0.00053,  # $0.53 per 1M
-        recommended_for=[
+        recommended_for=(
             "High-volume processing",
             "Cost-sensitive applications",
             "Fast responses needed"
-        ],
+        ),
         notes="Fastest and cheapest with 1M context. Great for production workloads."
     ),
 }
@@ -187,21 +213,15 @@ OPENAI_MODELS = {
         context_window=128_000,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.FUNCTION_CALLING,
-            ModelCapability.JSON_MODE,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE_TOOLS,
         cost_per_1k_input=0.01,  # $10 per 1M tokens
         cost_per_1k_output=0.03,  # $30 per 1M tokens
-        recommended_for=[
+        recommended_for=(
             "Complex reasoning",
             "Code generation",
             "Long document analysis",
             "Creative writing"
-        ],
+        ),
         notes="Latest GPT-4 with 128K context. Best overall reasoning capabilities."
     ),
     
@@ -212,18 +232,13 @@ OPENAI_MODELS = {
         context_window=8_192,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.FUNCTION_CALLING,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE_FUNCTIONS,
         cost_per_1k_input=0.03,  # $30 per 1M tokens
         cost_per_1k_output=0.06,  # $60 per 1M tokens
-        recommended_for=[
+        recommended_for=(
             "High-quality outputs",
             "Complex problem solving"
-        ],
+        ),
         notes="Original GPT-4. More expensive and smaller context than Turbo."
     ),
     
@@ -234,18 +249,14 @@ OPENAI_MODELS = {
         context_window=128_000,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.VISION,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_VISION,
         cost_per_1k_input=0.01,
         cost_per_1k_output=0.03,
-        recommended_for=[
+        recommended_for=(
             "Image analysis",
             "Chart interpretation",
             "Visual reasoning"
-        ],
+        ),
         notes="GPT-4 with vision capabilities. Can analyze images and charts."
     ),
     
@@ -256,20 +267,14 @@ OPENAI_MODELS = {
         context_window=16_385,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.FUNCTION_CALLING,
-            ModelCapability.JSON_MODE,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE_TOOLS,
         cost_per_1k_input=0.0005,  # $0.50 per 1M tokens
         cost_per_1k_output=0.0015,  # $1.50 per 1M tokens
-        recommended_for=[
+        recommended_for=(
             "Cost-effective processing",
             "Simple queries",
             "High-volume tasks"
-        ],
+        ),
         notes="Much cheaper than GPT-4. Good for simple tasks and high volume."
     ),
 }
@@ -287,20 +292,15 @@ CLAUDE_MODELS = {
         context_window=200_000,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.VISION,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE_VISION,
         cost_per_1k_input=0.015,  # $15 per 1M tokens
         cost_per_1k_output=0.075,  # $75 per 1M tokens
-        recommended_for=[
+        recommended_for=(
             "Complex analysis",
             "Research tasks",
             "Long document processing",
             "High-stakes outputs"
-        ],
+        ),
         notes="Most capable Claude model. Excellent for analysis and reasoning."
     ),
     
@@ -311,19 +311,14 @@ CLAUDE_MODELS = {
         context_window=200_000,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.VISION,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE_VISION,
         cost_per_1k_input=0.003,  # $3 per 1M tokens
         cost_per_1k_output=0.015,  # $15 per 1M tokens
-        recommended_for=[
+        recommended_for=(
             "Balanced performance/cost",
             "General purpose tasks",
             "Data analysis"
-        ],
+        ),
         notes="Good balance of capability and cost. Recommended for most use cases."
     ),
     
@@ -334,19 +329,14 @@ CLAUDE_MODELS = {
         context_window=200_000,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.VISION,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE_VISION,
         cost_per_1k_input=0.00025,  # $0.25 per 1M tokens
         cost_per_1k_output=0.00125,  # $1.25 per 1M tokens
-        recommended_for=[
+        recommended_for=(
             "Fast responses",
             "High-volume processing",
             "Cost-sensitive applications"
-        ],
+        ),
         notes="Fastest and cheapest Claude. Great for simple tasks at scale."
     ),
 }
@@ -364,18 +354,14 @@ DEEPSEEK_MODELS = {
         context_window=32_768,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE,
         cost_per_1k_input=0.00014,  # $0.14 per 1M tokens
         cost_per_1k_output=0.00028,  # $0.28 per 1M tokens
-        recommended_for=[
+        recommended_for=(
             "Cost-effective processing",
             "General chat",
             "Simple analysis"
-        ],
+        ),
         notes="Very affordable. Good for budget-conscious applications."
     ),
     
@@ -386,18 +372,14 @@ DEEPSEEK_MODELS = {
         context_window=32_768,
         max_output_tokens=4_096,
         supports_system_message=True,
-        capabilities=[
-            ModelCapability.TEXT_GENERATION,
-            ModelCapability.CODE_GENERATION,
-            ModelCapability.STREAMING
-        ],
+        capabilities=_CAPS_CODE,
         cost_per_1k_input=0.00014,
         cost_per_1k_output=0.00028,
-        recommended_for=[
+        recommended_for=(
             "Code generation",
             "Code review",
             "Technical documentation"
-        ],
+        ),
         notes="Specialized for coding tasks. Better code quality than chat model."
     ),
 }
@@ -408,19 +390,15 @@ DEEPSEEK_MODELS = {
 # ============================================================================
 
 VERTEX_AI_MODELS = {
-    **{f"vertex-{k}": ModelSpec(
+    f"vertex-{k}": replace(
+        v,
         model_id=f"vertex-{v.model_id}",
         provider="vertex_ai",
         display_name=f"{v.display_name} (Vertex AI)",
-        context_window=v.context_window,
-        max_output_tokens=v.max_output_tokens,
-        supports_system_message=v.supports_system_message,
-        capabilities=v.capabilities,
-        cost_per_1k_input=v.cost_per_1k_input,
-        cost_per_1k_output=v.cost_per_1k_output,
-        recommended_for=v.recommended_for + ["Enterprise deployments", "GCP integration"],
+        recommended_for=v.recommended_for + ("Enterprise deployments", "GCP integration"),
         notes=f"Vertex AI version of {v.display_name}. {v.notes}"
-    ) for k, v in GEMINI_MODELS.items()}
+    )
+    for k, v in GEMINI_MODELS.items()
 }
 
 
@@ -428,7 +406,7 @@ VERTEX_AI_MODELS = {
 # MASTER MODEL REGISTRY
 # ============================================================================
 
-MODEL_REGISTRY: Dict[str, ModelSpec] = {
+_MODEL_REGISTRY: Dict[str, ModelSpec] = {
     **GEMINI_MODELS,
     **OPENAI_MODELS,
     **CLAUDE_MODELS,
@@ -436,6 +414,92 @@ MODEL_REGISTRY: Dict[str, ModelSpec] = {
     **VERTEX_AI_MODELS,
 }
 
+# Read-only public view; the registry is fixed once the module is imported
+MODEL_REGISTRY: Mapping[str, ModelSpec] = MappingProxyType(_MODEL_REGISTRY)
+
+
+# ============================================================================
+# LOOKUP INDEXES
+# ============================================================================
+# The registry is static, so provider and capability filters are answered from
+# indexes built once here. Buckets are tuples, so callers can keep references
+# without defensive copies.
+
+def _build_indexes() -> Tuple[
+    Dict[str, Tuple[ModelSpec, ...]],
+    Dict[ModelCapability, Tuple[ModelSpec, ...]]
+]:
+    """
+    Group registry entries by provider and by capability.
+    
+    Returns:
+        Tuple of (provider -> specs, capability -> specs), in registry order
+    
+    Source/Caller:
+        - Called by: Module import
+    """
+    by_provider: Dict[str, List[ModelSpec]] = defaultdict(list)
+    by_capability: Dict[ModelCapability, List[ModelSpec]] = defaultdict(list)
+    
+    for spec in _MODEL_REGISTRY.values():
+        by_provider[spec.provider].append(spec)
+        for capability in spec.capabilities:
+            by_capability[capability].append(spec)
+    
+    return (
+        {provider: tuple(specs) for provider, specs in by_provider.items()},
+        {capability: tuple(specs) for capability, specs in by_capability.items()}
+    )
+
+
+_BY_PROVIDER, _BY_CAPABILITY = _build_indexes()
+
+
+def _build_spec_lookup() -> Dict[Tuple[Optional[str], str], ModelSpec]:
+    """
+    Key every spec by (None, model_id) and by each (prefix, remainder) split.
+    
+    The split keys answer get_model_spec's provider-prefixed fallback
+    ("gemini" + "pro" -> "gemini-pro") without formatting a new string.
+    
+    Returns:
+        Dict mapping (provider prefix or None, model ID) to its spec
+    
+    Source/Caller:
+        - Called by: Module import
+    """
+    lookup: Dict[Tuple[Optional[str], str], ModelSpec] = {}
+    
+    for model_id, spec in _MODEL_REGISTRY.items():
+        lookup[(None, model_id)] = spec
+        prefix, sep, rest = model_id.partition("-")
+        while sep:
+            lookup.setdefault((prefix, rest), spec)
+            head, sep, rest = rest.partition("-")
+            prefix = f"{prefix}-{head}"
+    
+    return lookup
+
+
+_SPEC_LOOKUP = _build_spec_lookup()
+
+
+# ============================================================================
+# NUMERIC TABLES (STRUCT OF ARRAYS)
+# ============================================================================
+# Pricing as parallel arrays indexed by registry position, so cost
+# estimation resolves a model with one dict lookup and batches of quotes are
+# computed in a single vectorized operation.
+
+_MODEL_IDX: Dict[str, int] = {model_id: i for i, model_id in enumerate(_MODEL_REGISTRY)}
+
+_COST_IN = np.asarray(
+    [spec.cost_per_1k_input for spec in _MODEL_REGISTRY.values()], dtype=np.float64
+)
+_COST_OUT = np.asarray(
+    [spec.cost_per_1k_output for spec in _MODEL_REGISTRY.values()], dtype=np.float64
+)
+
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -459,19 +523,16 @@ def get_model_spec(model_id: str, provider: str = None) -> Optional[ModelSpec]:
     SOLID Principle Applied:
         - SRP: Only retrieves model specifications
     """
-    if model_id in MODEL_REGISTRY:
-        return MODEL_REGISTRY[model_id]
+    spec = _SPEC_LOOKUP.get((None, model_id))
     
     # If provider specified, try with provider prefix
-    if provider:
-        prefixed_id = f"{provider}-{model_id}"
-        if prefixed_id in MODEL_REGISTRY:
-            return MODEL_REGISTRY[prefixed_id]
+    if spec is None and provider:
+        spec = _SPEC_LOOKUP.get((provider, model_id))
     
-    return None
+    return spec
 
 
-def get_models_by_provider(provider: str) -> List[ModelSpec]:
+def get_models_by_provider(provider: str) -> Tuple[ModelSpec, ...]:
     """
     Get all models for a specific provider.
     
@@ -479,7 +540,7 @@ def get_models_by_provider(provider: str) -> List[ModelSpec]:
         provider (str): Provider name (gemini, openai, claude, etc.)
     
     Returns:
-        List[ModelSpec]: List of model specifications for the provider
+        Tuple[ModelSpec, ...]: Model specifications for the provider (empty if unknown)
     
     Source/Caller:
         - Called by: API endpoints, UI model selectors
@@ -488,13 +549,10 @@ def get_models_by_provider(provider: str) -> List[ModelSpec]:
     SOLID Principle Applied:
         - SRP: Only filters models by provider
     """
-    return [
-        spec for spec in MODEL_REGISTRY.values()
-        if spec.provider == provider
-    ]
+    return _BY_PROVIDER.get(provider, ())
 
 
-def get_models_by_capability(capability: ModelCapability) -> List[ModelSpec]:
+def get_models_by_capability(capability: ModelCapability) -> Tuple[ModelSpec, ...]:
     """
     Get all models supporting a specific capability.
     
@@ -502,7 +560,7 @@ def get_models_by_capability(capability: ModelCapability) -> List[ModelSpec]:
         capability (ModelCapability): Required capability
     
     Returns:
-        List[ModelSpec]: List of models with the capability
+        Tuple[ModelSpec, ...]: Models with the capability (empty if none)
     
     Source/Caller:
         - Called by: Task-specific model selection
@@ -511,10 +569,7 @@ def get_models_by_capability(capability: ModelCapability) -> List[ModelSpec]:
     SOLID Principle Applied:
         - SRP: Only filters models by capability
     """
-    return [
-        spec for spec in MODEL_REGISTRY.values()
-        if capability in spec.capabilities
-    ]
+    return _BY_CAPABILITY.get(capability, ())
 
 
 def validate_token_count(model_id: str, input_tokens: int, requested_output_tokens: int) -> tuple[bool, str]:
@@ -546,20 +601,50 @@ def validate_token_count(model_id: str, input_tokens: int, requested_output_toke
     if not spec:
         return False, f"Unknown model: {model_id}"
     
-    total_tokens = input_tokens + requested_output_tokens
+    return validate_token_count_spec(spec, input_tokens, requested_output_tokens)
+
+
+def validate_token_count_spec(
+    spec: ModelSpec,
+    input_tokens: int,
+    requested_output_tokens: int
+) -> tuple[bool, str]:
+    """
+    Validate token counts against an already-resolved model specification.
     
-    if input_tokens > spec.context_window:
-        return False, (
-            f"Input tokens ({input_tokens}) exceeds model context window "
-            f"({spec.context_window}) for {spec.display_name}"
-        )
+    Lets callers that hold a ModelSpec skip the registry lookup. Error
+    messages are only formatted on the failure paths.
     
+    Args:
+        spec (ModelSpec): Model specification to check against
+        input_tokens (int): Number of input tokens
+        requested_output_tokens (int): Requested output tokens
+    
+    Returns:
+        tuple[bool, str]: (is_valid, error_message)
+    
+    Source/Caller:
+        - Called by: validate_token_count, AI adapters holding a resolved spec
+        - Input Source: Token count from prompt encoding
+    
+    SOLID Principle Applied:
+        - SRP: Only validates token limits
+    """
+    # Single-bound checks first; the total is only needed once both pass
     if requested_output_tokens > spec.max_output_tokens:
         return False, (
             f"Requested output tokens ({requested_output_tokens}) exceeds model limit "
             f"({spec.max_output_tokens}) for {spec.display_name}"
         )
     
+    if input_tokens > spec.context_window:
+        return False, (
+            f"Input tokens ({input_tokens}) exceeds model context window "
+            f"({spec.context_window}) for {spec.display_name}"
+        )
+    
+    total_tokens = input_tokens + requested_output_tokens
+    
     if total_tokens > spec.context_window:
         return False, (
             f"Total tokens ({total_tokens}) exceeds context window "
@@ -570,6 +655,58 @@ def validate_token_count(model_id: str, input_tokens: int, requested_output_toke
     return True, ""
 
 
+# Result codes of validate_token_count_batch. The numbers are stable IDs, not
+# a priority: a row failing several checks gets the first failure in
+# validate_token_count_spec's order (output, then input, then total)
+TOKENS_OK = 0
+TOKENS_INPUT_EXCEEDS_CONTEXT = 1
+TOKENS_OUTPUT_EXCEEDS_LIMIT = 2
+TOKENS_TOTAL_EXCEEDS_CONTEXT = 3
+
+
+def validate_token_count_batch(
+    spec: ModelSpec,
+    input_tokens: Sequence[int],
+    requested_output_tokens: Sequence[int]
+) -> np.ndarray:
+    """
+    Validate many candidate token splits against one model in a single pass.
+    
+    Each row gets the code of the first check it fails, mirroring
+    validate_token_count_spec. Callers that need the message for a failing
+    row can pass that row to validate_token_count_spec.
+    
+    Args:
+        spec (ModelSpec): Model specification to check against
+        input_tokens (Sequence[int]): Input token count per candidate
+        requested_output_tokens (Sequence[int]): Output token count per candidate
+    
+    Returns:
+        np.ndarray: int8 result code per candidate (TOKENS_* constants)
+    
+    Source/Caller:
+        - Called by: Batch planners sizing document chunks for a model
+        - Input Source: Candidate token splits
+    
+    SOLID Principle Applied:
+        - SRP: Only validates token limits
+    
+    Example:
+        >>> validate_token_count_batch(get_model_spec("gpt-4"), [1000, 7000, 9000], [500, 2000, 100])
+        array([0, 3, 1], dtype=int8)
+    """
+    inp = np.asarray(input_tokens, dtype=np.int64)
+    out = np.asarray(requested_output_tokens, dtype=np.int64)
+    codes = np.full(np.broadcast_shapes(inp.shape, out.shape), TOKENS_OK, dtype=np.int8)
+    
+    # Assigned lowest priority first, so earlier checks overwrite later ones
+    codes[inp + out > spec.context_window] = TOKENS_TOTAL_EXCEEDS_CONTEXT
+    codes[np.broadcast_to(inp > spec.context_window, codes.shape)] = TOKENS_INPUT_EXCEEDS_CONTEXT
+    codes[np.broadcast_to(out > spec.max_output_tokens, codes.shape)] = TOKENS_OUTPUT_EXCEEDS_LIMIT
+    
+    return codes
+
+
 def estimate_cost(model_id: str, input_tokens: int, output_tokens: int) -> float:
     """
     Estimate cost for a model request.
@@ -593,15 +730,50 @@ def estimate_cost(model_id: str, input_tokens: int, output_tokens: int) -> float
         >>> cost = estimate_cost("gpt-4-turbo-preview", 1000, 500)
         >>> print(f"Estimated cost: ${cost:.4f}")
     """
-    spec = get_model_spec(model_id)
+    idx = _MODEL_IDX.get(model_id)
     
-    if not spec:
+    if idx is None:
         return 0.0
     
-    input_cost = (input_tokens / 1000) * spec.cost_per_1k_input
-    output_cost = (output_tokens / 1000) * spec.cost_per_1k_output
+    return float((input_tokens * _COST_IN[idx] + output_tokens * _COST_OUT[idx]) / 1000)
+
+
+def estimate_cost_batch(
+    model_ids: Sequence[str],
+    input_tokens: Sequence[int],
+    output_tokens: Sequence[int]
+) -> np.ndarray:
+    """
+    Estimate costs for many model requests in one vectorized pass.
+    
+    Args:
+        model_ids (Sequence[str]): Model identifiers
+        input_tokens (Sequence[int]): Input token count per request
+        output_tokens (Sequence[int]): Output token count per request
     
-    return input_cost + output_cost
+    Returns:
+        np.ndarray: Estimated cost in USD per request (float64)
+    
+    Raises:
+        KeyError: If any model ID is not in the registry
+    
+    Source/Caller:
+        - Called by: Batch cost estimation endpoint
+        - Input Source: Parallel lists from the request body
+    
+    SOLID Principle Applied:
+        - SRP: Only calculates cost estimates
+    
+    Example:
+        >>> estimate_cost_batch(["gpt-4", "gemini-pro"], [1000, 1000], [500, 500])
+        array([0.06  , 0.0005])
+    """
+    idxs = np.fromiter((_MODEL_IDX[m] for m in model_ids), dtype=np.intp, count=len(model_ids))
+    
+    return (
+        _COST_IN[idxs] * np.asarray(input_tokens, dtype=np.float64)
+        + _COST_OUT[idxs] * np.asarray(output_tokens, dtype=np.float64)
+    ) / 1000
 
 
 def get_default_model(provider: str) -> Optional[str]:
@@ -632,10 +804,15 @@ def get_default_model(provider: str) -> Optional[str]:
     return defaults.get(provider)
 
 
+@lru_cache(maxsize=1)
 def get_model_summary() -> Dict[str, Dict]:
     """
     Get summary statistics for all models.
     
+    The registry is static, so the summary is built once from the provider
+    index and the same dict is returned afterwards. Callers must not
+    mutate it.
+    
     Returns:
         Dict[str, Dict]: Summary by provider with model counts and capabilities
     
@@ -646,29 +823,13 @@ def get_model_summary() -> Dict[str, Dict]:
     SOLID Principle Applied:
         - SRP: Only aggregates model statistics
     """
-    summary = {}
-    
-    for spec in MODEL_REGISTRY.values():
-        provider = spec.provider
-        
-        if provider not in summary:
-            summary[provider] = {
-                "model_count": 0,
-                "models": [],
-                "min_context": float('inf'),
-                "max_context": 0,
-                "avg_cost_per_1k_input": 0,
-            }
-        
-        summary[provider]["model_count"] += 1
-        summary[provider]["models"].append(spec.model_id)
-        summary[provider]["min_context"] = min(summary[provider]["min_context"], spec.context_window)
-        summary[provider]["max_context"] = max(summary[provider]["max_context"], spec.context_window)
-        summary[provider]["avg_cost_per_1k_input"] += spec.cost_per_1k_input
-    
-    # Calculate averages
-    for provider_data in summary.values():
-        if provider_data["model_count"] > 0:
-            provider_data["avg_cost_per_1k_input"] /= provider_data["model_count"]
-    
-    return summary
+    return {
+        provider: {
+            "model_count": len(specs),
+            "models": [spec.model_id for spec in specs],
+            "min_context": min(spec.context_window for spec in specs),
+            "max_context": max(spec.context_window for spec in specs),
+            "avg_cost_per_1k_input": sum(spec.cost_per_1k_input for spec in specs) / len(specs),
+        }
+        for provider, specs in _BY_PROVIDER.items()
+    }
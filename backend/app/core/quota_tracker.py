@@ -7,9 +7,15 @@ SOLID Principles Applied:
     - OCP: New tracking strategies can be added without modifying existing code
     - ISP: Minimal interface with focused methods
 """
-from typing import Dict, Set
+from typing import Dict, Optional, Tuple
 from threading import Lock
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import time
+
+import redis.asyncio as aioredis
+
+from app.core.config import get_settings
 
 
 class QuotaTracker:
@@ -19,37 +25,39 @@ class QuotaTracker:
     Prevents API calls to providers that have exceeded their quota.
     Thread-safe for async operations.
     
+    Reads are lock-free: the tracker publishes its state as an immutable
+    snapshot, and writers (block/unblock, which are rare) build a new
+    snapshot under the lock and swap the reference. The per-request check is
+    therefore a plain attribute read plus a dict lookup.
+    
     Attributes:
-        _blocked_providers (Set[str]): Providers currently blocked due to quota
-        _block_until (Dict[str, datetime]): When each provider's block expires
-        _lock (Lock): Thread lock for concurrent access
+        _block_until (Dict[str, Tuple[float, str]]): Snapshot mapping each
+            blocked provider to (time.monotonic() deadline, ISO wall-clock
+            expiry). Its keys are the blocked providers. Never mutated in
+            place.
+        _lock (Lock): Serializes writers publishing a new snapshot
     
     SOLID Principle Applied:
         - SRP: Only tracks quota status, no other responsibilities
     """
     
-    _instance = None
-    _lock = Lock()
+    _block_until: Dict[str, Tuple[float, str]]
     
-    def __new__(cls):
+    def __init__(self):
         """
-        Singleton pattern to ensure one tracker instance.
+        Initialize tracker with no blocked providers.
         
-        SOLID Principle Applied:
-            - SRP: Only handles instance creation
+        Use get_quota_tracker() for the process-wide instance.
         """
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._blocked_providers = set()
-                    cls._instance._block_until = {}
-        return cls._instance
+        self._lock = Lock()
+        self._block_until = {}
     
     def is_provider_blocked(self, provider: str) -> bool:
         """
         Check if a provider is currently blocked.
         
+        Only an expired block takes the lock, to drop it from the snapshot.
+        
         Args:
             provider: Name of the AI provider
         
@@ -62,14 +70,20 @@ class QuotaTracker:
         SOLID Principle Applied:
             - SRP: Only checks block status
         """
-        with self._lock:
-            # Check if block has expired
-            if provider in self._block_until:
-                if datetime.utcnow() >= self._block_until[provider]:
+        expiry = self._block_until.get(provider)
+        
+        if expiry is None:
+            return False
+        
+        # Check if block has expired
+        if time.monotonic() >= expiry[0]:
+            with self._lock:
+                # Leave a block re-applied since our read in place
+                if self._block_until.get(provider) == expiry:
                     self._unblock_provider(provider)
-                    return False
-            
-            return provider in self._blocked_providers
+            return False
+        
+        return True
     
     def block_provider(self, provider: str, duration_minutes: int = 60):
         """
@@ -85,22 +99,32 @@ class QuotaTracker:
         SOLID Principle Applied:
             - SRP: Only handles blocking logic
         """
+        expiry = (
+            time.monotonic() + duration_minutes * 60,
+            (datetime.now(timezone.utc) + timedelta(minutes=duration_minutes)).replace(tzinfo=None).isoformat()
+        )
+        
         with self._lock:
-            self._blocked_providers.add(provider)
-            self._block_until[provider] = datetime.utcnow() + timedelta(minutes=duration_minutes)
+            self._block_until = {**self._block_until, provider: expiry}
     
     def _unblock_provider(self, provider: str):
         """
         Internal method to unblock a provider.
         
+        Must be called with the lock held.
+        
         Args:
             provider: Name of the AI provider
         
         SOLID Principle Applied:
             - SRP: Only handles unblocking logic
         """
-        self._blocked_providers.discard(provider)
-        self._block_until.pop(provider, None)
+        if provider in self._block_until:
+            self._block_until = {
+                name: expiry
+                for name, expiry in self._block_until.items()
+                if name != provider
+            }
     
     def manually_unblock_provider(self, provider: str):
         """
@@ -131,12 +155,10 @@ class QuotaTracker:
         SOLID Principle Applied:
             - SRP: Only retrieves status information
         """
-        with self._lock:
-            return {
-                provider: expiry.isoformat()
-                for provider, expiry in self._block_until.items()
-                if provider in self._blocked_providers
-            }
+        return {
+            provider: expires_at
+            for provider, (_, expires_at) in self._block_until.items()
+        }
     
     def reset(self):
         """
@@ -149,5 +171,197 @@ class QuotaTracker:
             - SRP: Only resets state
         """
         with self._lock:
-            self._blocked_providers.clear()
-            self._block_until.clear()
+            self._block_until = {}
+
+
+class RedisQuotaTracker:
+    """
+    Tracks quota blocks in Redis so every worker process sees the same state.
+    
+    Blocks live in one sorted set scored by their expiry (epoch seconds), so
+    expired entries are trimmed and active ones listed with range queries,
+    and a manual unblock is a single ZREM visible to all workers.
+    
+    The per-request check is two-tier: a local snapshot of the set, reloaded
+    at most every `refresh_seconds`, answers "not blocked" without a Redis
+    round trip; only providers the snapshot lists as blocked are confirmed
+    against Redis. Blocks recorded by other workers therefore take up to
+    `refresh_seconds` to be seen, while unblocks are seen immediately.
+    
+    Attributes:
+        BLOCKED_KEY (str): Sorted set holding provider -> unblock timestamp
+        refresh_seconds (float): Maximum age of the local snapshot
+        _redis (aioredis.Redis): Async Redis client
+        _snapshot (Dict[str, float]): Provider -> unblock timestamp, as last read
+        _snapshot_at (float): Monotonic time the snapshot was last reloaded
+    
+    SOLID Principle Applied:
+        - SRP: Only tracks quota status, no other responsibilities
+        - LSP: Mirrors QuotaTracker's method names, awaited instead of called
+    """
+    
+    BLOCKED_KEY = "quota:blocked_providers"
+    
+    def __init__(self, redis_url: str, refresh_seconds: float = 5.0):
+        """
+        Initialize tracker with a Redis connection URL.
+        
+        Args:
+            redis_url: Redis connection URL
+            refresh_seconds: Maximum age of the local snapshot of blocks
+        """
+        self._redis = aioredis.from_url(redis_url, decode_responses=True)
+        self.refresh_seconds = refresh_seconds
+        self._snapshot: Dict[str, float] = {}
+        self._snapshot_at = float("-inf")
+    
+    async def _refresh_snapshot(self) -> None:
+        """
+        Reload the local snapshot of active blocks from Redis.
+        
+        The timestamp is taken before the read, so concurrent checks do not
+        all reload the same stale snapshot.
+        
+        Source/Caller:
+            - Called by: is_provider_blocked when the snapshot is stale
+        """
+        self._snapshot_at = time.monotonic()
+        blocked = await self._redis.zrangebyscore(self.BLOCKED_KEY, time.time(), "+inf", withscores=True)
+        self._snapshot = dict(blocked)
+    
+    async def is_provider_blocked(self, provider: str) -> bool:
+        """
+        Check if a provider is currently blocked.
+        
+        Args:
+            provider: Name of the AI provider
+        
+        Returns:
+            bool: True if provider has an unexpired block
+        
+        Source/Caller:
+            - Called by: AIService before making API calls
+        """
+        if time.monotonic() - self._snapshot_at >= self.refresh_seconds:
+            await self._refresh_snapshot()
+        
+        if provider not in self._snapshot:
+            return False
+        
+        # Probably blocked: confirm, so unblocks by other workers apply at once
+        expiry = await self._redis.zscore(self.BLOCKED_KEY, provider)
+        
+        if expiry is None or expiry <= time.time():
+            self._snapshot = {p: e for p, e in self._snapshot.items() if p != provider}
+            return False
+        
+        return True
+    
+    async def block_provider(self, provider: str, duration_minutes: int = 60):
+        """
+        Block a provider due to quota exceeded.
+        
+        An existing block is kept as-is (ZADD NX), so repeated quota errors
+        during a block do not keep extending it.
+        
+        Args:
+            provider: Name of the AI provider
+            duration_minutes: How long to block (default 60 minutes)
+        
+        Source/Caller:
+            - Called by: AIService when a provider reports quota exceeded
+        """
+        expiry = time.time() + duration_minutes * 60
+        
+        await self._redis.zadd(self.BLOCKED_KEY, {provider: expiry}, nx=True)
+        
+        # Visible to this worker's checks at once; the exact expiry is reread
+        # on the next refresh if another worker's block was kept instead
+        self._snapshot = {**self._snapshot, provider: self._snapshot.get(provider, expiry)}
+    
+    async def manually_unblock_provider(self, provider: str):
+        """
+        Manually unblock a provider (e.g., admin action).
+        
+        Args:
+            provider: Name of the AI provider
+        
+        Source/Caller:
+            - Called by: Admin endpoints or manual intervention
+        """
+        await self._redis.zrem(self.BLOCKED_KEY, provider)
+        self._snapshot = {p: e for p, e in self._snapshot.items() if p != provider}
+    
+    async def get_blocked_providers(self) -> Dict[str, str]:
+        """
+        Get currently blocked providers with expiry times.
+        
+        Trims expired blocks and reads the active ones in one pipelined
+        round trip.
+        
+        Returns:
+            Dict mapping provider names to expiry timestamps (UTC, ISO format)
+        
+        Source/Caller:
+            - Called by: Status endpoints
+        """
+        now = time.time()
+        
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(self.BLOCKED_KEY, "-inf", now)
+            pipe.zrangebyscore(self.BLOCKED_KEY, now, "+inf", withscores=True)
+            _, blocked = await pipe.execute()
+        
+        return {
+            provider: datetime.fromtimestamp(expiry, tz=timezone.utc).replace(tzinfo=None).isoformat()
+            for provider, expiry in blocked
+        }
+    
+    async def reset(self):
+        """
+        Reset all quota tracking (for testing or admin reset).
+        
+        Source/Caller:
+            - Called by: Test teardown or admin endpoints
+        """
+        await self._redis.delete(self.BLOCKED_KEY)
+        self._snapshot = {}
+
+
+@lru_cache()
+def get_quota_tracker() -> QuotaTracker:
+    """
+    Get the process-wide in-memory tracker.
+    
+    Returns:
+        QuotaTracker: Shared tracker instance
+    
+    Source/Caller:
+        - Called by: AIService and adapters before/after provider calls
+    
+    SOLID Principle Applied:
+        - SRP: Only resolves the shared instance
+    """
+    return QuotaTracker()
+
+
+@lru_cache()
+def get_redis_quota_tracker() -> Optional[RedisQuotaTracker]:
+    """
+    Get the shared Redis-backed tracker, if enabled.
+    
+    Returns:
+        Optional[RedisQuotaTracker]: Tracker when QUOTA_BACKEND is "redis", else None
+    
+    Source/Caller:
+        - Called by: AIService quota checks and status/unblock helpers
+    
+    SOLID Principle Applied:
+        - OCP: Backend chosen by configuration, callers unchanged
+    """
+    settings = get_settings()
+    
+    if settings.quota_backend != "redis":
+        return None
+    
+    return RedisQuotaTracker(settings.redis_url, settings.quota_refresh_seconds)
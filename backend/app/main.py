@@ -4,60 +4,99 @@ DataCrunch API - Main Application Entry Point
 This module initializes the FastAPI application with CORS middleware,
 routers, and lifecycle events.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+from app.core.http_client import create_http_client
+from app.services.ai_service import AIService
 
-# Configuration
-from app.core.config import settings
 # Routes
 from app.api.routes import ai_routes
 
+
+# Constant bodies for the probe endpoints, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "DataCrunch API",
+    "version": "0.1.0",
+    "status": "operational"
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifecycle: own the shared upstream HTTP client.
+    
+    One pooled HTTP/2 client per worker is created at startup and closed at
+    shutdown, so provider calls reuse connections instead of opening a new
+    TLS session per request. Cached adapters bound to it are dropped first.
+    
+    Args:
+        app: The FastAPI application
+    
+    Source/Caller:
+        - Called by: FastAPI on startup/shutdown
+    """
+    app.state.http = create_http_client()
+    try:
+        yield
+    finally:
+        AIService.discard_adapters(app.state.http)
+        await app.state.http.aclose()
+
+
 app = FastAPI(
     title="DataCrunch API",
     description="High-performance data processing API with Excel-like UX",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Configuration
+# Explicit lists let Starlette build the preflight response headers once,
+# instead of reflecting the requested headers on every OPTIONS call.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],  # Vite default port
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["content-type", "authorization", "x-requested-with", "if-none-match"],
+    max_age=600,  # Let browsers reuse preflight results for 10 minutes
 )
 
 
 @app.get("/")
-async def root():
+async def root() -> Response:
     """
     Root endpoint for health check.
     
     Returns:
-        dict: API status and version information.
+        Response: API status and version information (prebuilt JSON).
     
     Source/Caller:
         - Called by: Health check monitors, initial connection tests
     """
-    return {
-        "message": "DataCrunch API",
-        "version": "0.1.0",
-        "status": "operational"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring.
     
     Returns:
-        dict: Service health status.
+        Response: Service health status (prebuilt JSON).
     
     Source/Caller:
         - Called by: Load balancers, monitoring systems
     """
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Register AI routes
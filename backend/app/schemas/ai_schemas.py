@@ -8,7 +8,7 @@ SOLID Principles Applied:
     - ISP: Minimal, focused schemas - no bloated interfaces
     - DIP: Schemas are abstractions that other layers depend on
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import Dict, Any, Optional, List
 from enum import Enum
 
@@ -45,10 +45,15 @@ class AIModelConfig(BaseModel):
         frequency_penalty: Reduce repetition (OpenAI/DeepSeek)
         presence_penalty: Encourage new topics (OpenAI/DeepSeek)
     
+    Immutable once validated; unknown parameters are rejected instead of
+    being silently dropped.
+    
     SOLID Principle Applied:
         - SRP: Only defines model configuration parameters
         - ISP: Only includes relevant configuration fields
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: Optional[int] = Field(default=1000, ge=1)
     top_p: Optional[float] = Field(default=1.0, ge=0.0, le=1.0)
@@ -56,6 +61,11 @@ class AIModelConfig(BaseModel):
     presence_penalty: Optional[float] = Field(default=0.0, ge=-2.0, le=2.0)
 
 
+# Default for requests without ai_config; AIModelConfig is frozen, so one
+# instance is shared instead of building a new one per request
+DEFAULT_AI_CONFIG = AIModelConfig()
+
+
 class AIRequest(BaseModel):
     """
     AI service request payload.
@@ -66,6 +76,7 @@ class AIRequest(BaseModel):
         input_data: JSON-formatted input data
         ai_config: Optional model configuration overrides (renamed from model_config to avoid Pydantic conflict)
         model_name: Optional specific model name override
+        stream: Stream the response as Server-Sent Events instead of one JSON body
     
     SOLID Principle Applied:
         - SRP: Only defines request structure, no processing logic
@@ -73,9 +84,27 @@ class AIRequest(BaseModel):
     """
     provider: AIProviderType
     instruction_prompt: str = Field(..., min_length=1)
-    input_data: Dict[str, Any]
-    ai_config: Optional[AIModelConfig] = Field(default_factory=AIModelConfig)
+    # Only the top level is checked; nested values are forwarded untouched
+    input_data: Any = Field(..., json_schema_extra={"type": "object"})
+    ai_config: Optional[AIModelConfig] = DEFAULT_AI_CONFIG
     model_name: Optional[str] = None
+    stream: bool = False
+    
+    @field_validator("input_data")
+    @classmethod
+    def check_input_data_is_object(cls, value: Any) -> Dict[str, Any]:
+        """
+        Ensure input_data is a JSON object.
+        
+        Declared as Any so pydantic does not rebuild the mapping entry by
+        entry; adapters serialize it again anyway.
+        
+        Raises:
+            ValueError: If input_data is not an object
+        """
+        if not isinstance(value, dict):
+            raise ValueError("input_data must be a JSON object")
+        return value
 
 
 class AIResponse(BaseModel):
@@ -89,10 +118,16 @@ class AIResponse(BaseModel):
         model: Model name that was used
         raw_response: Optional raw API response for debugging
     
+    Adapters build this with model_construct(): every field comes from an
+    already-typed SDK response, and the route re-checks it against
+    response_model on the way out.
+    
     SOLID Principle Applied:
         - SRP: Only defines response structure
         - LSP: All adapters return this same format for substitutability
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     provider: AIProviderType
     content: str
     usage: Dict[str, int]
@@ -114,7 +149,97 @@ class AIError(BaseModel):
         - SRP: Only defines error structure
         - ISP: Minimal error information needed
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     provider: AIProviderType
     error_type: str
     message: str
     details: Optional[Dict[str, Any]] = None
+
+
+class AIBatchRequest(BaseModel):
+    """
+    Batch of AI requests processed in one HTTP call.
+    
+    Attributes:
+        requests: AI requests to process; streaming is not supported here
+    
+    SOLID Principle Applied:
+        - SRP: Only defines batch request structure
+    """
+    requests: List[AIRequest] = Field(..., min_length=1, max_length=100)
+    
+    @model_validator(mode="after")
+    def check_not_streamed(self) -> "AIBatchRequest":
+        """
+        Reject streamed requests, which cannot share one JSON response.
+        
+        Raises:
+            ValueError: If any request sets stream
+        """
+        if any(request.stream for request in self.requests):
+            raise ValueError("stream is not supported in batch requests")
+        return self
+
+
+class AIBatchItem(BaseModel):
+    """
+    Outcome of one request of a batch.
+    
+    Attributes:
+        status_code: HTTP status the request would have had on its own
+        response: AI response, if the request succeeded
+        error: Error details, if the request failed
+    
+    SOLID Principle Applied:
+        - SRP: Only defines per-item batch result structure
+    """
+    status_code: int
+    response: Optional[AIResponse] = None
+    error: Optional[Dict[str, Any]] = None
+
+
+class AIBatchResponse(BaseModel):
+    """
+    Batch processing result.
+    
+    Attributes:
+        results: Per-request outcomes, in request order
+        usage: Token usage summed over all successful requests
+    
+    SOLID Principle Applied:
+        - SRP: Only defines batch response structure
+    """
+    results: List[AIBatchItem]
+    usage: Dict[str, int]
+
+
+class CostEstimateBatchRequest(BaseModel):
+    """
+    Batch cost estimation payload.
+    
+    The three lists are parallel: entry i of each describes one quote.
+    
+    Attributes:
+        model_ids: Model identifiers to quote
+        input_tokens: Input token count per quote
+        output_tokens: Output token count per quote
+    
+    SOLID Principle Applied:
+        - SRP: Only defines batch quote structure
+    """
+    model_ids: List[str] = Field(..., min_length=1)
+    input_tokens: List[int]
+    output_tokens: List[int]
+    
+    @model_validator(mode="after")
+    def check_lengths(self) -> "CostEstimateBatchRequest":
+        """
+        Ensure the parallel lists have matching lengths.
+        
+        Raises:
+            ValueError: If list lengths differ
+        """
+        if not len(self.model_ids) == len(self.input_tokens) == len(self.output_tokens):
+            raise ValueError("model_ids, input_tokens and output_tokens must have the same length")
+        return self
@@ -0,0 +1,253 @@
+"""
+Registry and Status Schemas
+Defines response models for the model registry, cost and provider status endpoints.
+
+SOLID Principles Applied:
+    - SRP: Each schema describes exactly one endpoint payload
+    - ISP: Minimal, focused schemas - only the fields each endpoint returns
+    - DIP: Routes declare these abstractions instead of untyped dicts
+"""
+from pydantic import BaseModel
+from typing import Dict, List
+
+
+class ProvidersResponse(BaseModel):
+    """
+    Supported providers payload.
+    
+    Attributes:
+        providers: Names of all supported AI providers
+    """
+    providers: List[str]
+
+
+class PromptTemplatesResponse(BaseModel):
+    """
+    Prompt templates payload.
+    
+    Attributes:
+        templates: Template name -> description
+    """
+    templates: Dict[str, str]
+
+
+class ProviderStatusResponse(BaseModel):
+    """
+    Provider availability payload.
+    
+    Attributes:
+        providers: All supported providers
+        blocked_providers: Blocked provider -> block expiry (ISO timestamp)
+        available_providers: Providers that currently accept requests
+    """
+    providers: List[str]
+    blocked_providers: Dict[str, str]
+    available_providers: List[str]
+
+
+class ProviderSummary(BaseModel):
+    """
+    Per-provider entry of the model summary.
+    
+    Attributes:
+        model_count: Number of registered models
+        models: Registered model IDs
+        min_context: Smallest context window among the models
+        max_context: Largest context window among the models
+        avg_cost_per_1k_input: Mean input price per 1K tokens (USD)
+    """
+    model_count: int
+    models: List[str]
+    min_context: int
+    max_context: int
+    avg_cost_per_1k_input: float
+
+
+class ProviderModelEntry(BaseModel):
+    """
+    Model entry in a provider's model list.
+    
+    Attributes:
+        model_id: Model identifier
+        display_name: Human-readable model name
+        context_window: Maximum total tokens
+        max_output_tokens: Maximum generated tokens
+        capabilities: Capability names
+        cost_per_1k_input: Input price per 1K tokens (USD)
+        cost_per_1k_output: Output price per 1K tokens (USD)
+        recommended_for: Suggested use cases
+        notes: Free-form remarks
+    """
+    model_id: str
+    display_name: str
+    context_window: int
+    max_output_tokens: int
+    capabilities: List[str]
+    cost_per_1k_input: float
+    cost_per_1k_output: float
+    recommended_for: List[str]
+    notes: str = ""
+
+
+class ProviderModelsResponse(BaseModel):
+    """
+    Models offered by one provider.
+    
+    Attributes:
+        provider: Provider name
+        models: Model entries
+    """
+    provider: str
+    models: List[ProviderModelEntry]
+
+
+class ModelSpecResponse(ProviderModelEntry):
+    """
+    Complete specification of a single model.
+    
+    Attributes:
+        provider: Provider name
+        supports_system_message: Whether a system prompt is accepted
+    """
+    provider: str
+    supports_system_message: bool
+
+
+class CapabilityModelEntry(BaseModel):
+    """
+    Condensed model entry used by the capability filter.
+    
+    Attributes:
+        model_id: Model identifier
+        provider: Provider name
+        display_name: Human-readable model name
+        context_window: Maximum total tokens
+        cost_per_1k_input: Input price per 1K tokens (USD)
+    """
+    model_id: str
+    provider: str
+    display_name: str
+    context_window: int
+    cost_per_1k_input: float
+
+
+class CapabilityModelsResponse(BaseModel):
+    """
+    Models supporting one capability.
+    
+    Attributes:
+        capability: Capability name
+        model_count: Number of matching models
+        models: Matching model entries
+    """
+    capability: str
+    model_count: int
+    models: List[CapabilityModelEntry]
+
+
+class TokenValidationResponse(BaseModel):
+    """
+    Token limit validation result.
+    
+    Attributes:
+        is_valid: Whether the counts fit the model's limits
+        message: Reason for rejection, or a confirmation
+        model_id: Model identifier
+        input_tokens: Input token count
+        requested_output_tokens: Requested output token count
+        total_tokens: Sum of input and output tokens
+    """
+    is_valid: bool
+    message: str
+    model_id: str
+    input_tokens: int
+    requested_output_tokens: int
+    total_tokens: int
+
+
+class CostBreakdown(BaseModel):
+    """
+    Estimated cost split by direction (USD).
+    
+    Attributes:
+        input_cost_usd: Cost of input tokens
+        output_cost_usd: Cost of output tokens
+        total_cost_usd: Combined cost
+    """
+    input_cost_usd: float
+    output_cost_usd: float
+    total_cost_usd: float
+
+
+class CostRates(BaseModel):
+    """
+    Per-1K-token prices applied to an estimate (USD).
+    
+    Attributes:
+        input: Input price per 1K tokens
+        output: Output price per 1K tokens
+    """
+    input: float
+    output: float
+
+
+class CostEstimateResponse(BaseModel):
+    """
+    Cost estimate for one model request.
+    
+    Attributes:
+        model_id: Model identifier
+        model_name: Human-readable model name
+        input_tokens: Input token count
+        output_tokens: Output token count
+        total_tokens: Sum of input and output tokens
+        cost_breakdown: Estimated cost split
+        rate_per_1k: Prices used for the estimate
+    """
+    model_id: str
+    model_name: str
+    input_tokens: int
+    output_tokens: int
+    total_tokens: int
+    cost_breakdown: CostBreakdown
+    rate_per_1k: CostRates
+
+
+class CostEstimateBatchItem(BaseModel):
+    """
+    One quote of a batch cost estimate.
+    
+    Attributes:
+        model_id: Model identifier
+        input_tokens: Input token count
+        output_tokens: Output token count
+        total_cost_usd: Estimated cost
+    """
+    model_id: str
+    input_tokens: int
+    output_tokens: int
+    total_cost_usd: float
+
+
+class CostEstimateBatchResponse(BaseModel):
+    """
+    Batch cost estimate.
+    
+    Attributes:
+        estimates: Per-request quotes, in request order
+        total_cost_usd: Sum of all quotes
+    """
+    estimates: List[CostEstimateBatchItem]
+    total_cost_usd: float
+
+
+class UnblockResponse(BaseModel):
+    """
+    Manual unblock confirmation.
+    
+    Attributes:
+        message: Confirmation message
+        provider: Provider that was unblocked
+    """
+    message: str
+    provider: str
@@ -1,13 +1,24 @@
 """
 AI Adapters Module
 Exports all AI provider adapters.
+
+Provider adapters are imported on first access (PEP 562), so a process only
+loads the SDKs (anthropic, openai, google-generativeai, vertexai) of the
+providers it actually serves.
 """
+from importlib import import_module
+from typing import Any, Dict
+
 from app.services.ai_adapters.base_adapter import BaseAIAdapter
-from app.services.ai_adapters.gemini_adapter import GeminiAdapter
-from app.services.ai_adapters.openai_adapter import OpenAIAdapter
-from app.services.ai_adapters.claude_adapter import ClaudeAdapter
-from app.services.ai_adapters.deepseek_adapter import DeepSeekAdapter
-from app.services.ai_adapters.vertex_ai_adapter import VertexAIAdapter
+
+# Exported adapter class -> defining module
+_LAZY_ADAPTERS: Dict[str, str] = {
+    "GeminiAdapter": "app.services.ai_adapters.gemini_adapter",
+    "OpenAIAdapter": "app.services.ai_adapters.openai_adapter",
+    "ClaudeAdapter": "app.services.ai_adapters.claude_adapter",
+    "DeepSeekAdapter": "app.services.ai_adapters.deepseek_adapter",
+    "VertexAIAdapter": "app.services.ai_adapters.vertex_ai_adapter",
+}
 
 __all__ = [
     "BaseAIAdapter",
@@ -17,3 +28,26 @@ __all__ = [
     "DeepSeekAdapter",
     "VertexAIAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import an adapter module the first time its class is requested.
+    
+    Args:
+        name: Attribute requested from this package
+    
+    Returns:
+        The adapter class
+    
+    Raises:
+        AttributeError: If name is not an exported adapter
+    """
+    module_name = _LAZY_ADAPTERS.get(name)
+    
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    adapter_class = getattr(import_module(module_name), name)
+    globals()[name] = adapter_class
+    return adapter_class
@@ -9,12 +9,97 @@ SOLID Principles Applied:
     - ISP: Minimal interface with only required methods
     - DIP: Depends on abstractions (AIModelConfig, AIResponse)
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+import asyncio
 import json
+import re
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Dict, Any, List, cast
+import orjson
 
 from app.schemas.ai_schemas import AIModelConfig, AIResponse
-from app.core.errors import InvalidInputError
+from app.core.errors import AIServiceError, ErrorType
+from app.core.model_registry import get_model_spec
+
+
+# Appended to the instruction when several inputs are packed into one call
+_BATCH_INSTRUCTION = (
+    "\n\nThe input data holds an \"items\" array; each item has an \"id\" and "
+    "an \"input\". Apply the instructions above to every item independently. "
+    "Respond with only a JSON array containing one object per item, of the "
+    "form {\"id\": <item id>, \"output\": <result for that item>}."
+)
+
+# Decodes one JSON value at a given offset, ignoring whatever follows it
+_JSON_DECODER = json.JSONDecoder()
+
+# Whitespace and commas between the elements of a packed answer array
+_ITEM_SEPARATOR = re.compile(r"[\s,]*")
+
+
+def _skip_separators(content: str, pos: int) -> int:
+    """
+    Offset of the first character at or after pos that is not a separator.
+    
+    Source/Caller:
+        - Called by: BaseAIAdapter._split_batch_output
+    """
+    # The pattern matches the empty string, so match() never returns None
+    return cast(re.Match, _ITEM_SEPARATOR.match(content, pos)).end()
+
+
+def _packed_model_config(
+    model_config: AIModelConfig,
+    model_id: str | None,
+    item_count: int
+) -> AIModelConfig:
+    """
+    Scale the output token budget of a packed call to its number of items.
+    
+    Each item gets the budget a single call would have, capped by the
+    model's output limit. Unknown models (and configs without max_tokens)
+    keep the caller's config, since their limit cannot be checked.
+    
+    Args:
+        model_config: Configuration of one item's call
+        model_id: Model the packed call is sent to
+        item_count: Number of items packed into the call
+    
+    Returns:
+        AIModelConfig: Configuration for the packed call
+    
+    Source/Caller:
+        - Called by: BaseAIAdapter.call_ai_batch
+    """
+    spec = get_model_spec(model_id) if model_id else None
+    
+    if spec is None or model_config.max_tokens is None:
+        return model_config
+    
+    max_tokens = min(model_config.max_tokens * item_count, spec.max_output_tokens)
+    if max_tokens <= model_config.max_tokens:
+        return model_config
+    
+    return model_config.model_copy(update={"max_tokens": max_tokens})
+
+
+class AIAdapterError(AIServiceError):
+    """
+    Raised when a provider adapter fails to initialize or call its API.
+    
+    SOLID Principle Applied:
+        - LSP: Fully substitutable for AIServiceError
+        - SRP: Only represents adapter failure state
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, message: str, **kwargs):
+        super().__init__(
+            error_type=ErrorType.PROCESSING_ERROR,
+            message=message,
+            is_retryable=False,
+            **kwargs
+        )
 
 
 class BaseAIAdapter(ABC):
@@ -32,6 +117,9 @@ class BaseAIAdapter(ABC):
         - DIP: Depends on abstractions (schemas), not concrete implementations
     """
     
+    # Model used when a request names none; set by each provider adapter
+    DEFAULT_MODEL: str | None = None
+    
     @abstractmethod
     async def call_ai(
         self,
@@ -64,55 +152,233 @@ class BaseAIAdapter(ABC):
         """
         pass
     
-    def _format_input_message(self, instruction_prompt: str, input_data: Dict[str, Any]) -> str:
+    async def stream_ai(
+        self,
+        instruction_prompt: str,
+        input_data: Dict[str, Any],
+        model_config: AIModelConfig,
+        model_name: str | None = None
+    ) -> AsyncIterator[str]:
         """
-        Format instruction and input data into a single message.
+        Stream the AI provider's output as text deltas.
+        
+        Default implementation for adapters without native streaming: waits
+        for the full completion via call_ai and yields it as a single delta.
+        Adapters whose SDK supports streaming override this to yield tokens
+        as they arrive.
         
         Args:
-            instruction_prompt (str): The instruction prompt
-            input_data (Dict[str, Any]): The input data
+            instruction_prompt (str): System/instruction prompt
+            input_data (Dict[str, Any]): JSON-formatted input data
+            model_config (AIModelConfig): Model configuration parameters
+            model_name (str | None): Optional specific model name
         
-        Returns:
-            str: Formatted message combining instruction and data
+        Yields:
+            str: Generated text, in order
+        
+        Raises:
+            AIServiceError: If API call fails
         
         Source/Caller:
-            - Called by: Individual adapter implementations
+            - Called by: AIService.stream_ai_request
         
         SOLID Principle Applied:
-            - SRP: Only handles message formatting, nothing else
-            - DIP: Works with generic Dict, not specific data structures
+            - OCP: Adapters opt into native streaming by overriding
+            - LSP: Every adapter can be streamed, natively or not
         """
-        formatted_data = json.dumps(input_data, indent=2)
-        return f"{instruction_prompt}\n\nInput Data:\n{formatted_data}"
+        response = await self.call_ai(
+            instruction_prompt=instruction_prompt,
+            input_data=input_data,
+            model_config=model_config,
+            model_name=model_name,
+        )
+        yield response.content
     
-    def _validate_config(self, model_config: AIModelConfig) -> None:
+    async def call_ai_batch(
+        self,
+        instruction_prompt: str,
+        input_data_list: List[Dict[str, Any]],
+        model_config: AIModelConfig,
+        model_name: str | None = None
+    ) -> List[AIResponse | Exception]:
         """
-        Validate model configuration parameters.
+        Apply one instruction to several inputs with a single provider call.
+        
+        The inputs are packed into one request as an id-tagged "items" array
+        and the model is asked to answer with a JSON array keyed by the same
+        ids. Items missing from (or unparseable in) the answer are retried
+        with individual call_ai requests, so a confused batch answer degrades
+        to per-item calls instead of failing. A failed retry is returned in
+        place of that item's response, so it does not fail the other items.
+        
+        The packed call's max_tokens is the per-item budget times the number
+        of items, capped by the model's output limit, so a long answer is not
+        cut off. Items answered before a cut-off are still used.
+        
+        The packed call's usage is reported on the first item answered by it;
+        the other packed items report empty usage, so summing usage over the
+        batch gives the real token count.
         
         Args:
-            model_config (AIModelConfig): Configuration to validate
+            instruction_prompt (str): System/instruction prompt shared by all items
+            input_data_list (List[Dict[str, Any]]): Input data per item
+            model_config (AIModelConfig): Model configuration parameters
+            model_name (str | None): Optional specific model name
+        
+        Returns:
+            List[AIResponse | Exception]: One result per input, in input order;
+            a response whose content is the item's output (JSON text when the
+            output is not a string), or the exception its retry raised
         
         Raises:
-            InvalidInputError: If configuration is invalid
+            AIServiceError: If the packed call fails
+            asyncio.CancelledError: If a retry is cancelled
         
         Source/Caller:
-            - Called by: Adapter implementations before API calls
+            - Called by: AIService.process_ai_batch
         
         SOLID Principle Applied:
-            - SRP: Only validates configuration, no other responsibilities
-            - LSP: All adapters can use this for consistent validation
+            - OCP: Adapters with a native batch API can override this
+            - LSP: Returns AIResponse objects like call_ai
         """
-        if model_config.temperature < 0 or model_config.temperature > 2:
-            raise InvalidInputError(
-                f"Invalid temperature: {model_config.temperature}. Must be between 0.0 and 2.0"
-            )
+        response = await self.call_ai(
+            instruction_prompt=instruction_prompt + _BATCH_INSTRUCTION,
+            input_data={
+                "items": [
+                    {"id": item_id, "input": input_data}
+                    for item_id, input_data in enumerate(input_data_list)
+                ]
+            },
+            model_config=_packed_model_config(
+                model_config, model_name or self.DEFAULT_MODEL, len(input_data_list)
+            ),
+            model_name=model_name,
+        )
+        outputs = self._split_batch_output(response.content)
+        
+        results: List[AIResponse | None] = [None] * len(input_data_list)
+        usage = response.usage
         
-        if model_config.max_tokens and model_config.max_tokens < 1:
-            raise InvalidInputError(
-                f"Invalid max_tokens: {model_config.max_tokens}. Must be at least 1"
+        for item_id in range(len(input_data_list)):
+            if item_id not in outputs:
+                continue
+            
+            output = outputs[item_id]
+            results[item_id] = AIResponse.model_construct(
+                provider=response.provider,
+                content=output if isinstance(output, str) else orjson.dumps(output).decode(),
+                usage=usage,
+                model=response.model
             )
+            usage = {}
         
-        if model_config.top_p and (model_config.top_p < 0 or model_config.top_p > 1):
-            raise InvalidInputError(
-                f"Invalid top_p: {model_config.top_p}. Must be between 0.0 and 1.0"
+        missing = [item_id for item_id, result in enumerate(results) if result is None]
+        retried = await asyncio.gather(*(
+            self.call_ai(
+                instruction_prompt=instruction_prompt,
+                input_data=input_data_list[item_id],
+                model_config=model_config,
+                model_name=model_name,
             )
+            for item_id in missing
+        ), return_exceptions=True)
+        
+        retried_by_id: Dict[int, AIResponse | Exception] = {}
+        for item_id, result in zip(missing, retried):
+            if not isinstance(result, (AIResponse, Exception)):
+                # Cancellation and interpreter exits are not per-item failures
+                raise result
+            retried_by_id[item_id] = result
+        
+        return [
+            result if result is not None else retried_by_id[item_id]
+            for item_id, result in enumerate(results)
+        ]
+    
+    @staticmethod
+    def _split_batch_output(content: str) -> Dict[int, Any]:
+        """
+        Parse a packed batch answer into outputs by item id.
+        
+        The answer array is the first "[" whose elements decode as
+        {"id", "output"} objects, so prose (even prose with brackets) or
+        Markdown code fences around it are skipped. Elements are decoded one
+        by one, so an answer cut off mid-array still yields the items before
+        the cut.
+        
+        Args:
+            content (str): Model answer to a packed batch request
+        
+        Returns:
+            Dict[int, Any]: Item id -> output; empty if no such array is found
+        
+        Source/Caller:
+            - Called by: call_ai_batch
+        """
+        start = content.find("[")
+        
+        while start != -1:
+            outputs: Dict[int, Any] = {}
+            pos = _skip_separators(content, start + 1)
+            
+            while pos < len(content) and content[pos] != "]":
+                try:
+                    item, pos = _JSON_DECODER.raw_decode(content, pos)
+                except ValueError:
+                    break
+                
+                if not (isinstance(item, dict) and isinstance(item.get("id"), int) and "output" in item):
+                    break
+                
+                outputs[item["id"]] = item["output"]
+                pos = _skip_separators(content, pos)
+            
+            if outputs:
+                return outputs
+            
+            start = content.find("[", start + 1)
+        
+        return {}
+    
+    def _format_input_data(self, input_data: Dict[str, Any]) -> str:
+        """
+        Serialize input data as indented JSON for the user message.
+        
+        Args:
+            input_data (Dict[str, Any]): The input data
+        
+        Returns:
+            str: JSON text of the input data
+        
+        Source/Caller:
+            - Called by: _format_input_message, adapters that send the
+              instruction as a separate system message
+        
+        SOLID Principle Applied:
+            - SRP: Only handles data serialization
+        """
+        return orjson.dumps(
+            input_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    
+    def _format_input_message(self, instruction_prompt: str, input_data: Dict[str, Any]) -> str:
+        """
+        Format instruction and input data into a single message.
+        
+        Args:
+            instruction_prompt (str): The instruction prompt
+            input_data (Dict[str, Any]): The input data
+        
+        Returns:
+            str: Formatted message combining instruction and data
+        
+        Source/Caller:
+            - Called by: Individual adapter implementations
+        
+        SOLID Principle Applied:
+            - SRP: Only handles message formatting, nothing else
+            - DIP: Works with generic Dict, not specific data structures
+        """
+        formatted_data = self._format_input_data(input_data)
+        return f"{instruction_prompt}\n\nInput Data:\n{formatted_data}"
@@ -6,17 +6,22 @@ SOLID Principles Applied:
     - SRP: Only handles Claude API communication
     - OCP: Extends BaseAIAdapter without modifying it
     - LSP: Fully substitutable for BaseAIAdapter
-    - ISP: Implements only required call_ai method
+    - ISP: Implements call_ai plus a native stream_ai
     - DIP: Depends on BaseAIAdapter abstraction
 """
 from anthropic import AsyncAnthropic
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional
 
-from app.core.config import settings
+import httpx
+
+from app.core.config import get_settings
 from app.schemas.ai_schemas import AIModelConfig, AIResponse, AIProviderType
 from app.services.ai_adapters.base_adapter import BaseAIAdapter, AIAdapterError
 
 
+_PROVIDER = AIProviderType.CLAUDE
+
+
 class ClaudeAdapter(BaseAIAdapter):
     """
     Adapter for Anthropic Claude models.
@@ -31,19 +36,57 @@ class ClaudeAdapter(BaseAIAdapter):
     
     DEFAULT_MODEL = "claude-3-opus-20240229"
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize Claude adapter with API key.
         
+        Args:
+            http_client: Shared pooled HTTP client; the SDK creates its own if None
+        
         Raises:
             AIAdapterError: If API key is not configured
         
         SOLID Principle Applied:
             - SRP: Only handles initialization and client setup
         """
+        settings = get_settings()
+        
         if not settings.anthropic_api_key:
             raise AIAdapterError("Anthropic API key not configured")
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key, http_client=http_client)
+    
+    def _message_params(
+        self,
+        instruction_prompt: str,
+        input_data: Dict[str, Any],
+        model_config: AIModelConfig,
+        model_name: str | None
+    ) -> Dict[str, Any]:
+        """
+        Build the Messages API arguments shared by call_ai and stream_ai.
+        
+        Args:
+            instruction_prompt (str): System/instruction prompt
+            input_data (Dict[str, Any]): JSON-formatted input data
+            model_config (AIModelConfig): Model configuration parameters
+            model_name (str | None): Optional specific model name
+        
+        Returns:
+            Dict[str, Any]: Keyword arguments for messages.create/stream
+        
+        Source/Caller:
+            - Called by: call_ai, stream_ai
+        """
+        return {
+            "model": model_name or self.DEFAULT_MODEL,
+            "max_tokens": model_config.max_tokens or 1024,
+            "temperature": model_config.temperature,
+            "top_p": model_config.top_p,
+            "system": instruction_prompt,
+            "messages": [
+                {"role": "user", "content": self._format_input_data(input_data)}
+            ],
+        }
     
     async def call_ai(
         self,
@@ -76,34 +119,61 @@ class ClaudeAdapter(BaseAIAdapter):
             - DIP: Depends on AIModelConfig abstraction
         """
         try:
-            # Validate configuration
-            self._validate_config(model_config)
-            
             response = await self.client.messages.create(
-                model=model_name or self.DEFAULT_MODEL,
-                max_tokens=model_config.max_tokens or 1024,
-                temperature=model_config.temperature,
-                top_p=model_config.top_p,
-                system=instruction_prompt,
-                messages=[
-                    {"role": "user", "content": str(input_data)}
-                ]
+                **self._message_params(instruction_prompt, input_data, model_config, model_name)
             )
             
+            response_usage = response.usage
+            input_tokens = response_usage.input_tokens
+            output_tokens = response_usage.output_tokens
             usage = {
-                "prompt_tokens": response.usage.input_tokens,
-                "completion_tokens": response.usage.output_tokens,
-                "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
             }
             
-            return AIResponse(
-                provider=AIProviderType.CLAUDE,
+            return AIResponse.model_construct(
+                provider=_PROVIDER,
                 content=response.content[0].text,
                 usage=usage,
-                model=response.model,
-                raw_response=None
+                model=response.model
             )
-        except AIAdapterError:
-            raise
         except Exception as e:
-            raise AIAdapterError(f"Claude API call failed: {str(e)}")
+            raise AIAdapterError(f"Claude API call failed: {str(e)}") from e
+    
+    async def stream_ai(
+        self,
+        instruction_prompt: str,
+        input_data: Dict[str, Any],
+        model_config: AIModelConfig,
+        model_name: str | None = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream Anthropic Claude output as text deltas.
+        
+        Args:
+            instruction_prompt (str): System/instruction prompt
+            input_data (Dict[str, Any]): JSON-formatted input data
+            model_config (AIModelConfig): Model configuration parameters
+            model_name (str | None): Optional specific model name
+        
+        Yields:
+            str: Generated text, as the provider sends it
+        
+        Raises:
+            AIAdapterError: If API call fails
+        
+        Source/Caller:
+            - Called by: AIService.stream_ai_request
+        
+        SOLID Principle Applied:
+            - LSP: Streams like every other adapter
+        """
+        try:
+            async with self.client.messages.stream(
+                **self._message_params(instruction_prompt, input_data, model_config, model_name)
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            raise AIAdapterError(f"Claude API call failed: {str(e)}") from e
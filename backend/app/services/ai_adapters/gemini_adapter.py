@@ -6,13 +6,15 @@ SOLID Principles Applied:
     - SRP: Only handles Gemini API communication
     - OCP: Extends BaseAIAdapter without modifying it
     - LSP: Fully substitutable for BaseAIAdapter
-    - ISP: Implements only required call_ai method
+    - ISP: Implements call_ai plus a native stream_ai
     - DIP: Depends on BaseAIAdapter abstraction
 """
 import google.generativeai as genai
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 
-from app.core.config import settings
+import httpx
+
+from app.core.config import get_settings
 from app.schemas.ai_schemas import AIModelConfig, AIResponse, AIProviderType
 from app.services.ai_adapters.base_adapter import BaseAIAdapter
 from app.core.errors import (
@@ -21,7 +23,12 @@ from app.core.errors import (
     handle_provider_error,
     InvalidInputError
 )
-from app.core.quota_tracker import QuotaTracker
+from app.core.quota_tracker import get_quota_tracker
+
+
+# Resolved once at import instead of on every call
+_quota_tracker = get_quota_tracker()
+_PROVIDER = AIProviderType.GEMINI
 
 
 class GeminiAdapter(BaseAIAdapter):
@@ -31,6 +38,8 @@ class GeminiAdapter(BaseAIAdapter):
     Attributes:
         DEFAULT_MODEL (str): Default Gemini model name
         PROVIDER_NAME (str): Provider identifier
+        _models (Dict[str, genai.GenerativeModel]): Model clients by name, shared
+            across adapter instances
     
     SOLID Principle Applied:
         - SRP: Only responsible for Gemini API integration
@@ -38,17 +47,24 @@ class GeminiAdapter(BaseAIAdapter):
     
     DEFAULT_MODEL = "gemini-pro"
     PROVIDER_NAME = "gemini"
+    _models: Dict[str, genai.GenerativeModel] = {}
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize Gemini adapter with API key.
         
+        Args:
+            http_client: Accepted for a uniform adapter factory; unused because
+                the SDK talks to the provider over gRPC
+        
         Raises:
             AIServiceError: If API key is not configured
         
         SOLID Principle Applied:
             - SRP: Only handles initialization, no business logic
         """
+        settings = get_settings()
+        
         if not settings.gemini_api_key:
             raise AIServiceError(
                 error_type=ErrorType.MISSING_API_KEY,
@@ -57,6 +73,93 @@ class GeminiAdapter(BaseAIAdapter):
             )
         genai.configure(api_key=settings.gemini_api_key)
     
+    def _check_not_blocked(self) -> None:
+        """
+        Reject the call while the provider is blocked due to quota.
+        
+        Raises:
+            AIServiceError: If the provider is currently blocked
+        
+        Source/Caller:
+            - Called by: call_ai, stream_ai
+        """
+        if _quota_tracker.is_provider_blocked(self.PROVIDER_NAME):
+            raise AIServiceError(
+                error_type=ErrorType.QUOTA_EXCEEDED,
+                message=f"{self.PROVIDER_NAME} is currently blocked due to quota exceeded",
+                provider=self.PROVIDER_NAME,
+                is_retryable=False
+            )
+    
+    def _prepare_request(
+        self,
+        instruction_prompt: str,
+        input_data: Dict[str, Any],
+        model_config: AIModelConfig,
+        model_name: str | None
+    ) -> Tuple[str, genai.GenerativeModel, str, genai.types.GenerationConfig]:
+        """
+        Validate the input and resolve the model, message and generation config.
+        
+        Args:
+            instruction_prompt (str): System/instruction prompt
+            input_data (Dict[str, Any]): JSON-formatted input data
+            model_config (AIModelConfig): Model configuration parameters
+            model_name (str | None): Optional specific model name
+        
+        Returns:
+            Tuple: (model name, model client, message, generation config)
+        
+        Raises:
+            InvalidInputError: If the prompt or input data is empty
+        
+        Source/Caller:
+            - Called by: call_ai, stream_ai
+        """
+        if not instruction_prompt or not instruction_prompt.strip():
+            raise InvalidInputError("Instruction prompt cannot be empty")
+        
+        if not input_data:
+            raise InvalidInputError("Input data cannot be empty")
+        
+        name = model_name or self.DEFAULT_MODEL
+        model = self._models.get(name)
+        if model is None:
+            model = self._models.setdefault(name, genai.GenerativeModel(name))
+        
+        generation_config = genai.types.GenerationConfig(
+            temperature=model_config.temperature,
+            max_output_tokens=model_config.max_tokens,
+            top_p=model_config.top_p,
+        )
+        
+        message = self._format_input_message(instruction_prompt, input_data)
+        
+        return name, model, message, generation_config
+    
+    def _standardize_error(self, error: Exception) -> AIServiceError:
+        """
+        Convert a failure to an AIServiceError, blocking the provider on quota errors.
+        
+        Args:
+            error (Exception): Error raised while calling the provider
+        
+        Returns:
+            AIServiceError: Standardized error to raise
+        
+        Source/Caller:
+            - Called by: call_ai, stream_ai
+        """
+        if not isinstance(error, AIServiceError):
+            # Convert provider-specific errors to standardized errors
+            error = handle_provider_error(error, self.PROVIDER_NAME)
+        
+        # Block provider if quota exceeded
+        if error.error_type == ErrorType.QUOTA_EXCEEDED:
+            _quota_tracker.block_provider(self.PROVIDER_NAME)
+        
+        return error
+    
     async def call_ai(
         self,
         instruction_prompt: str,
@@ -87,45 +190,22 @@ class GeminiAdapter(BaseAIAdapter):
             - LSP: Returns AIResponse like all other adapters
             - DIP: Depends on AIModelConfig abstraction
         """
-        quota_tracker = QuotaTracker()
-        
-        # Check if provider is blocked due to quota
-        if quota_tracker.is_provider_blocked(self.PROVIDER_NAME):
-            raise AIServiceError(
-                error_type=ErrorType.QUOTA_EXCEEDED,
-                message=f"{self.PROVIDER_NAME} is currently blocked due to quota exceeded",
-                provider=self.PROVIDER_NAME,
-                is_retryable=False
-            )
+        self._check_not_blocked()
         
         try:
-            # Validate configuration
-            self._validate_config(model_config)
-            
-            # Validate input
-            if not instruction_prompt or not instruction_prompt.strip():
-                raise InvalidInputError("Instruction prompt cannot be empty")
-            
-            if not input_data:
-                raise InvalidInputError("Input data cannot be empty")
-            
-            model = genai.GenerativeModel(model_name or self.DEFAULT_MODEL)
-            
-            generation_config = genai.types.GenerationConfig(
-                temperature=model_config.temperature,
-                max_output_tokens=model_config.max_tokens,
-                top_p=model_config.top_p,
+            name, model, message, generation_config = self._prepare_request(
+                instruction_prompt, input_data, model_config, model_name
             )
             
-            message = self._format_input_message(instruction_prompt, input_data)
-            
             response = await model.generate_content_async(
                 message,
                 generation_config=generation_config
             )
             
-            # Validate response
-            if not response or not response.text:
+            # Validate response (text is assembled from the candidate parts
+            # on every access, so read it once)
+            text = response.text if response else None
+            if not text:
                 raise AIServiceError(
                     error_type=ErrorType.EMPTY_RESPONSE,
                     message="Received empty response from Gemini",
@@ -134,34 +214,74 @@ class GeminiAdapter(BaseAIAdapter):
                 )
             
             # Extract usage information
+            usage_metadata = response.usage_metadata
             usage = {
-                "prompt_tokens": response.usage_metadata.prompt_token_count,
-                "completion_tokens": response.usage_metadata.candidates_token_count,
-                "total_tokens": response.usage_metadata.total_token_count,
+                "prompt_tokens": usage_metadata.prompt_token_count,
+                "completion_tokens": usage_metadata.candidates_token_count,
+                "total_tokens": usage_metadata.total_token_count,
             }
             
-            return AIResponse(
-                provider=AIProviderType.GEMINI,
-                content=response.text,
+            return AIResponse.model_construct(
+                provider=_PROVIDER,
+                content=text,
                 usage=usage,
-                model=model_name or self.DEFAULT_MODEL,
-                raw_response=None
+                model=name
             )
             
         except InvalidInputError:
             # Re-raise input validation errors as-is
             raise
-        except AIServiceError as e:
-            # Check if it's a quota error and block the provider
-            if e.error_type == ErrorType.QUOTA_EXCEEDED:
-                quota_tracker.block_provider(self.PROVIDER_NAME)
-            raise
         except Exception as e:
-            # Convert provider-specific errors to standardized errors
-            standardized_error = handle_provider_error(e, self.PROVIDER_NAME)
+            raise self._standardize_error(e)
+    
+    async def stream_ai(
+        self,
+        instruction_prompt: str,
+        input_data: Dict[str, Any],
+        model_config: AIModelConfig,
+        model_name: str | None = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream Google Gemini output as text deltas.
+        
+        Args:
+            instruction_prompt (str): System/instruction prompt
+            input_data (Dict[str, Any]): JSON-formatted input data
+            model_config (AIModelConfig): Model configuration parameters
+            model_name (str | None): Optional specific model name
+        
+        Yields:
+            str: Generated text, as the provider sends it
+        
+        Raises:
+            AIServiceError: If API call fails
+        
+        Source/Caller:
+            - Called by: AIService.stream_ai_request
+        
+        SOLID Principle Applied:
+            - LSP: Streams like every other adapter
+        """
+        self._check_not_blocked()
+        
+        try:
+            _, model, message, generation_config = self._prepare_request(
+                instruction_prompt, input_data, model_config, model_name
+            )
+            
+            response = await model.generate_content_async(
+                message,
+                generation_config=generation_config,
+                stream=True
+            )
             
-            # Block provider if quota exceeded
-            if standardized_error.error_type == ErrorType.QUOTA_EXCEEDED:
-                quota_tracker.block_provider(self.PROVIDER_NAME)
+            async for chunk in response:
+                # Chunks without parts (e.g. the final safety verdict) carry no text
+                if chunk.parts:
+                    yield chunk.text
             
-            raise standardized_error
+        except InvalidInputError:
+            # Re-raise input validation errors as-is
+            raise
+        except Exception as e:
+            raise self._standardize_error(e)
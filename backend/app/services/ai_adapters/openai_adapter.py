@@ -6,17 +6,22 @@ SOLID Principles Applied:
     - SRP: Only handles OpenAI API communication
     - OCP: Extends BaseAIAdapter without modifying it
     - LSP: Fully substitutable for BaseAIAdapter
-    - ISP: Implements only required call_ai method
+    - ISP: Implements call_ai plus a native stream_ai
     - DIP: Depends on BaseAIAdapter abstraction
 """
 from openai import AsyncOpenAI
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional
 
-from app.core.config import settings
+import httpx
+
+from app.core.config import get_settings
 from app.schemas.ai_schemas import AIModelConfig, AIResponse, AIProviderType
 from app.services.ai_adapters.base_adapter import BaseAIAdapter, AIAdapterError
 
 
+_PROVIDER = AIProviderType.OPENAI
+
+
 class OpenAIAdapter(BaseAIAdapter):
     """
     Adapter for OpenAI GPT models.
@@ -31,19 +36,59 @@ class OpenAIAdapter(BaseAIAdapter):
     
     DEFAULT_MODEL = "gpt-4-turbo-preview"
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize OpenAI adapter with API key.
         
+        Args:
+            http_client: Shared pooled HTTP client; the SDK creates its own if None
+        
         Raises:
             AIAdapterError: If API key is not configured
         
         SOLID Principle Applied:
             - SRP: Only handles initialization and client setup
         """
+        settings = get_settings()
+        
         if not settings.openai_api_key:
             raise AIAdapterError("OpenAI API key not configured")
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
+    
+    def _completion_params(
+        self,
+        instruction_prompt: str,
+        input_data: Dict[str, Any],
+        model_config: AIModelConfig,
+        model_name: str | None
+    ) -> Dict[str, Any]:
+        """
+        Build the chat completion arguments shared by call_ai and stream_ai.
+        
+        Args:
+            instruction_prompt (str): System/instruction prompt
+            input_data (Dict[str, Any]): JSON-formatted input data
+            model_config (AIModelConfig): Model configuration parameters
+            model_name (str | None): Optional specific model name
+        
+        Returns:
+            Dict[str, Any]: Keyword arguments for chat.completions.create
+        
+        Source/Caller:
+            - Called by: call_ai, stream_ai
+        """
+        return {
+            "model": model_name or self.DEFAULT_MODEL,
+            "messages": [
+                {"role": "system", "content": instruction_prompt},
+                {"role": "user", "content": self._format_input_data(input_data)}
+            ],
+            "temperature": model_config.temperature,
+            "max_tokens": model_config.max_tokens,
+            "top_p": model_config.top_p,
+            "frequency_penalty": model_config.frequency_penalty or 0.0,
+            "presence_penalty": model_config.presence_penalty or 0.0,
+        }
     
     async def call_ai(
         self,
@@ -76,36 +121,63 @@ class OpenAIAdapter(BaseAIAdapter):
             - DIP: Depends on AIModelConfig abstraction
         """
         try:
-            # Validate configuration
-            self._validate_config(model_config)
-            
             response = await self.client.chat.completions.create(
-                model=model_name or self.DEFAULT_MODEL,
-                messages=[
-                    {"role": "system", "content": instruction_prompt},
-                    {"role": "user", "content": str(input_data)}
-                ],
-                temperature=model_config.temperature,
-                max_tokens=model_config.max_tokens,
-                top_p=model_config.top_p,
-                frequency_penalty=model_config.frequency_penalty or 0.0,
-                presence_penalty=model_config.presence_penalty or 0.0,
+                **self._completion_params(instruction_prompt, input_data, model_config, model_name)
             )
             
+            response_usage = response.usage
             usage = {
-                "prompt_tokens": response.usage.prompt_tokens,
-                "completion_tokens": response.usage.completion_tokens,
-                "total_tokens": response.usage.total_tokens,
+                "prompt_tokens": response_usage.prompt_tokens,
+                "completion_tokens": response_usage.completion_tokens,
+                "total_tokens": response_usage.total_tokens,
             }
             
-            return AIResponse(
-                provider=AIProviderType.OPENAI,
+            return AIResponse.model_construct(
+                provider=_PROVIDER,
                 content=response.choices[0].message.content,
                 usage=usage,
-                model=response.model,
-                raw_response=None
+                model=response.model
+            )
+        except Exception as e:
+            raise AIAdapterError(f"OpenAI API call failed: {str(e)}") from e
+    
+    async def stream_ai(
+        self,
+        instruction_prompt: str,
+        input_data: Dict[str, Any],
+        model_config: AIModelConfig,
+        model_name: str | None = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream OpenAI GPT output as text deltas.
+        
+        Args:
+            instruction_prompt (str): System/instruction prompt
+            input_data (Dict[str, Any]): JSON-formatted input data
+            model_config (AIModelConfig): Model configuration parameters
+            model_name (str | None): Optional specific model name
+        
+        Yields:
+            str: Generated text, as the provider sends it
+        
+        Raises:
+            AIAdapterError: If API call fails
+        
+        Source/Caller:
+            - Called by: AIService.stream_ai_request
+        
+        SOLID Principle Applied:
+            - LSP: Streams like every other adapter
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                **self._completion_params(instruction_prompt, input_data, model_config, model_name),
+                stream=True
             )
-        except AIAdapterError:
-            raise
+            
+            async for chunk in stream:
+                # Role-only and final chunks carry no text
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         except Exception as e:
-            raise AIAdapterError(f"OpenAI API call failed: {str(e)}")
+            raise AIAdapterError(f"OpenAI API call failed: {str(e)}") from e
@@ -9,16 +9,22 @@ SOLID Principles Applied:
     - ISP: Implements only required call_ai method
     - DIP: Depends on BaseAIAdapter abstraction
 """
+import asyncio
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import httpx
 from vertexai.preview.generative_models import GenerativeModel, GenerationConfig
 import vertexai
 
-from app.core.config import settings
+from app.core.config import get_settings
 from app.schemas.ai_schemas import AIModelConfig, AIResponse, AIProviderType
 from app.services.ai_adapters.base_adapter import BaseAIAdapter, AIAdapterError
 
 
+_PROVIDER = AIProviderType.VERTEX_AI
+
+
 class VertexAIAdapter(BaseAIAdapter):
     """
     Adapter for Google Vertex AI (GCP).
@@ -29,6 +35,8 @@ class VertexAIAdapter(BaseAIAdapter):
     Attributes:
         DEFAULT_MODEL (str): Default Vertex AI model name
         _initialized (bool): Track if Vertex AI SDK has been initialized
+        _models (Dict[str, GenerativeModel]): Model clients by name, shared
+            across adapter instances
     
     SOLID Principle Applied:
         - SRP: Only responsible for Vertex AI integration
@@ -36,11 +44,16 @@ class VertexAIAdapter(BaseAIAdapter):
     
     DEFAULT_MODEL = "gemini-pro"
     _initialized = False
+    _models: Dict[str, GenerativeModel] = {}
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         """
         Initialize Vertex AI adapter with GCP credentials.
         
+        Args:
+            http_client: Accepted for a uniform adapter factory; unused because
+                the SDK talks to the provider over gRPC
+        
         Raises:
             AIAdapterError: If configuration is invalid
         
@@ -69,6 +82,8 @@ class VertexAIAdapter(BaseAIAdapter):
         SOLID Principle Applied:
             - SRP: Only handles SDK initialization
         """
+        settings = get_settings()
+        
         if not settings.vertex_ai_project_id:
             raise AIAdapterError("Vertex AI project ID not configured")
         
@@ -117,10 +132,10 @@ class VertexAIAdapter(BaseAIAdapter):
             - DIP: Depends on AIModelConfig abstraction
         """
         try:
-            # Validate configuration
-            self._validate_config(model_config)
-            
-            model = GenerativeModel(model_name or self.DEFAULT_MODEL)
+            name = model_name or self.DEFAULT_MODEL
+            model = self._models.get(name)
+            if model is None:
+                model = self._models.setdefault(name, GenerativeModel(name))
             
             generation_config = GenerationConfig(
                 temperature=model_config.temperature,
@@ -130,27 +145,27 @@ class VertexAIAdapter(BaseAIAdapter):
             
             message = self._format_input_message(instruction_prompt, input_data)
             
-            # Vertex AI generate_content is synchronous, but we wrap it for consistency
-            response = model.generate_content(
+            # generate_content is a blocking RPC; run it off the event loop so
+            # other requests keep being served while it waits
+            response = await asyncio.to_thread(
+                model.generate_content,
                 message,
                 generation_config=generation_config
             )
             
             # Extract usage information
+            usage_metadata = response.usage_metadata
             usage = {
-                "prompt_tokens": response.usage_metadata.prompt_token_count,
-                "completion_tokens": response.usage_metadata.candidates_token_count,
-                "total_tokens": response.usage_metadata.total_token_count,
+                "prompt_tokens": usage_metadata.prompt_token_count,
+                "completion_tokens": usage_metadata.candidates_token_count,
+                "total_tokens": usage_metadata.total_token_count,
             }
             
-            return AIResponse(
-                provider=AIProviderType.VERTEX_AI,
+            return AIResponse.model_construct(
+                provider=_PROVIDER,
                 content=response.text,
                 usage=usage,
-                model=model_name or self.DEFAULT_MODEL,
-                raw_response=None
+                model=name
             )
-        except AIAdapterError:
-            raise
         except Exception as e:
-            raise AIAdapterError(f"Vertex AI API call failed: {str(e)}")
+            raise AIAdapterError(f"Vertex AI API call failed: {str(e)}") from e
@@ -9,30 +9,105 @@ SOLID Principles Applied:
     - ISP: Minimal interface, only what's needed
     - DIP: Depends on BaseAIAdapter abstraction, not concrete implementations
 """
-from typing import Dict, Type
+import asyncio
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
 from fastapi import HTTPException
+import httpx
+import numpy as np
+import orjson
 
 from app.schemas.ai_schemas import (
     AIRequest,
     AIResponse,
     AIProviderType,
-    AIModelConfig,
-)
-from app.services.ai_adapters import (
-    BaseAIAdapter,
-    GeminiAdapter,
-    OpenAIAdapter,
-    ClaudeAdapter,
-    DeepSeekAdapter,
-    VertexAIAdapter,
+    DEFAULT_AI_CONFIG,
 )
+from app.services import ai_adapters
+from app.services.ai_adapters import BaseAIAdapter
+from app.services.micro_batcher import MicroBatcher
 from app.core.errors import (
     AIServiceError,
     QuotaExceededError,
-    InvalidInputError,
     ErrorType
 )
-from app.core.quota_tracker import QuotaTracker
+from app.core.admission import get_admission
+from app.core.config import get_settings
+from app.core.quota_tracker import get_quota_tracker, get_redis_quota_tracker
+
+
+# HTTP status per AIServiceError type; anything not listed maps to 500
+_STATUS_BY_ERROR: Dict[ErrorType, int] = {
+    ErrorType.INVALID_INPUT: 400,
+    ErrorType.INVALID_CONFIG: 400,
+    ErrorType.INVALID_PROVIDER: 400,
+    ErrorType.MISSING_API_KEY: 401,
+    ErrorType.QUOTA_EXCEEDED: 429,
+    ErrorType.RATE_LIMIT_EXCEEDED: 429,
+}
+
+# Error type values used in hand-built error payloads, resolved once
+_PROCESSING_ERROR = ErrorType.PROCESSING_ERROR.value
+_ADAPTER_INITIALIZATION_ERROR = ErrorType.ADAPTER_INITIALIZATION_ERROR.value
+
+# Usage counters summed by AIService.total_usage, in column order
+_USAGE_KEYS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+def _unexpected_error_detail(provider: str, error: Exception) -> Dict[str, Any]:
+    """
+    Build the error payload for a failure that is not an AIServiceError.
+    
+    Args:
+        provider: Provider name the request was sent to
+        error: The unexpected exception
+    
+    Returns:
+        Dict[str, Any]: Error payload in AIServiceError.to_dict() shape
+    
+    Source/Caller:
+        - Called by: AIService._http_error, AIService._stream_events
+    """
+    return {
+        "error_type": _PROCESSING_ERROR,
+        "message": f"Unexpected error during AI processing: {error}",
+        "provider": provider,
+        "is_retryable": False
+    }
+
+
+@lru_cache(maxsize=32)
+def _blocked_message(provider_name: str) -> str:
+    """
+    Message of the 429 returned while a provider is blocked.
+    
+    Args:
+        provider_name: Blocked provider
+    
+    Returns:
+        str: Client-facing message, built once per provider
+    
+    Source/Caller:
+        - Called by: AIService._ensure_provider_available
+    """
+    return f"Provider {provider_name} is currently blocked due to quota exceeded. Please try again later."
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    """
+    Encode one Server-Sent Events frame.
+    
+    Args:
+        event: Event name (delta, done or error)
+        data: JSON-serializable event payload
+    
+    Returns:
+        bytes: Encoded SSE frame
+    
+    Source/Caller:
+        - Called by: AIService._stream_events
+    """
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
 
 
 class AIService:
@@ -42,7 +117,13 @@ class AIService:
     Routes requests to appropriate AI provider adapters.
     
     Attributes:
-        _adapters (Dict): Mapping of provider types to adapter classes
+        _adapters (Dict): Mapping of provider types to adapter class names,
+            resolved (and their SDKs imported) on first use
+        _SUPPORTED_PROVIDERS (tuple): Provider names, derived once from _adapters
+        _adapter_instances (Dict): Constructed adapters by (provider, HTTP client);
+            adapters keep no per-request state, so one instance serves all requests
+        _micro_batcher (Optional[MicroBatcher]): Coalesces concurrent single
+            requests when micro-batching is enabled; created on first use
     
     SOLID Principles Applied:
         - SRP: Only handles routing to correct adapter
@@ -50,22 +131,36 @@ class AIService:
         - DIP: Depends on BaseAIAdapter interface
     """
     
-    # Factory mapping: provider type -> adapter class
-    _adapters: Dict[AIProviderType, Type[BaseAIAdapter]] = {
-        AIProviderType.GEMINI: GeminiAdapter,
-        AIProviderType.OPENAI: OpenAIAdapter,
-        AIProviderType.CLAUDE: ClaudeAdapter,
-        AIProviderType.DEEPSEEK: DeepSeekAdapter,
-        AIProviderType.VERTEX_AI: VertexAIAdapter,
+    # Factory mapping: provider type -> adapter class name in ai_adapters
+    _adapters: Dict[AIProviderType, str] = {
+        AIProviderType.GEMINI: "GeminiAdapter",
+        AIProviderType.OPENAI: "OpenAIAdapter",
+        AIProviderType.CLAUDE: "ClaudeAdapter",
+        AIProviderType.DEEPSEEK: "DeepSeekAdapter",
+        AIProviderType.VERTEX_AI: "VertexAIAdapter",
     }
     
+    _SUPPORTED_PROVIDERS: Tuple[str, ...] = tuple(provider.value for provider in _adapters)
+    
+    _adapter_instances: Dict[Tuple[AIProviderType, Optional[httpx.AsyncClient]], BaseAIAdapter] = {}
+    
+    _micro_batcher: Optional[MicroBatcher] = None
+    
     @classmethod
-    def _get_adapter(cls, provider: AIProviderType) -> BaseAIAdapter:
+    def _get_adapter(
+        cls,
+        provider: AIProviderType,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> BaseAIAdapter:
         """
-        Factory method to instantiate the appropriate adapter.
+        Factory method returning the appropriate adapter.
+        
+        Adapters are built once per provider and HTTP client and reused;
+        a failed construction is not cached, so it is retried next call.
         
         Args:
             provider (AIProviderType): The AI provider to use
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
         
         Returns:
             BaseAIAdapter: Instance of the appropriate adapter
@@ -80,46 +175,125 @@ class AIService:
             - OCP: New adapters registered without modifying this method
             - DIP: Returns BaseAIAdapter interface, not concrete type
         """
-        adapter_class = cls._adapters.get(provider)
+        adapter = cls._adapter_instances.get((provider, http_client))
+        if adapter is not None:
+            return adapter
+        
+        adapter_name = cls._adapters.get(provider)
         
-        if not adapter_class:
+        if not adapter_name:
+            # Callers outside the API may pass a plain string instead of the enum
+            provider_name = getattr(provider, "value", provider)
             raise HTTPException(
                 status_code=400,
                 detail={
                     "error_type": ErrorType.INVALID_PROVIDER.value,
-                    "message": f"Unsupported AI provider: {provider}",
-                    "provider": provider.value if provider else None
+                    "message": f"Unsupported AI provider: {provider_name}",
+                    "provider": provider_name
                 }
             )
         
         try:
-            return adapter_class()
+            adapter_class: Type[BaseAIAdapter] = getattr(ai_adapters, adapter_name)
+            return cls._adapter_instances.setdefault(
+                (provider, http_client),
+                adapter_class(http_client=http_client)
+            )
         except AIServiceError as e:
             raise HTTPException(
-                status_code=500 if e.error_type not in [ErrorType.INVALID_INPUT, ErrorType.MISSING_API_KEY] else 400,
+                status_code=_STATUS_BY_ERROR.get(e.error_type, 500),
                 detail=e.to_dict()
             )
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail={
-                    "error_type": ErrorType.ADAPTER_INITIALIZATION_ERROR.value,
-                    "message": f"Failed to initialize {provider} adapter: {str(e)}",
+                    "error_type": _ADAPTER_INITIALIZATION_ERROR,
+                    "message": f"Failed to initialize {provider} adapter: {e}",
                     "provider": provider.value
                 }
             )
     
     @classmethod
-    async def process_ai_request(cls, request: AIRequest) -> AIResponse:
+    def discard_adapters(cls, http_client: Optional[httpx.AsyncClient]) -> None:
+        """
+        Drop cached adapters bound to an HTTP client that is being closed.
+        
+        Args:
+            http_client (Optional[httpx.AsyncClient]): Client being shut down
+        
+        Source/Caller:
+            - Called by: Application lifespan shutdown (app.main)
+        """
+        for key in [key for key in cls._adapter_instances if key[1] is http_client]:
+            del cls._adapter_instances[key]
+    
+    @staticmethod
+    async def _ensure_provider_available(provider_name: str) -> None:
+        """
+        Reject requests for providers blocked by the quota tracker.
+        
+        Checks this process's tracker and, when the Redis backend is enabled,
+        blocks recorded by any other worker. The 429 is raised directly: the
+        block already exists, so the QuotaExceededError handling that shares
+        new blocks with other workers is skipped.
+        
+        Args:
+            provider_name (str): Provider to check
+        
+        Raises:
+            HTTPException: 429 if the provider is currently blocked
+        
+        Source/Caller:
+            - Called by: AIService.process_ai_request, AIService.stream_ai_request
+        
+        SOLID Principle Applied:
+            - SRP: Only checks provider availability
+        """
+        quota_tracker = get_quota_tracker()
+        shared_tracker = get_redis_quota_tracker()
+        
+        if quota_tracker.is_provider_blocked(provider_name) or (
+            shared_tracker is not None
+            and await shared_tracker.is_provider_blocked(provider_name)
+        ):
+            blocked_providers = quota_tracker.get_blocked_providers()
+            if shared_tracker is not None:
+                blocked_providers.update(await shared_tracker.get_blocked_providers())
+            
+            raise HTTPException(
+                status_code=429,
+                detail=QuotaExceededError(
+                    provider=provider_name,
+                    message=_blocked_message(provider_name),
+                    details={
+                        "blocked_providers": blocked_providers
+                    }
+                ).to_dict()
+            )
+    
+    @classmethod
+    async def process_ai_request(
+        cls,
+        request: AIRequest,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> AIResponse:
         """
         Process an AI request using the specified provider.
         
         Args:
             request (AIRequest): The AI request payload
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
         
         Returns:
             AIResponse: The AI response
         
+        When micro-batching is enabled (`micro_batch_wait_ms` > 0), the
+        request waits up to that long for concurrent requests sharing its
+        provider, model, instruction prompt and config, and is sent to the
+        provider packed together with them. Each provider call takes one slot
+        in the provider's admission controller; waiting for partners does not.
+        
         Raises:
             HTTPException: If request processing fails
         
@@ -132,76 +306,464 @@ class AIService:
             - LSP: All adapters handled uniformly
             - DIP: Works with AIRequest/AIResponse abstractions
         """
-        quota_tracker = QuotaTracker()
+        batcher = cls._get_micro_batcher()
+        
+        if batcher is None:
+            return await cls._process_single(request, http_client)
+        
+        result = await batcher.submit(cls._batch_key(request), (request, http_client))
+        if isinstance(result, HTTPException):
+            raise result
+        return result
+    
+    @classmethod
+    async def _process_single(
+        cls,
+        request: AIRequest,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> AIResponse:
+        """
+        Send one AI request to its provider inside an admission slot.
+        
+        The slot is only held for the provider call, so at most
+        `max_concurrent_requests_per_provider` calls per provider are in flight.
+        
+        Args:
+            request (AIRequest): The AI request payload
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
+        
+        Returns:
+            AIResponse: The AI response
+        
+        Raises:
+            HTTPException: If request processing fails
+        
+        Source/Caller:
+            - Called by: AIService.process_ai_request, AIService._flush_micro_batch
+        """
+        # Both raise HTTPException directly, so they stay outside the try
+        await cls._ensure_provider_available(request.provider.value)
+        
+        # Get the appropriate adapter (Factory Pattern)
+        adapter = cls._get_adapter(request.provider, http_client)
+        
+        # Ensure ai_config exists
+        ai_config = request.ai_config or DEFAULT_AI_CONFIG
         
+        admission = get_admission(request.provider.value)
+        
+        await admission.acquire()
         try:
-            # Check if provider is blocked before attempting to initialize
-            provider_name = request.provider.value
-            if quota_tracker.is_provider_blocked(provider_name):
-                raise QuotaExceededError(
-                    provider=provider_name,
-                    message=f"Provider {provider_name} is currently blocked due to quota exceeded. Please try again later.",
-                    details={
-                        "blocked_providers": quota_tracker.get_blocked_providers()
-                    }
-                )
-            
-            # Get the appropriate adapter (Factory Pattern)
-            adapter = cls._get_adapter(request.provider)
-            
-            # Ensure ai_config exists
-            ai_config = request.ai_config or AIModelConfig()
-            
             # Call the AI provider (Strategy Pattern)
-            response = await adapter.call_ai(
+            return await adapter.call_ai(
                 instruction_prompt=request.instruction_prompt,
                 input_data=request.input_data,
                 model_config=ai_config,
                 model_name=request.model_name,
             )
-            
-            return response
-            
-        except HTTPException:
-            # Re-raise HTTP exceptions as-is
-            raise
-        except QuotaExceededError as e:
-            # Quota exceeded - return 429 status
-            raise HTTPException(
-                status_code=429,
-                detail=e.to_dict()
-            )
-        except InvalidInputError as e:
-            # Client input error - return 400 status
-            raise HTTPException(
-                status_code=400,
-                detail=e.to_dict()
+        except Exception as e:
+            raise await cls._http_error(e, request.provider)
+        finally:
+            await admission.release()
+    
+    @staticmethod
+    async def _http_error(error: Exception, provider: AIProviderType) -> HTTPException:
+        """
+        Map a failed AI call to the HTTPException returned to the client.
+        
+        Args:
+            error (Exception): Error raised while processing the request
+            provider (AIProviderType): Provider the request was sent to
+        
+        Returns:
+            HTTPException: Exception carrying the status code and error payload
+        
+        Source/Caller:
+            - Called by: AIService._process_single, AIService._call_packed
+        
+        SOLID Principle Applied:
+            - SRP: Only translates errors to HTTP responses
+        """
+        if isinstance(error, QuotaExceededError):
+            # Quota exceeded - share the block with other workers
+            shared_tracker = get_redis_quota_tracker()
+            if shared_tracker is not None:
+                await shared_tracker.block_provider(provider.value)
+        
+        if isinstance(error, AIServiceError):
+            return HTTPException(
+                status_code=_STATUS_BY_ERROR.get(error.error_type, 500),
+                detail=error.to_dict()
             )
-        except AIServiceError as e:
-            # Determine appropriate status code based on error type
-            status_code = 500
-            if e.error_type in [ErrorType.INVALID_INPUT, ErrorType.INVALID_CONFIG, ErrorType.INVALID_PROVIDER]:
-                status_code = 400
-            elif e.error_type == ErrorType.MISSING_API_KEY:
-                status_code = 401
-            elif e.error_type in [ErrorType.QUOTA_EXCEEDED, ErrorType.RATE_LIMIT_EXCEEDED]:
-                status_code = 429
+        
+        # Unexpected error - return 500 status
+        return HTTPException(
+            status_code=500,
+            detail=_unexpected_error_detail(provider.value, error)
+        )
+    
+    @classmethod
+    async def _process_or_error(
+        cls,
+        request: AIRequest,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> Union[AIResponse, HTTPException]:
+        """
+        Process one request of a batch, returning its error instead of raising.
+        
+        Args:
+            request (AIRequest): The AI request payload
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
+        
+        Returns:
+            Union[AIResponse, HTTPException]: The AI response, or the
+            HTTPException process_ai_request raised for this request
+        
+        Source/Caller:
+            - Called by: AIService.process_ai_requests, AIService.process_ai_batch
+        """
+        try:
+            return await cls.process_ai_request(request, http_client)
+        except HTTPException as e:
+            return e
+    
+    @classmethod
+    async def process_ai_requests(
+        cls,
+        requests: List[AIRequest],
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> List[Union[AIResponse, HTTPException]]:
+        """
+        Process many AI requests concurrently.
+        
+        All requests are started at once with asyncio.gather; each one waits
+        for a slot in its provider's admission controller, so at most
+        `max_concurrent_requests_per_provider` calls per provider are in
+        flight while the shared HTTP client keeps their connections warm.
+        A failing request does not affect the others.
+        
+        Args:
+            requests (List[AIRequest]): The AI request payloads
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
+        
+        Returns:
+            List[Union[AIResponse, HTTPException]]: One result per request, in
+            request order - the AI response or the HTTPException describing
+            why that request failed
+        
+        Source/Caller:
+            - Called by: Orchestration code fanning records out to providers
+        
+        SOLID Principle Applied:
+            - SRP: Only fans requests out; each is handled by process_ai_request
+        """
+        return list(await asyncio.gather(
+            *(cls._process_or_error(request, http_client) for request in requests)
+        ))
+    
+    @staticmethod
+    def _batch_key(request: AIRequest) -> tuple:
+        """
+        Key under which requests may be packed into one provider call.
+        
+        Args:
+            request (AIRequest): The AI request payload
+        
+        Returns:
+            tuple: (provider, model name, instruction prompt, config)
+        
+        Source/Caller:
+            - Called by: AIService.process_ai_batch, AIService.process_ai_request
+        """
+        return (request.provider, request.model_name, request.instruction_prompt, request.ai_config)
+    
+    @classmethod
+    async def _process_packed(
+        cls,
+        requests: List[AIRequest],
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> List[Union[AIResponse, HTTPException]]:
+        """
+        Process a batch group inside one admission slot.
+        
+        The group holds a single slot, since it is a single provider call.
+        
+        Args:
+            requests (List[AIRequest]): Requests of one batch group
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
+        
+        Returns:
+            List[Union[AIResponse, HTTPException]]: One result per request, in order
+        
+        Source/Caller:
+            - Called by: AIService.process_ai_batch, AIService._flush_micro_batch
+        """
+        admission = get_admission(requests[0].provider.value)
+        
+        await admission.acquire()
+        try:
+            return await cls._call_packed(requests, http_client)
+        finally:
+            await admission.release()
+    
+    @classmethod
+    async def _call_packed(
+        cls,
+        requests: List[AIRequest],
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> List[Union[AIResponse, HTTPException]]:
+        """
+        Send requests sharing provider, model, prompt and config as one call.
+        
+        If the packed call fails, every request of the group reports the same
+        error. An item whose individual retry failed reports its own error.
+        
+        Args:
+            requests (List[AIRequest]): Requests of one batch group
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
+        
+        Returns:
+            List[Union[AIResponse, HTTPException]]: One result per request, in order
+        
+        Source/Caller:
+            - Called by: AIService._process_packed
+        """
+        first = requests[0]
+        
+        try:
+            await cls._ensure_provider_available(first.provider.value)
+            adapter = cls._get_adapter(first.provider, http_client)
             
-            raise HTTPException(
-                status_code=status_code,
-                detail=e.to_dict()
+            results = await adapter.call_ai_batch(
+                instruction_prompt=first.instruction_prompt,
+                input_data_list=[request.input_data for request in requests],
+                model_config=first.ai_config or DEFAULT_AI_CONFIG,
+                model_name=first.model_name,
             )
+        except HTTPException as e:
+            return [e] * len(requests)
         except Exception as e:
-            # Unexpected error - return 500 status
-            raise HTTPException(
-                status_code=500,
-                detail={
-                    "error_type": ErrorType.PROCESSING_ERROR.value,
-                    "message": f"Unexpected error during AI processing: {str(e)}",
-                    "provider": request.provider.value,
-                    "is_retryable": False
-                }
+            return [await cls._http_error(e, first.provider)] * len(requests)
+        
+        return [
+            await cls._http_error(result, first.provider) if isinstance(result, Exception) else result
+            for result in results
+        ]
+    
+    @classmethod
+    def _get_micro_batcher(cls) -> Optional[MicroBatcher]:
+        """
+        Get the shared micro-batcher, or None when micro-batching is disabled.
+        
+        Returns:
+            Optional[MicroBatcher]: Batcher flushing through _flush_micro_batch
+        
+        Source/Caller:
+            - Called by: AIService.process_ai_request
+        """
+        if cls._micro_batcher is None:
+            settings = get_settings()
+            if settings.micro_batch_wait_ms <= 0:
+                return None
+            
+            cls._micro_batcher = MicroBatcher(
+                cls._flush_micro_batch,
+                max_items=settings.batch_pack_size,
+                max_wait=settings.micro_batch_wait_ms / 1000
             )
+        
+        return cls._micro_batcher
+    
+    @classmethod
+    async def _flush_micro_batch(
+        cls,
+        items: List[Tuple[AIRequest, Optional[httpx.AsyncClient]]]
+    ) -> List[Union[AIResponse, HTTPException]]:
+        """
+        Process one micro-batch of coalesced single requests.
+        
+        Callers wait in the batch window without an admission slot; the
+        flush takes one slot for its provider call, packed or single.
+        
+        Args:
+            items (List[Tuple]): (request, http_client) pairs sharing a batch key
+        
+        Returns:
+            List[Union[AIResponse, HTTPException]]: One result per request, in order
+        
+        Source/Caller:
+            - Called by: MicroBatcher when a window closes
+        """
+        requests = [request for request, _ in items]
+        http_client = items[0][1]
+        
+        if len(requests) > 1:
+            return await cls._process_packed(requests, http_client)
+        
+        try:
+            return [await cls._process_single(requests[0], http_client)]
+        except HTTPException as e:
+            return [e]
+    
+    @classmethod
+    async def process_ai_batch(
+        cls,
+        requests: List[AIRequest],
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> List[Union[AIResponse, HTTPException]]:
+        """
+        Process many AI requests with as few provider calls as possible.
+        
+        Requests that share provider, model, instruction prompt and config are
+        grouped, and each group of up to `batch_pack_size` items is sent as one
+        packed call (BaseAIAdapter.call_ai_batch). Requests without a partner
+        go through process_ai_request. All groups run concurrently under the
+        per-provider admission limit.
+        
+        Args:
+            requests (List[AIRequest]): The AI request payloads
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
+        
+        Returns:
+            List[Union[AIResponse, HTTPException]]: One result per request, in
+            request order - the AI response or the HTTPException describing
+            why that request failed
+        
+        Source/Caller:
+            - Called by: Batch API route handler (app.api.routes.ai_routes)
+        
+        SOLID Principle Applied:
+            - SRP: Only groups requests; adapters do the packing
+        """
+        groups: Dict[tuple, List[int]] = {}
+        for index, request in enumerate(requests):
+            groups.setdefault(cls._batch_key(request), []).append(index)
+        
+        pack_size = get_settings().batch_pack_size
+        chunks = [
+            indices[start:start + pack_size]
+            for indices in groups.values()
+            for start in range(0, len(indices), pack_size)
+        ]
+        
+        async def run(indices: List[int]) -> List[Union[AIResponse, HTTPException]]:
+            if len(indices) == 1:
+                return [await cls._process_or_error(requests[indices[0]], http_client)]
+            return await cls._process_packed([requests[i] for i in indices], http_client)
+        
+        results: Dict[int, Union[AIResponse, HTTPException]] = {}
+        for indices, chunk_results in zip(chunks, await asyncio.gather(*map(run, chunks))):
+            results.update(zip(indices, chunk_results))
+        
+        return [results[index] for index in range(len(requests))]
+    
+    @staticmethod
+    def total_usage(results: List[Union[AIResponse, HTTPException]]) -> Dict[str, int]:
+        """
+        Sum token usage over the results of a batch.
+        
+        Counts are packed into one (N, 3) int64 array and reduced with a
+        single vectorized sum instead of adding N dicts in Python. Failed
+        requests and counters a provider did not report count as zero.
+        
+        Args:
+            results (List[Union[AIResponse, HTTPException]]): Output of
+                process_ai_requests or process_ai_batch
+        
+        Returns:
+            Dict[str, int]: Summed prompt_tokens, completion_tokens and total_tokens
+        
+        Source/Caller:
+            - Called by: Orchestration code reporting batch usage or billing
+        
+        SOLID Principle Applied:
+            - SRP: Only aggregates usage counters
+        """
+        usages = [r.usage for r in results if isinstance(r, AIResponse)]
+        
+        counts = np.fromiter(
+            (usage.get(key) or 0 for usage in usages for key in _USAGE_KEYS),
+            dtype=np.int64,
+            count=len(usages) * len(_USAGE_KEYS)
+        ).reshape(-1, len(_USAGE_KEYS))
+        
+        return dict(zip(_USAGE_KEYS, counts.sum(axis=0).tolist()))
+    
+    @classmethod
+    async def stream_ai_request(
+        cls,
+        request: AIRequest,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Start streaming an AI request as Server-Sent Events.
+        
+        The provider availability check and adapter initialization run
+        eagerly, so those failures still surface as HTTP errors. Once the
+        stream has started, the status code is already sent; later failures
+        are delivered as a final `error` event instead.
+        
+        Events:
+            - delta: {"content": str} for each chunk of generated text
+            - done: {"provider": str, "model": str | None} after the last chunk
+            - error: AIServiceError.to_dict() payload if generation fails
+        
+        Args:
+            request (AIRequest): The AI request payload
+            http_client (Optional[httpx.AsyncClient]): Shared pooled HTTP client
+        
+        Returns:
+            AsyncIterator[bytes]: Encoded SSE frames
+        
+        Raises:
+            HTTPException: If the provider is blocked or the adapter cannot start
+        
+        Source/Caller:
+            - Called by: API route handlers when request.stream is set
+            - Input Source: Client HTTP request
+        
+        SOLID Principle Applied:
+            - SRP: Only orchestrates the streaming request flow
+            - LSP: All adapters stream through BaseAIAdapter.stream_ai
+        """
+        await cls._ensure_provider_available(request.provider.value)
+        
+        adapter = cls._get_adapter(request.provider, http_client)
+        
+        return cls._stream_events(adapter, request)
+    
+    @staticmethod
+    async def _stream_events(adapter: BaseAIAdapter, request: AIRequest) -> AsyncIterator[bytes]:
+        """
+        Relay adapter output as SSE frames.
+        
+        Args:
+            adapter (BaseAIAdapter): Initialized provider adapter
+            request (AIRequest): The AI request payload
+        
+        Yields:
+            bytes: Encoded SSE frames (delta events, then done or error)
+        
+        Source/Caller:
+            - Called by: AIService.stream_ai_request
+        """
+        try:
+            async for chunk in adapter.stream_ai(
+                instruction_prompt=request.instruction_prompt,
+                input_data=request.input_data,
+                model_config=request.ai_config or DEFAULT_AI_CONFIG,
+                model_name=request.model_name,
+            ):
+                yield _sse_event("delta", {"content": chunk})
+        except AIServiceError as e:
+            yield _sse_event("error", e.to_dict())
+        except Exception as e:
+            yield _sse_event("error", _unexpected_error_detail(request.provider.value, e))
+        else:
+            yield _sse_event("done", {
+                "provider": request.provider.value,
+                "model": request.model_name
+            })
     
     @classmethod
     def get_supported_providers(cls) -> list[str]:
@@ -215,12 +777,12 @@ class AIService:
             - Called by: API info/documentation endpoints
         
         SOLID Principle Applied:
-            - OCP: Dynamically reads from _adapters registry
+            - OCP: Derived from the _adapters registry
         """
-        return [provider.value for provider in cls._adapters.keys()]
+        return list(cls._SUPPORTED_PROVIDERS)
     
     @classmethod
-    def get_provider_status(cls) -> Dict[str, Dict[str, any]]:
+    def get_provider_status(cls) -> Dict[str, Any]:
         """
         Get status of all providers including blocked status.
         
@@ -233,14 +795,71 @@ class AIService:
         SOLID Principle Applied:
             - SRP: Only retrieves status information
         """
-        quota_tracker = QuotaTracker()
+        quota_tracker = get_quota_tracker()
         blocked_providers = quota_tracker.get_blocked_providers()
         
         return {
-            "providers": cls.get_supported_providers(),
+            "providers": list(cls._SUPPORTED_PROVIDERS),
+            "blocked_providers": blocked_providers,
+            "available_providers": [
+                p for p in cls._SUPPORTED_PROVIDERS
+                if p not in blocked_providers
+            ]
+        }
+    
+    @classmethod
+    async def fetch_provider_status(cls) -> Dict[str, Any]:
+        """
+        Get status of all providers, including blocks from other workers.
+        
+        Same shape as get_provider_status. When the Redis quota backend is
+        enabled, blocks recorded by any worker are merged in.
+        
+        Returns:
+            Dict with provider statuses
+        
+        Source/Caller:
+            - Called by: Status monitoring endpoints
+        
+        SOLID Principle Applied:
+            - SRP: Only retrieves status information
+        """
+        status = cls.get_provider_status()
+        shared_tracker = get_redis_quota_tracker()
+        
+        if shared_tracker is None:
+            return status
+        
+        blocked_providers = {
+            **status["blocked_providers"],
+            **await shared_tracker.get_blocked_providers()
+        }
+        
+        return {
+            "providers": status["providers"],
             "blocked_providers": blocked_providers,
             "available_providers": [
-                p for p in cls.get_supported_providers()
+                p for p in status["providers"]
                 if p not in blocked_providers
             ]
         }
+    
+    @classmethod
+    async def unblock_provider(cls, provider: str) -> None:
+        """
+        Lift a quota block on a provider in this worker and, if enabled, in Redis.
+        
+        Args:
+            provider (str): Provider name to unblock
+        
+        Source/Caller:
+            - Called by: Admin unblock endpoint
+        
+        SOLID Principle Applied:
+            - SRP: Only handles unblocking
+        """
+        get_quota_tracker().manually_unblock_provider(provider)
+        
+        shared_tracker = get_redis_quota_tracker()
+        if shared_tracker is not None:
+            await shared_tracker.manually_unblock_provider(provider)
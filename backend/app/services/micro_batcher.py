@@ -0,0 +1,145 @@
+"""
+Micro-Batcher
+Coalesces concurrent single requests into small batches.
+
+SOLID Principles Applied:
+    - SRP: Only collects and releases batches; the flush callback does the work
+    - OCP: Any keyed workload can be batched by passing a different callback
+    - DIP: Depends on a flush callable, not on AIService or the adapters
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Set, Tuple
+
+
+# Flush callback: items of one batch -> one result per item, in order
+FlushFn = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class MicroBatcher:
+    """
+    Time/size-windowed batcher for items sharing a key.
+    
+    The first item for a key opens a window of `max_wait` seconds. The
+    window is flushed when it expires or when `max_items` items have
+    arrived, whichever happens first. Each caller awaits the result for its
+    own item.
+    
+    Attributes:
+        max_items (int): Items that trigger an immediate flush
+        max_wait (float): Longest time, in seconds, an item waits for partners
+        _flush_fn (FlushFn): Processes one batch
+        _pending (Dict): Key -> open batch of (item, future) pairs
+        _tasks (Set[asyncio.Task]): Running flushes, referenced until done
+    
+    SOLID Principle Applied:
+        - SRP: Only manages batching windows
+    """
+    
+    def __init__(self, flush_fn: FlushFn, max_items: int, max_wait: float):
+        """
+        Initialize micro-batcher.
+        
+        Args:
+            flush_fn: Coroutine function processing one batch
+            max_items: Items that trigger an immediate flush
+            max_wait: Longest time, in seconds, an item waits for partners
+        
+        Raises:
+            ValueError: If max_items is less than 1
+        """
+        if max_items < 1:
+            raise ValueError(f"max_items must be at least 1, got {max_items}")
+        
+        self.max_items = max_items
+        self.max_wait = max_wait
+        self._flush_fn = flush_fn
+        self._pending: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """
+        Add an item to the open batch for its key and wait for its result.
+        
+        Args:
+            key: Items with equal keys may be processed together
+            item: Item to process
+        
+        Returns:
+            Any: Result the flush callback produced for this item
+        
+        Source/Caller:
+            - Called by: AIService.process_ai_request
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self.max_wait, self._flush, key, batch)
+        
+        batch.append((item, future))
+        if len(batch) >= self.max_items:
+            self._flush(key, batch)
+        
+        return await future
+    
+    def _flush(self, key: Hashable, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """
+        Close a batch and start processing it.
+        
+        Called twice per batch when it fills up before its window expires;
+        the second call finds the batch already closed and does nothing.
+        
+        Args:
+            key: Key of the batch
+            batch: The batch to close
+        
+        Source/Caller:
+            - Called by: submit (batch full), event loop timer (window expired)
+        """
+        if self._pending.get(key) is not batch:
+            return
+        
+        del self._pending[key]
+        
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """
+        Process a closed batch and hand each caller its result.
+        
+        Every caller's future is settled: if the flush is cancelled (e.g. at
+        shutdown) the futures are cancelled, and items the flush callback
+        returned no result for get a RuntimeError.
+        
+        Args:
+            batch: (item, future) pairs of the batch
+        
+        Source/Caller:
+            - Called by: _flush (as a task)
+        """
+        try:
+            results = await self._flush_fn([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            for _, future in batch:
+                future.cancel()
+            raise
+        
+        for (_, future), result in zip(batch, results):
+            # Callers that gave up (e.g. client disconnected) are skipped
+            if not future.done():
+                future.set_result(result)
+        
+        for _, future in batch[len(results):]:
+            if not future.done():
+                future.set_exception(RuntimeError(
+                    f"Batch flush returned {len(results)} results for {len(batch)} items"
+                ))
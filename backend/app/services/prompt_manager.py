@@ -8,8 +8,10 @@ SOLID Principles Applied:
     - ISP: Minimal interface with focused methods
     - DIP: Works with generic types (Dict, str), not concrete implementations
 """
-from typing import Dict, Any
+from typing import Dict, Any, Mapping
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 
 class PromptTemplate(str, Enum):
@@ -47,9 +49,9 @@ class PromptManager:
         - ISP: Provides only necessary methods
     """
     
-    # Prompt Templates Dictionary
+    # Prompt Templates Dictionary (keyed by template value)
     TEMPLATES: Dict[str, str] = {
-        PromptTemplate.DATA_ANALYSIS: """
+        PromptTemplate.DATA_ANALYSIS.value: """
 You are a data analyst. Analyze the provided dataset and provide:
 1. Key statistics and patterns
 2. Notable trends or anomalies
@@ -59,7 +61,7 @@ You are a data analyst. Analyze the provided dataset and provide:
 Format your response in a clear, structured manner.
 """,
         
-        PromptTemplate.DATA_CLEANING: """
+        PromptTemplate.DATA_CLEANING.value: """
 You are a data quality expert. Review the provided dataset and identify:
 1. Missing or null values
 2. Data type inconsistencies
@@ -70,7 +72,7 @@ You are a data quality expert. Review the provided dataset and identify:
 Provide specific recommendations for cleaning each issue.
 """,
         
-        PromptTemplate.DATA_TRANSFORMATION: """
+        PromptTemplate.DATA_TRANSFORMATION.value: """
 You are a data engineer. Transform the provided data according to the requirements:
 1. Apply the specified transformations
 2. Ensure data integrity is maintained
@@ -80,7 +82,7 @@ You are a data engineer. Transform the provided data according to the requiremen
 Return the transformed data in the requested format.
 """,
         
-        PromptTemplate.CATEGORIZATION: """
+        PromptTemplate.CATEGORIZATION.value: """
 You are a classification expert. Categorize the provided items:
 1. Analyze each item's characteristics
 2. Assign appropriate categories
@@ -90,7 +92,7 @@ You are a classification expert. Categorize the provided items:
 Return results in a structured format with categories clearly labeled.
 """,
         
-        PromptTemplate.SENTIMENT_ANALYSIS: """
+        PromptTemplate.SENTIMENT_ANALYSIS.value: """
 You are a sentiment analysis expert. Analyze the provided text data:
 1. Determine overall sentiment (positive/negative/neutral)
 2. Identify key emotional indicators
@@ -100,6 +102,19 @@ You are a sentiment analysis expert. Analyze the provided text data:
 Return results in a structured format with clear sentiment labels.
 """,
     }
+    # Strip the literals' surrounding newlines once, so every call returns
+    # the canonical text without re-slicing it
+    TEMPLATES = {name: text.strip() for name, text in TEMPLATES.items()}
+    
+    # Read-only template descriptions (keyed by template value)
+    _TEMPLATE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+        PromptTemplate.DATA_ANALYSIS.value: "Analyze and summarize datasets",
+        PromptTemplate.DATA_CLEANING.value: "Identify data quality issues",
+        PromptTemplate.DATA_TRANSFORMATION.value: "Transform data structure",
+        PromptTemplate.CATEGORIZATION.value: "Categorize items into groups",
+        PromptTemplate.SENTIMENT_ANALYSIS.value: "Analyze text sentiment",
+        PromptTemplate.CUSTOM.value: "Use custom instructions",
+    })
     
     @classmethod
     def get_prompt(cls, template: PromptTemplate | str, custom_instructions: str = "") -> str:
@@ -113,6 +128,9 @@ Return results in a structured format with clear sentiment labels.
         Returns:
             str: Formatted instruction prompt
         
+        Results are memoized per (template, custom_instructions) pair, so
+        templates must be registered in TEMPLATES before first use.
+        
         Source/Caller:
             - Called by: AIService.process_ai_request
             - Input Source: API route handler
@@ -121,15 +139,10 @@ Return results in a structured format with clear sentiment labels.
             - SRP: Only retrieves and formats prompts
             - OCP: New templates added via TEMPLATES dict
         """
-        if template == PromptTemplate.CUSTOM:
-            return custom_instructions
-        
-        base_prompt = cls.TEMPLATES.get(template, "")
-        
-        if custom_instructions:
-            return f"{base_prompt}\n\nAdditional Instructions:\n{custom_instructions}"
+        if isinstance(template, PromptTemplate):
+            template = template.value
         
-        return base_prompt
+        return _build_prompt(template, custom_instructions)
     
     @classmethod
     def list_templates(cls) -> Dict[str, str]:
@@ -137,20 +150,39 @@ Return results in a structured format with clear sentiment labels.
         Get all available prompt templates.
         
         Returns:
-            Dict[str, str]: Dictionary of template names and descriptions
+            Dict[str, str]: Copy of the template names and descriptions
         
         Source/Caller:
             - Called by: API documentation endpoints
         
         SOLID Principle Applied:
             - SRP: Only provides template information
-            - OCP: Dynamically reads from enum
+            - OCP: Descriptions registered in one class-level mapping
         """
-        return {
-            PromptTemplate.DATA_ANALYSIS: "Analyze and summarize datasets",
-            PromptTemplate.DATA_CLEANING: "Identify data quality issues",
-            PromptTemplate.DATA_TRANSFORMATION: "Transform data structure",
-            PromptTemplate.CATEGORIZATION: "Categorize items into groups",
-            PromptTemplate.SENTIMENT_ANALYSIS: "Analyze text sentiment",
-            PromptTemplate.CUSTOM: "Use custom instructions",
-        }
+        return dict(cls._TEMPLATE_DESCRIPTIONS)
+
+
+@lru_cache(maxsize=1024)
+def _build_prompt(template: str, custom_instructions: str) -> str:
+    """
+    Build the instruction prompt for a template value.
+    
+    Args:
+        template (str): Template value or custom prompt marker
+        custom_instructions (str): Additional instructions to append
+    
+    Returns:
+        str: Formatted instruction prompt
+    
+    Source/Caller:
+        - Called by: PromptManager.get_prompt
+    """
+    if template == PromptTemplate.CUSTOM.value:
+        return custom_instructions
+    
+    base_prompt = PromptManager.TEMPLATES.get(template, "")
+    
+    if not custom_instructions:
+        return base_prompt
+    
+    return f"{base_prompt}\n\nAdditional Instructions:\n{custom_instructions}"
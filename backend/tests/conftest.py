@@ -0,0 +1,86 @@
+"""
+Shared Test Configuration
+Runs plain coroutine tests on one event loop kept for the whole session.
+
+Coroutine tests marked with @pytest.mark.asyncio are left to pytest-asyncio.
+Unmarked `async def` tests are driven here on a single asyncio.Runner, so
+they skip the per-test loop creation and teardown.
+
+Tests marked @pytest.mark.benchmark only report numbers; they are skipped
+unless selected with -m (e.g. `pytest -m benchmark`).
+
+The validate_config fixture is shared by the AIModelConfig validation tests.
+
+Troubleshooting Guide:
+- If an unmarked async test is skipped: Check pytest_pyfunc_call runs first (tryfirst)
+- If a test leaks tasks into the next one: Mark it @pytest.mark.asyncio for a fresh loop
+- If benchmarks never run: Select them explicitly with -m benchmark
+"""
+import asyncio
+import inspect
+
+import pytest
+
+from app.schemas.ai_schemas import AIModelConfig
+
+
+# Event loop shared by every unmarked coroutine test
+_RUNNER = asyncio.Runner()
+
+
+def pytest_configure(config):
+    """Register the benchmark marker."""
+    config.addinivalue_line("markers", "benchmark: report-only cost and CPU benchmarks, skipped by default")
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip benchmark tests unless a marker expression was given.
+    
+    Args:
+        config: pytest configuration
+        items: Collected test items
+    """
+    if config.getoption("markexpr"):
+        return
+    
+    skip_benchmark = pytest.mark.skip(reason="benchmark; run with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """
+    Run an unmarked coroutine test on the session runner.
+    
+    Args:
+        pyfuncitem: Test function item being called
+    
+    Returns:
+        True when the test was run here, None to leave it to other plugins
+    """
+    if pyfuncitem.get_closest_marker("asyncio") or not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    
+    funcargs = pyfuncitem.funcargs
+    testargs = {arg: funcargs[arg] for arg in pyfuncitem._fixtureinfo.argnames}
+    _RUNNER.run(pyfuncitem.obj(**testargs))
+    return True
+
+
+@pytest.fixture(scope="session")
+def validate_config():
+    """
+    AIModelConfig's bound core validator, taking a dict of fields.
+    
+    AIModelConfig has no custom __init__, so calling the validator directly
+    behaves like the constructor without BaseModel.__init__ overhead.
+    """
+    return AIModelConfig.__pydantic_validator__.validate_python
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Close the shared event loop once all tests have run."""
+    _RUNNER.close()
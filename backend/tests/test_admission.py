@@ -0,0 +1,85 @@
+"""
+Admission Control Tests
+Tests for the per-provider in-flight request limiter.
+
+Test Coverage:
+- Limit enforcement and wake-up on release
+- Runtime resizing of the limit
+- Per-provider controller lookup
+
+Troubleshooting Guide:
+- If waiters never wake: Check release() notifies the condition
+- If resize tests fail: Verify resize() calls notify_all()
+"""
+import asyncio
+
+import pytest
+
+from app.core.admission import Admission, get_admission
+
+
+class TestAdmission:
+    """
+    Test suite for Admission controller.
+    
+    What it tests:
+    - At most max_concurrent requests admitted at once
+    - Released slots are handed to waiting requests
+    - Limit changes take effect for waiting requests
+    
+    Common issues:
+    - Tests hang → A waiter is not being notified
+    """
+    
+    @pytest.mark.asyncio
+    async def test_blocks_when_limit_reached(self):
+        """
+        Test: Acquire beyond the limit waits until a slot is released
+        Input: max_concurrent=1, two acquires
+        Expected: Second acquire completes only after release
+        """
+        admission = Admission(max_concurrent=1)
+        await admission.acquire()
+        
+        waiter = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        
+        await admission.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert admission.in_flight == 1
+    
+    @pytest.mark.asyncio
+    async def test_resize_admits_waiters(self):
+        """
+        Test: Raising the limit admits requests already waiting
+        Input: max_concurrent=1, resize to 2 while one request waits
+        Expected: Waiting request admitted without any release
+        """
+        admission = Admission(max_concurrent=1)
+        await admission.acquire()
+        
+        waiter = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+        
+        await admission.resize(2)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert admission.in_flight == 2
+    
+    def test_invalid_limit_rejected(self):
+        """
+        Test: Limits below one are rejected
+        Input: max_concurrent=0
+        Expected: ValueError raised
+        """
+        with pytest.raises(ValueError):
+            Admission(max_concurrent=0)
+    
+    def test_get_admission_is_shared_per_provider(self):
+        """
+        Test: Same provider returns the same controller
+        Input: get_admission called twice for "gemini", once for "openai"
+        Expected: Same instance for gemini, different for openai
+        """
+        assert get_admission("gemini") is get_admission("gemini")
+        assert get_admission("gemini") is not get_admission("openai")
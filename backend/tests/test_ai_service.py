@@ -2,15 +2,23 @@
 AI Service Tests
 Unit tests for AI service, adapters, and prompt manager.
 """
+import asyncio
 import pytest
+from functools import partial
 from unittest.mock import Mock, AsyncMock, patch
+from fastapi import HTTPException
 from app.schemas.ai_schemas import (
     AIRequest,
     AIResponse,
     AIProviderType,
     AIModelConfig,
 )
+from app.core.admission import Admission
+from app.core.errors import InvalidInputError
+from app.services.ai_adapters import BaseAIAdapter
+from app.services.ai_adapters.base_adapter import AIAdapterError
 from app.services.ai_service import AIService
+from app.services.micro_batcher import MicroBatcher
 from app.services.prompt_manager import PromptManager, PromptTemplate
 
 
@@ -77,6 +85,16 @@ class TestAIService:
         adapter = AIService._get_adapter(AIProviderType.VERTEX_AI)
         assert isinstance(adapter, VertexAIAdapter)
     
+    def test_get_adapter_reuses_instance(self):
+        """Test adapter factory builds one adapter per provider and reuses it."""
+        with patch("app.services.ai_adapters.GeminiAdapter") as adapter_class, \
+                patch.dict(AIService._adapter_instances, clear=True):
+            first = AIService._get_adapter(AIProviderType.GEMINI)
+            second = AIService._get_adapter(AIProviderType.GEMINI)
+        
+        assert first is second
+        adapter_class.assert_called_once_with(http_client=None)
+    
     @pytest.mark.asyncio
     async def test_process_ai_request_structure(self):
         """Test AI request processing structure (mocked)."""
@@ -96,7 +114,7 @@ class TestAIService:
         )
         
         with patch.object(AIService, '_get_adapter') as mock_get_adapter:
-            mock_adapter = Mock()
+            mock_adapter = Mock(spec=BaseAIAdapter)
             mock_adapter.call_ai = AsyncMock(return_value=mock_response)
             mock_get_adapter.return_value = mock_adapter
             
@@ -105,6 +123,273 @@ class TestAIService:
             assert response.provider == AIProviderType.GEMINI
             assert response.content == "Test response"
             assert response.usage["total_tokens"] == 30
+    
+    @pytest.mark.asyncio
+    async def test_stream_ai_request_events(self):
+        """Test streamed request emits delta events followed by done (mocked)."""
+        request = AIRequest(
+            provider=AIProviderType.CLAUDE,
+            instruction_prompt="Test prompt",
+            input_data={"test": "data"},
+            stream=True
+        )
+        
+        async def fake_stream(**kwargs):
+            for chunk in ("Hello", " world"):
+                yield chunk
+        
+        with patch.object(AIService, '_get_adapter') as mock_get_adapter:
+            mock_adapter = Mock(spec=BaseAIAdapter)
+            mock_adapter.stream_ai = fake_stream
+            mock_get_adapter.return_value = mock_adapter
+            
+            events = await AIService.stream_ai_request(request)
+            frames = [frame async for frame in events]
+        
+        assert frames[0] == b'event: delta\ndata: {"content":"Hello"}\n\n'
+        assert frames[1].startswith(b"event: delta")
+        assert frames[-1].startswith(b"event: done")
+    
+    @pytest.mark.asyncio
+    async def test_process_ai_requests_isolates_failures(self):
+        """Test concurrent requests keep order and one failure does not fail the rest (mocked)."""
+        requests = [
+            AIRequest(
+                provider=AIProviderType.OPENAI,
+                instruction_prompt="Test prompt",
+                input_data={"row": i}
+            )
+            for i in range(3)
+        ]
+        
+        async def fake_call_ai(**kwargs):
+            if kwargs["input_data"]["row"] == 1:
+                raise InvalidInputError(provider="openai", message="bad row")
+            return AIResponse(
+                provider=AIProviderType.OPENAI,
+                content=str(kwargs["input_data"]["row"]),
+                usage={},
+                model="gpt-4o-mini"
+            )
+        
+        with patch.object(AIService, '_get_adapter') as mock_get_adapter:
+            mock_adapter = Mock(spec=BaseAIAdapter)
+            mock_adapter.call_ai = fake_call_ai
+            mock_get_adapter.return_value = mock_adapter
+            
+            results = await AIService.process_ai_requests(requests)
+        
+        assert [r.content for r in (results[0], results[2])] == ["0", "2"]
+        assert isinstance(results[1], HTTPException)
+        assert results[1].status_code == 400
+    
+    @pytest.mark.asyncio
+    async def test_process_ai_batch_packs_shared_prompt(self):
+        """Test batch packs same-prompt requests into one call and retries unanswered items (mocked)."""
+        requests = [
+            AIRequest(
+                provider=AIProviderType.OPENAI,
+                instruction_prompt="Classify",
+                input_data={"row": i}
+            )
+            for i in range(3)
+        ] + [
+            AIRequest(
+                provider=AIProviderType.OPENAI,
+                instruction_prompt="Summarize",
+                input_data={"row": 3}
+            )
+        ]
+        calls = []
+        
+        async def fake_call_ai(**kwargs):
+            calls.append(kwargs["input_data"])
+            if "items" in kwargs["input_data"]:
+                # Packed answer omits item 2, which must be retried on its own
+                content = '```json\n[{"id": 0, "output": "a"}, {"id": 1, "output": {"label": "b"}}]\n```'
+            else:
+                content = f"single {kwargs['input_data']['row']}"
+            return AIResponse(
+                provider=AIProviderType.OPENAI,
+                content=content,
+                usage={"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+                model="gpt-4o-mini"
+            )
+        
+        with patch.object(AIService, '_get_adapter') as mock_get_adapter:
+            mock_adapter = Mock(spec=BaseAIAdapter)
+            mock_adapter.call_ai = fake_call_ai
+            mock_adapter.call_ai_batch = partial(BaseAIAdapter.call_ai_batch, mock_adapter)
+            mock_adapter._split_batch_output = BaseAIAdapter._split_batch_output
+            mock_get_adapter.return_value = mock_adapter
+            
+            results = await AIService.process_ai_batch(requests)
+        
+        assert [r.content for r in results] == ["a", '{"label":"b"}', "single 2", "single 3"]
+        assert len(calls) == 3
+        assert results[1].usage == {}
+        assert AIService.total_usage(results)["total_tokens"] == 36
+    
+    @pytest.mark.asyncio
+    async def test_process_ai_batch_salvages_truncated_answer(self):
+        """Test a cut-off packed answer keeps its complete items and retries only the rest (mocked)."""
+        requests = [
+            AIRequest(
+                provider=AIProviderType.OPENAI,
+                instruction_prompt="Classify",
+                input_data={"row": i},
+                ai_config=AIModelConfig(max_tokens=1000)
+            )
+            for i in range(3)
+        ]
+        calls = []
+        
+        async def fake_call_ai(**kwargs):
+            calls.append((kwargs["input_data"], kwargs["model_config"].max_tokens))
+            if "items" in kwargs["input_data"]:
+                # Prose with brackets before the array; the answer stops mid-item 2
+                content = 'Labels [see notes]:\n```json\n[{"id": 0, "output": "a"}, {"id": 1, "output": ["b"]}, {"id": 2, "outp'
+            else:
+                content = f"single {kwargs['input_data']['row']}"
+            return AIResponse(
+                provider=AIProviderType.OPENAI,
+                content=content,
+                usage={},
+                model="gpt-4"
+            )
+        
+        with patch.object(AIService, '_get_adapter') as mock_get_adapter:
+            mock_adapter = Mock(spec=BaseAIAdapter)
+            mock_adapter.DEFAULT_MODEL = "gpt-4"
+            mock_adapter.call_ai = fake_call_ai
+            mock_adapter.call_ai_batch = partial(BaseAIAdapter.call_ai_batch, mock_adapter)
+            mock_adapter._split_batch_output = BaseAIAdapter._split_batch_output
+            mock_get_adapter.return_value = mock_adapter
+            
+            results = await AIService.process_ai_batch(requests)
+        
+        assert [r.content for r in results] == ["a", '["b"]', "single 2"]
+        # Packed budget is 3 x 1000 (under gpt-4's 4096 output limit); the retry keeps 1000
+        assert [max_tokens for _, max_tokens in calls] == [3000, 1000]
+        assert calls[1][0] == {"row": 2}
+    
+    @pytest.mark.asyncio
+    async def test_process_ai_batch_isolates_failed_retry(self):
+        """Test a failed retry of an unanswered item fails only that item (mocked)."""
+        requests = [
+            AIRequest(
+                provider=AIProviderType.OPENAI,
+                instruction_prompt="Classify",
+                input_data={"row": i}
+            )
+            for i in range(3)
+        ]
+        
+        async def fake_call_ai(**kwargs):
+            if "items" in kwargs["input_data"]:
+                # Packed answer only covers item 0; items 1 and 2 are retried
+                content = '[{"id": 0, "output": "a"}]'
+            elif kwargs["input_data"]["row"] == 1:
+                raise AIAdapterError(message="bad row", provider="openai")
+            else:
+                content = f"single {kwargs['input_data']['row']}"
+            return AIResponse(
+                provider=AIProviderType.OPENAI,
+                content=content,
+                usage={},
+                model="gpt-4o-mini"
+            )
+        
+        with patch.object(AIService, '_get_adapter') as mock_get_adapter:
+            mock_adapter = Mock(spec=BaseAIAdapter)
+            mock_adapter.call_ai = fake_call_ai
+            mock_adapter.call_ai_batch = partial(BaseAIAdapter.call_ai_batch, mock_adapter)
+            mock_adapter._split_batch_output = BaseAIAdapter._split_batch_output
+            mock_get_adapter.return_value = mock_adapter
+            
+            results = await AIService.process_ai_batch(requests)
+        
+        assert [results[0].content, results[2].content] == ["a", "single 2"]
+        assert isinstance(results[1], HTTPException)
+        assert results[1].status_code == 500
+        assert results[1].detail["message"] == "bad row"
+    
+    @pytest.mark.asyncio
+    async def test_micro_batched_requests_share_one_admission_slot(self):
+        """Test micro-batched requests wait without a slot and each flush holds one (mocked)."""
+        admission = Admission(max_concurrent=1)
+        batcher = MicroBatcher(AIService._flush_micro_batch, max_items=2, max_wait=0.01)
+        requests = [
+            AIRequest(
+                provider=AIProviderType.OPENAI,
+                instruction_prompt="Classify",
+                input_data={"row": i}
+            )
+            for i in range(3)
+        ]
+        slots_in_call = []
+        
+        def respond(content):
+            slots_in_call.append(admission.in_flight)
+            return AIResponse(
+                provider=AIProviderType.OPENAI,
+                content=content,
+                usage={},
+                model="gpt-4o-mini"
+            )
+        
+        async def fake_call_ai_batch(**kwargs):
+            return [respond(f"packed {item['row']}") for item in kwargs["input_data_list"]]
+        
+        async def fake_call_ai(**kwargs):
+            return respond(f"single {kwargs['input_data']['row']}")
+        
+        with patch.object(AIService, '_get_adapter') as mock_get_adapter, \
+                patch.object(AIService, '_micro_batcher', batcher), \
+                patch("app.services.ai_service.get_admission", return_value=admission):
+            mock_adapter = Mock(spec=BaseAIAdapter)
+            mock_adapter.call_ai = fake_call_ai
+            mock_adapter.call_ai_batch = fake_call_ai_batch
+            mock_get_adapter.return_value = mock_adapter
+            
+            # A full batch of 2 flushes at once; the third flushes alone after max_wait
+            results = await asyncio.wait_for(
+                asyncio.gather(*(AIService.process_ai_request(r) for r in requests)),
+                timeout=1
+            )
+        
+        assert [r.content for r in results] == ["packed 0", "packed 1", "single 2"]
+        assert slots_in_call == [1, 1, 1]
+        assert admission.in_flight == 0
+    
+    def test_total_usage_skips_failures(self):
+        """Test batch usage sums successful responses and treats missing counters as zero."""
+        results = [
+            AIResponse(
+                provider=AIProviderType.OPENAI,
+                content="a",
+                usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+                model="gpt-4o-mini"
+            ),
+            HTTPException(status_code=400),
+            AIResponse(
+                provider=AIProviderType.GEMINI,
+                content="b",
+                usage={"prompt_tokens": 3},
+                model="gemini-pro"
+            ),
+        ]
+        
+        assert AIService.total_usage(results) == {
+            "prompt_tokens": 13,
+            "completion_tokens": 5,
+            "total_tokens": 15
+        }
+        assert AIService.total_usage([]) == {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0
+        }
 
 
 class TestAISchemas:
@@ -0,0 +1,156 @@
+"""
+Micro-Batcher Tests
+Tests for coalescing concurrent requests into batches.
+
+Test Coverage:
+- Size-triggered and time-triggered flushes
+- Keys kept in separate batches
+- Flush failures delivered to every caller
+- Cancelled flushes and missing results settle every caller
+
+Troubleshooting Guide:
+- If tests hang: Check the window timer calls _flush
+- If batches mix keys: Verify _pending is keyed per submit key
+"""
+import asyncio
+
+import pytest
+
+from app.services.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher:
+    """
+    Test suite for MicroBatcher.
+    
+    What it tests:
+    - Items with the same key are flushed together, in order
+    - Each caller receives the result for its own item
+    - Errors from the flush callback reach every caller
+    - No caller is left waiting on a cancelled or short flush
+    
+    Common issues:
+    - Tests hang → A batch is never flushed
+    """
+    
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self):
+        """
+        Test: Reaching max_items flushes immediately
+        Input: max_items=3, max_wait=60s, three submits with one key
+        Expected: One flush with all three items; results routed per caller
+        """
+        batches = []
+        
+        async def flush(items):
+            batches.append(items)
+            return [item * 10 for item in items]
+        
+        batcher = MicroBatcher(flush, max_items=3, max_wait=60)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit("k", i) for i in range(3))),
+            timeout=1
+        )
+        
+        assert results == [0, 10, 20]
+        assert batches == [[0, 1, 2]]
+    
+    @pytest.mark.asyncio
+    async def test_window_expiry_flushes_per_key(self):
+        """
+        Test: An unfilled window flushes after max_wait, one batch per key
+        Input: max_items=10, max_wait=10ms, items under keys "a" and "b"
+        Expected: Two flushes, each holding only its key's items
+        """
+        batches = []
+        
+        async def flush(items):
+            batches.append(items)
+            return items
+        
+        batcher = MicroBatcher(flush, max_items=10, max_wait=0.01)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit("a", 1),
+                batcher.submit("b", 2),
+                batcher.submit("a", 3)
+            ),
+            timeout=1
+        )
+        
+        assert results == [1, 2, 3]
+        assert sorted(batches) == [[1, 3], [2]]
+    
+    @pytest.mark.asyncio
+    async def test_flush_error_reaches_all_callers(self):
+        """
+        Test: A failing flush raises in every caller of the batch
+        Input: Flush callback raising RuntimeError, two submits
+        Expected: Both submits raise RuntimeError
+        """
+        async def flush(items):
+            raise RuntimeError("provider down")
+        
+        batcher = MicroBatcher(flush, max_items=2, max_wait=60)
+        
+        results = await asyncio.gather(
+            batcher.submit("k", 1),
+            batcher.submit("k", 2),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(r, RuntimeError) for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_cancels_callers(self):
+        """
+        Test: Cancelling a running flush cancels every caller of the batch
+        Input: Flush callback that never returns, cancelled after two submits
+        Expected: Both submits raise CancelledError instead of hanging
+        """
+        started = asyncio.Event()
+        
+        async def flush(items):
+            started.set()
+            await asyncio.Event().wait()
+        
+        batcher = MicroBatcher(flush, max_items=2, max_wait=60)
+        
+        callers = asyncio.gather(
+            batcher.submit("k", 1),
+            batcher.submit("k", 2),
+            return_exceptions=True
+        )
+        await started.wait()
+        for task in batcher._tasks:
+            task.cancel()
+        
+        results = await asyncio.wait_for(callers, timeout=1)
+        
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_short_flush_fails_unanswered_callers(self):
+        """
+        Test: Items the flush returned no result for fail instead of hanging
+        Input: Flush callback returning one result for a batch of two
+        Expected: First caller gets its result, second raises RuntimeError
+        """
+        async def flush(items):
+            return items[:1]
+        
+        batcher = MicroBatcher(flush, max_items=2, max_wait=60)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit("k", 1),
+                batcher.submit("k", 2),
+                return_exceptions=True
+            ),
+            timeout=1
+        )
+        
+        assert results[0] == 1
+        assert isinstance(results[1], RuntimeError)
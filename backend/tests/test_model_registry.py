@@ -2,6 +2,8 @@
 Test Model Registry
 Tests for model specifications, token validation, cost estimation, and capability filtering.
 """
+import dataclasses
+import numpy as np
 import pytest
 from app.core.model_registry import (
     ModelSpec,
@@ -11,20 +13,45 @@ from app.core.model_registry import (
     get_models_by_capability,
     get_model_summary,
     validate_token_count,
+    validate_token_count_spec,
+    validate_token_count_batch,
+    TOKENS_OK,
+    TOKENS_INPUT_EXCEEDS_CONTEXT,
+    TOKENS_OUTPUT_EXCEEDS_LIMIT,
+    TOKENS_TOTAL_EXCEEDS_CONTEXT,
     estimate_cost,
-    MODEL_REGISTRY
+    estimate_cost_batch,
+    MODEL_REGISTRY,
+    _COST_IN
 )
 
 
+# Capability -> bit, and model ID -> capability bitmask, built once at import
+_CAP_BITS = {capability: 1 << i for i, capability in enumerate(ModelCapability)}
+_CAP_MASKS = {
+    model_id: sum(_CAP_BITS[capability] for capability in spec.capabilities)
+    for model_id, spec in MODEL_REGISTRY.items()
+}
+
+
+def _model_ids_with(capability):
+    """Model IDs whose bitmask has the capability's bit set."""
+    bit = _CAP_BITS[capability]
+    return {model_id for model_id, mask in _CAP_MASKS.items() if mask & bit}
+
+
+@pytest.fixture(scope="session")
+def all_models():
+    """Every registered model, collected once per test session."""
+    return tuple(MODEL_REGISTRY.values())
+
+
 class TestModelRegistry:
     """Test suite for Model Registry functionality"""
     
     def test_registry_has_all_providers(self):
         """Test that all expected providers are in registry"""
-        providers = set()
-        for model_id in MODEL_REGISTRY.keys():
-            spec = MODEL_REGISTRY[model_id]
-            providers.add(spec.provider)
+        providers = {spec.provider for spec in MODEL_REGISTRY.values()}
         
         expected_providers = {"gemini", "openai", "claude", "deepseek", "vertex_ai"}
         assert providers == expected_providers, f"Expected {expected_providers}, got {providers}"
@@ -33,6 +60,11 @@ class TestModelRegistry:
         """Test that registry contains exactly 17 models"""
         assert len(MODEL_REGISTRY) == 17, f"Expected 17 models, got {len(MODEL_REGISTRY)}"
     
+    def test_registry_is_immutable(self):
+        """Test that the registry is a read-only view callers can share"""
+        with pytest.raises(TypeError):
+            MODEL_REGISTRY["x"] = None
+    
     def test_get_model_spec_valid(self):
         """Test getting valid model specifications"""
         spec = get_model_spec("gemini-pro")
@@ -72,70 +104,92 @@ class TestModelRegistry:
             assert model.provider == "gemini"
     
     def test_get_models_by_provider_invalid(self):
-        """Test invalid provider returns empty list"""
+        """Test invalid provider returns empty tuple"""
         models = get_models_by_provider("invalid-provider")
-        assert models == []
+        assert models == ()
     
     def test_get_models_by_capability_vision(self):
         """Test filtering models by vision capability"""
         models = get_models_by_capability(ModelCapability.VISION)
         assert len(models) >= 2  # At least gemini-pro-vision and gpt-4-vision
         
-        # Verify all have vision capability
-        for model in models:
-            assert ModelCapability.VISION in model.capabilities
+        # Same models as an independent bitmask scan
+        assert {model.model_id for model in models} == _model_ids_with(ModelCapability.VISION)
     
     def test_get_models_by_capability_code_generation(self):
         """Test filtering models by code generation capability"""
         models = get_models_by_capability(ModelCapability.CODE_GENERATION)
         assert len(models) >= 1
         
-        for model in models:
-            assert ModelCapability.CODE_GENERATION in model.capabilities
+        assert {model.model_id for model in models} == _model_ids_with(ModelCapability.CODE_GENERATION)
     
-    def test_validate_token_count_valid(self):
-        """Test token validation with valid counts"""
-        is_valid, message = validate_token_count("gemini-pro", 10000, 2000)
-        assert is_valid is True
-        assert message == ""
-    
-    def test_validate_token_count_exceeds_context(self):
-        """Test token validation when exceeding context window"""
+    @pytest.mark.parametrize("model_id,input_tokens,output_tokens,expect_valid,needle", [
+        ("gemini-pro", 10000, 2000, True, ""),
         # GPT-4 has 8K context window
-        is_valid, message = validate_token_count("gpt-4", 7000, 2000)
-        assert is_valid is False
-        assert "exceeds context window" in message
-    
-    def test_validate_token_count_exceeds_output_limit(self):
-        """Test token validation when exceeding output token limit"""
+        ("gpt-4", 7000, 2000, False, "exceeds context window"),
         # GPT-4 has 4K max output tokens
-        is_valid, message = validate_token_count("gpt-4", 1000, 5000)
-        assert is_valid is False
-        assert "exceeds model limit" in message
+        ("gpt-4", 1000, 5000, False, "exceeds model limit"),
+        ("non-existent-model", 1000, 500, False, "Unknown model"),
+    ])
+    def test_validate_token_count(self, model_id, input_tokens, output_tokens, expect_valid, needle):
+        """Test token validation verdict and message (empty message when valid)"""
+        is_valid, message = validate_token_count(model_id, input_tokens, output_tokens)
+        assert is_valid is expect_valid
+        if needle:
+            assert needle in message
+        else:
+            assert message == ""
     
-    def test_validate_token_count_invalid_model(self):
-        """Test token validation with invalid model"""
-        is_valid, message = validate_token_count("non-existent-model", 1000, 500)
-        assert is_valid is False
-        assert "Unknown model" in message
+    def test_validate_token_count_spec_matches_by_id(self):
+        """Test validation against a resolved spec agrees with the ID-based check"""
+        spec = get_model_spec("gpt-4")
+        for counts in [(1000, 500), (7000, 2000), (1000, 5000)]:
+            assert validate_token_count_spec(spec, *counts) == validate_token_count("gpt-4", *counts)
     
-    def test_estimate_cost_gemini_pro(self):
-        """Test cost estimation for Gemini Pro"""
-        cost = estimate_cost("gemini-pro", input_tokens=1000, output_tokens=500)
-        expected = (1000 / 1000 * 0.00025) + (500 / 1000 * 0.0005)
-        assert abs(cost - expected) < 0.000001
+    def test_validate_token_count_batch_codes(self):
+        """Test batch validation reports the first failing check per candidate"""
+        # GPT-4: 8K context window, 4K max output tokens
+        codes = validate_token_count_batch(
+            get_model_spec("gpt-4"),
+            [1000, 9000, 1000, 7000],
+            [500, 100, 5000, 2000]
+        )
+        assert codes.tolist() == [
+            TOKENS_OK,
+            TOKENS_INPUT_EXCEEDS_CONTEXT,
+            TOKENS_OUTPUT_EXCEEDS_LIMIT,
+            TOKENS_TOTAL_EXCEEDS_CONTEXT
+        ]
     
-    def test_estimate_cost_gpt4_turbo(self):
-        """Test cost estimation for GPT-4 Turbo"""
-        cost = estimate_cost("gpt-4-turbo-preview", input_tokens=1000, output_tokens=500)
-        expected = (1000 / 1000 * 0.01) + (500 / 1000 * 0.03)
-        assert abs(cost - expected) < 0.000001
+    def test_estimate_cost_all_models(self, all_models):
+        """Test cost estimation for every model against its spec's per-1K rates"""
+        input_tokens, output_tokens = 1000, 500
+        
+        cost_in = np.fromiter((m.cost_per_1k_input for m in all_models), dtype=np.float64)
+        cost_out = np.fromiter((m.cost_per_1k_output for m in all_models), dtype=np.float64)
+        expected = (input_tokens / 1000) * cost_in + (output_tokens / 1000) * cost_out
+        
+        actual = [estimate_cost(m.model_id, input_tokens, output_tokens) for m in all_models]
+        assert np.allclose(actual, expected, rtol=0, atol=1e-9)
     
     def test_estimate_cost_invalid_model(self):
         """Test cost estimation with invalid model returns 0"""
         cost = estimate_cost("non-existent-model", input_tokens=1000, output_tokens=500)
         assert cost == 0.0
     
+    def test_estimate_cost_batch_matches_single(self):
+        """Test batch cost estimation agrees with per-model estimates"""
+        model_ids = ["gemini-pro", "gpt-4-turbo-preview", "deepseek-chat"]
+        costs = estimate_cost_batch(model_ids, [1000, 2000, 3000], [500, 100, 0])
+        
+        for model_id, i, o, cost in zip(model_ids, [1000, 2000, 3000], [500, 100, 0], costs):
+            assert abs(cost - estimate_cost(model_id, i, o)) < 0.000001
+    
+    def test_estimate_cost_batch_invalid_model(self):
+        """Test batch cost estimation rejects unknown models"""
+        with pytest.raises(KeyError):
+            estimate_cost_batch(["gpt-4", "non-existent-model"], [1000, 1000], [500, 500])
+    
     def test_get_model_summary(self):
         """Test getting model summary by provider"""
         summary = get_model_summary()
@@ -161,33 +215,36 @@ class TestModelRegistry:
     
     def test_model_spec_attributes(self):
         """Test that ModelSpec has all required attributes"""
-        spec = get_model_spec("gemini-pro")
+        expected = {
+            "model_id",
+            "provider",
+            "display_name",
+            "context_window",
+            "max_output_tokens",
+            "supports_system_message",
+            "capabilities",
+            "cost_per_1k_input",
+            "cost_per_1k_output",
+            "recommended_for",
+            "notes"
+        }
         
-        assert hasattr(spec, "model_id")
-        assert hasattr(spec, "provider")
-        assert hasattr(spec, "display_name")
-        assert hasattr(spec, "context_window")
-        assert hasattr(spec, "max_output_tokens")
-        assert hasattr(spec, "supports_system_message")
-        assert hasattr(spec, "capabilities")
-        assert hasattr(spec, "cost_per_1k_input")
-        assert hasattr(spec, "cost_per_1k_output")
-        assert hasattr(spec, "recommended_for")
-        assert hasattr(spec, "notes")
+        missing = expected - {field.name for field in dataclasses.fields(ModelSpec)}
+        assert not missing, f"ModelSpec lacks fields: {missing}"
     
-    def test_cheapest_model_comparison(self):
+    def test_cheapest_model_comparison(self, all_models):
         """Test finding cheapest models across providers"""
-        all_models = list(MODEL_REGISTRY.values())
-        cheapest = min(all_models, key=lambda m: m.cost_per_1k_input)
+        # Registry cost column, indexed like MODEL_REGISTRY
+        cheapest = all_models[int(np.argmin(_COST_IN))]
         
         # DeepSeek should be cheapest at $0.00014 per 1K tokens
         assert cheapest.provider == "deepseek"
         assert cheapest.cost_per_1k_input == 0.00014
     
-    def test_largest_context_window(self):
+    def test_largest_context_window(self, all_models):
         """Test finding model with largest context window"""
-        all_models = list(MODEL_REGISTRY.values())
-        largest = max(all_models, key=lambda m: m.context_window)
+        context = np.fromiter((m.context_window for m in all_models), dtype=np.int64)
+        largest = all_models[int(np.argmax(context))]
         
         # Gemini 1.5 Pro has 1M context window
         assert largest.model_id in ["gemini-1.5-pro", "vertex-gemini-1.5-pro"]
@@ -200,37 +257,42 @@ class TestModelRegistry:
         
         assert len(gemini_models) == len(vertex_models)
         
-        # Check each Vertex model has corresponding Gemini model
-        for vertex_model in vertex_models:
-            gemini_id = vertex_model.model_id.replace("vertex-", "")
-            gemini_model = get_model_spec(gemini_id)
-            
-            assert gemini_model is not None
-            assert vertex_model.context_window == gemini_model.context_window
-            assert vertex_model.max_output_tokens == gemini_model.max_output_tokens
+        # Pair each Vertex model with its Gemini counterpart once
+        pairs = [
+            (vertex_model, get_model_spec(vertex_model.model_id.removeprefix("vertex-")))
+            for vertex_model in vertex_models
+        ]
+        assert all(gemini_model is not None for _, gemini_model in pairs)
+        
+        # Compare limits column-wise
+        for field in ("context_window", "max_output_tokens"):
+            assert np.array_equal(
+                [getattr(v, field) for v, _ in pairs],
+                [getattr(g, field) for _, g in pairs]
+            ), f"Vertex {field} differs from Gemini"
 
 
 class TestModelCapabilities:
     """Test model capability filtering"""
     
-    def test_all_capabilities_exist(self):
+    def test_all_capabilities_exist(self, all_models):
         """Test all capability types are represented"""
-        capabilities = [
+        capabilities = {
             ModelCapability.TEXT_GENERATION,
             ModelCapability.CODE_GENERATION,
             ModelCapability.VISION,
             ModelCapability.FUNCTION_CALLING,
             ModelCapability.JSON_MODE,
             ModelCapability.STREAMING
-        ]
+        }
         
-        for capability in capabilities:
-            models = get_models_by_capability(capability)
-            assert len(models) > 0, f"No models found for capability: {capability}"
+        # One pass over the registry
+        represented = set().union(*(model.capabilities for model in all_models))
+        missing = capabilities - represented
+        assert not missing, f"No models found for capabilities: {missing}"
     
-    def test_text_generation_universal(self):
+    def test_text_generation_universal(self, all_models):
         """Test that all models support text generation"""
-        all_models = list(MODEL_REGISTRY.values())
         text_gen_models = get_models_by_capability(ModelCapability.TEXT_GENERATION)
         
         # All models should support text generation
@@ -240,6 +302,7 @@ class TestModelCapabilities:
 class TestCostComparison:
     """Test cost comparison scenarios"""
     
+    @pytest.mark.benchmark
     def test_cost_for_large_context(self):
         """Test cost for processing large document"""
         input_tokens = 50_000
@@ -265,6 +328,7 @@ class TestCostComparison:
         cheapest_model = min(costs, key=costs.get)
         print(f"\nCheapest for 50K input: {cheapest_model} at ${costs[cheapest_model]:.4f}")
     
+    @pytest.mark.benchmark
     def test_cost_for_high_volume(self):
         """Test cost for high-volume small requests"""
         input_tokens = 500
@@ -272,16 +336,18 @@ class TestCostComparison:
         num_requests = 10_000
         
         # Compare cheap models
-        models = ["gemini-pro", "gpt-3.5-turbo", "claude-3-haiku", "deepseek-chat"]
+        models = ["gemini-pro", "gpt-3.5-turbo", "claude-3-haiku-20240307", "deepseek-chat"]
         
-        total_costs = {}
-        for model_id in models:
-            per_request_cost = estimate_cost(model_id, input_tokens, output_tokens)
-            total_costs[model_id] = per_request_cost * num_requests
+        # One vectorized pass over the registry's cost arrays
+        total_costs = estimate_cost_batch(
+            models,
+            np.full(len(models), input_tokens),
+            np.full(len(models), output_tokens)
+        ) * num_requests
         
         print(f"\nHigh volume (10K requests) costs:")
-        for model_id, cost in sorted(total_costs.items(), key=lambda x: x[1]):
-            print(f"  {model_id}: ${cost:.2f}")
+        for i in np.argsort(total_costs):
+            print(f"  {models[i]}: ${total_costs[i]:.2f}")
 
 
 if __name__ == "__main__":
@@ -14,10 +14,33 @@ Troubleshooting Guide:
 - Wrong template content → Verify template text matches expected keywords
 - Custom prompt issues → Check CUSTOM template handling
 """
+import re
 import pytest
 from app.services.prompt_manager import PromptManager, PromptTemplate
 
 
+def _needles(*patterns):
+    """Compile keyword alternations ("a|b") checked against lowercased prompts."""
+    return [re.compile(pattern) for pattern in patterns]
+
+
+@pytest.fixture(scope="session")
+def rendered_templates():
+    """Every predefined template rendered once per test session, as (prompt, lowercased prompt)."""
+    return {
+        template: (prompt, prompt.lower())
+        for template in PromptTemplate
+        if template is not PromptTemplate.CUSTOM
+        for prompt in (PromptManager.get_prompt(template),)
+    }
+
+
+@pytest.fixture(scope="session")
+def listed_templates():
+    """Template listing fetched once per test session (tests only read it)."""
+    return PromptManager.list_templates()
+
+
 class TestPromptTemplateEnum:
     """
     Test suite for PromptTemplate enum.
@@ -72,70 +95,30 @@ class TestGetPrompt:
     - Additional instructions not appended → Check string concatenation
     """
     
-    def test_get_data_analysis_template(self):
-        """
-        Test: Retrieve DATA_ANALYSIS template
-        Input: PromptTemplate.DATA_ANALYSIS
-        Expected: Prompt contains data analyst keywords
+    @pytest.mark.parametrize("template,needles", [
+        # Each needle is an alternation compiled at import; it must match somewhere
+        (PromptTemplate.DATA_ANALYSIS, _needles("data analyst", "analyze", "insights")),
+        (PromptTemplate.DATA_CLEANING, _needles("data quality", "missing|null")),
+        (PromptTemplate.DATA_TRANSFORMATION, _needles("transform", "data engineer")),
+        (PromptTemplate.CATEGORIZATION, _needles("categor", "classification|classify")),
+        (PromptTemplate.SENTIMENT_ANALYSIS, _needles("sentiment", "positive|negative")),
+    ])
+    def test_get_predefined_template(self, template, needles, rendered_templates):
+        """
+        Test: Retrieve each predefined template
+        Input: PromptTemplate member (see table)
+        Expected: Prompt contains the template's keywords
         
         Troubleshooting:
-        - Empty prompt → Check TEMPLATES[DATA_ANALYSIS] exists
+        - Empty prompt → Check TEMPLATES has the template
         - Wrong content → Verify template text
         """
-        prompt = PromptManager.get_prompt(PromptTemplate.DATA_ANALYSIS)
+        _, lowered = rendered_templates[template]
         
-        assert len(prompt) > 0
-        assert "data analyst" in prompt.lower()
-        assert "analyze" in prompt.lower()
-        assert "insights" in prompt.lower()
-    
-    def test_get_data_cleaning_template(self):
-        """
-        Test: Retrieve DATA_CLEANING template
-        Input: PromptTemplate.DATA_CLEANING
-        Expected: Prompt contains data quality keywords
-        """
-        prompt = PromptManager.get_prompt(PromptTemplate.DATA_CLEANING)
-        
-        assert len(prompt) > 0
-        assert "data quality" in prompt.lower()
-        assert "missing" in prompt.lower() or "null" in prompt.lower()
-    
-    def test_get_data_transformation_template(self):
-        """
-        Test: Retrieve DATA_TRANSFORMATION template
-        Input: PromptTemplate.DATA_TRANSFORMATION
-        Expected: Prompt contains transformation keywords
-        """
-        prompt = PromptManager.get_prompt(PromptTemplate.DATA_TRANSFORMATION)
-        
-        assert len(prompt) > 0
-        assert "transform" in prompt.lower()
-        assert "data engineer" in prompt.lower()
-    
-    def test_get_categorization_template(self):
-        """
-        Test: Retrieve CATEGORIZATION template
-        Input: PromptTemplate.CATEGORIZATION
-        Expected: Prompt contains categorization keywords
-        """
-        prompt = PromptManager.get_prompt(PromptTemplate.CATEGORIZATION)
-        
-        assert len(prompt) > 0
-        assert "categor" in prompt.lower()  # matches categorize, categorization
-        assert "classification" in prompt.lower() or "classify" in prompt.lower()
-    
-    def test_get_sentiment_analysis_template(self):
-        """
-        Test: Retrieve SENTIMENT_ANALYSIS template
-        Input: PromptTemplate.SENTIMENT_ANALYSIS
-        Expected: Prompt contains sentiment keywords
-        """
-        prompt = PromptManager.get_prompt(PromptTemplate.SENTIMENT_ANALYSIS)
-        
-        assert len(prompt) > 0
-        assert "sentiment" in prompt.lower()
-        assert "positive" in prompt.lower() or "negative" in prompt.lower()
+        assert len(lowered) > 0
+        for needle in needles:
+            assert needle.search(lowered), \
+                f"{template} template lacks any of {needle.pattern}"
     
     def test_get_custom_prompt(self):
         """
@@ -212,7 +195,7 @@ class TestListTemplates:
     - Wrong descriptions → Verify description text
     """
     
-    def test_list_all_templates(self):
+    def test_list_all_templates(self, listed_templates):
         """
         Test: List all available templates
         Input: None
@@ -222,32 +205,28 @@ class TestListTemplates:
         - Missing template → Add to list_templates() return dict
         - Wrong count → Verify all PromptTemplate enum members included
         """
-        templates = PromptManager.list_templates()
-        
-        assert isinstance(templates, dict)
-        assert len(templates) >= 6  # At least 6 templates
+        assert isinstance(listed_templates, dict)
+        assert len(listed_templates) >= 6  # At least 6 templates
         
         # Check all expected templates are present
-        assert PromptTemplate.DATA_ANALYSIS in templates
-        assert PromptTemplate.DATA_CLEANING in templates
-        assert PromptTemplate.DATA_TRANSFORMATION in templates
-        assert PromptTemplate.CATEGORIZATION in templates
-        assert PromptTemplate.SENTIMENT_ANALYSIS in templates
-        assert PromptTemplate.CUSTOM in templates
+        assert PromptTemplate.DATA_ANALYSIS in listed_templates
+        assert PromptTemplate.DATA_CLEANING in listed_templates
+        assert PromptTemplate.DATA_TRANSFORMATION in listed_templates
+        assert PromptTemplate.CATEGORIZATION in listed_templates
+        assert PromptTemplate.SENTIMENT_ANALYSIS in listed_templates
+        assert PromptTemplate.CUSTOM in listed_templates
     
-    def test_template_descriptions_are_strings(self):
+    def test_template_descriptions_are_strings(self, listed_templates):
         """
         Test: All template descriptions are non-empty strings
         Input: None
         Expected: Each value is a string with content
         """
-        templates = PromptManager.list_templates()
-        
-        for template_name, description in templates.items():
+        for template_name, description in listed_templates.items():
             assert isinstance(description, str)
             assert len(description) > 0
     
-    def test_specific_template_descriptions(self):
+    def test_specific_template_descriptions(self, listed_templates):
         """
         Test: Verify specific template descriptions
         Input: None
@@ -256,15 +235,13 @@ class TestListTemplates:
         Troubleshooting:
         - Wrong description → Update list_templates() description text
         """
-        templates = PromptManager.list_templates()
-        
-        assert "analyze" in templates[PromptTemplate.DATA_ANALYSIS].lower()
-        assert "clean" in templates[PromptTemplate.DATA_CLEANING].lower() or \
-               "quality" in templates[PromptTemplate.DATA_CLEANING].lower()
-        assert "transform" in templates[PromptTemplate.DATA_TRANSFORMATION].lower()
-        assert "categor" in templates[PromptTemplate.CATEGORIZATION].lower()
-        assert "sentiment" in templates[PromptTemplate.SENTIMENT_ANALYSIS].lower()
-        assert "custom" in templates[PromptTemplate.CUSTOM].lower()
+        assert "analyze" in listed_templates[PromptTemplate.DATA_ANALYSIS].lower()
+        cleaning = listed_templates[PromptTemplate.DATA_CLEANING].lower()
+        assert "clean" in cleaning or "quality" in cleaning
+        assert "transform" in listed_templates[PromptTemplate.DATA_TRANSFORMATION].lower()
+        assert "categor" in listed_templates[PromptTemplate.CATEGORIZATION].lower()
+        assert "sentiment" in listed_templates[PromptTemplate.SENTIMENT_ANALYSIS].lower()
+        assert "custom" in listed_templates[PromptTemplate.CUSTOM].lower()
 
 
 class TestTemplateContent:
@@ -281,7 +258,14 @@ class TestTemplateContent:
     - Poor formatting → Check whitespace and structure
     """
     
-    def test_templates_have_sufficient_length(self):
+    @pytest.mark.parametrize("template", [
+        PromptTemplate.DATA_ANALYSIS,
+        PromptTemplate.DATA_CLEANING,
+        PromptTemplate.DATA_TRANSFORMATION,
+        PromptTemplate.CATEGORIZATION,
+        PromptTemplate.SENTIMENT_ANALYSIS
+    ])
+    def test_templates_have_sufficient_length(self, template, rendered_templates):
         """
         Test: Templates are substantial (>50 characters)
         Input: Each template
@@ -290,32 +274,25 @@ class TestTemplateContent:
         Troubleshooting:
         - Short template → Expand template with more details
         """
-        for template in [
-            PromptTemplate.DATA_ANALYSIS,
-            PromptTemplate.DATA_CLEANING,
-            PromptTemplate.DATA_TRANSFORMATION,
-            PromptTemplate.CATEGORIZATION,
-            PromptTemplate.SENTIMENT_ANALYSIS
-        ]:
-            prompt = PromptManager.get_prompt(template)
-            assert len(prompt) > 50, f"{template} template is too short"
+        prompt, _ = rendered_templates[template]
+        assert len(prompt) > 50, f"{template} template is too short"
     
-    def test_templates_contain_numbered_lists(self):
+    @pytest.mark.parametrize("template", [
+        PromptTemplate.DATA_ANALYSIS,
+        PromptTemplate.DATA_CLEANING,
+        PromptTemplate.CATEGORIZATION
+    ])
+    def test_templates_contain_numbered_lists(self, template, rendered_templates):
         """
         Test: Templates use numbered lists for structure
         Input: Each template
         Expected: Contains numbered items (1., 2., etc.)
         """
-        for template in [
-            PromptTemplate.DATA_ANALYSIS,
-            PromptTemplate.DATA_CLEANING,
-            PromptTemplate.CATEGORIZATION
-        ]:
-            prompt = PromptManager.get_prompt(template)
-            # Should have numbered lists
-            assert "1." in prompt or "1)" in prompt
+        prompt, _ = rendered_templates[template]
+        # Should have numbered lists
+        assert "1." in prompt or "1)" in prompt
     
-    def test_templates_are_role_based(self):
+    def test_templates_are_role_based(self, rendered_templates):
         """
         Test: Templates start with role definition
         Input: Each template
@@ -328,8 +305,8 @@ class TestTemplateContent:
         ]
         
         for template in templates_to_check:
-            prompt = PromptManager.get_prompt(template)
-            assert "you are" in prompt.lower(), \
+            _, lowered = rendered_templates[template]
+            assert "you are" in lowered, \
                 f"{template} should define AI role"
 
 
@@ -15,6 +15,7 @@ Troubleshooting Guide:
 - Missing field → Verify required vs optional fields
 - Type error → Check field type annotations
 - Default values → Verify Field(default=...) declarations
+- DeprecationWarning raised as error → Update the schema to the current Pydantic API
 """
 import pytest
 from pydantic import ValidationError
@@ -23,10 +24,59 @@ from app.schemas.ai_schemas import (
     AIModelConfig,
     AIRequest,
     AIResponse,
-    AIError
+    AIError,
+    DEFAULT_AI_CONFIG
 )
 
 
+# Pydantic API drift (deprecated field patterns) fails the schema tests at once
+pytestmark = pytest.mark.filterwarnings("error::DeprecationWarning")
+
+# Request payloads shared by read-only tests (kept JSON-shaped, as clients send them)
+_MINIMAL_INPUT = {"values": [1, 2, 3]}
+_TEST_INPUT = {"test": "data"}
+_COMPLEX_DATA = {
+    "numbers": [1, 2, 3, 4, 5],
+    "text": "sample",
+    "nested": {
+        "key": "value",
+        "list": ["a", "b", "c"]
+    },
+    "boolean": True
+}
+
+# Request body as the /process route receives it
+_SAMPLE_REQUEST_JSON = (
+    b'{"provider":"claude","instruction_prompt":"Analyze this",'
+    b'"input_data":{"numbers":[1,2,3]},"ai_config":{"temperature":0.5}}'
+)
+
+
+@pytest.fixture
+def make_response():
+    """
+    Factory building AIResponse objects from shared defaults.
+    
+    Keyword overrides replace the defaults. Pass validate=False to build the
+    response with model_construct, as the adapters do, when validation is not
+    what the test checks.
+    """
+    defaults = {
+        "provider": AIProviderType.GEMINI,
+        "content": "Analysis result",
+        "usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+        "model": "gemini-pro"
+    }
+    
+    def _make(validate=True, **overrides):
+        fields = {**defaults, **overrides}
+        if validate:
+            return AIResponse(**fields)
+        return AIResponse.model_construct(**fields)
+    
+    return _make
+
+
 class TestAIProviderType:
     """
     Test suite for AIProviderType enum.
@@ -41,29 +91,20 @@ class TestAIProviderType:
     - Wrong value → Check enum string assignment
     """
     
-    def test_all_providers_exist(self):
-        """
-        Test: All expected AI providers are defined
-        Input: Access each provider type
-        Expected: No AttributeError
-        """
-        assert AIProviderType.GEMINI
-        assert AIProviderType.OPENAI
-        assert AIProviderType.CLAUDE
-        assert AIProviderType.DEEPSEEK
-        assert AIProviderType.VERTEX_AI
-    
-    def test_provider_string_values(self):
+    @pytest.mark.parametrize("name,value", [
+        ("GEMINI", "gemini"),
+        ("OPENAI", "openai"),
+        ("CLAUDE", "claude"),
+        ("DEEPSEEK", "deepseek"),
+        ("VERTEX_AI", "vertex_ai"),
+    ])
+    def test_provider(self, name, value):
         """
-        Test: Provider enum values are lowercase strings
-        Input: Provider enum members
-        Expected: Correct string values
+        Test: Each expected provider is defined with its lowercase string value
+        Input: Enum member name and expected value (see table)
+        Expected: Member exists (no KeyError) and has the value
         """
-        assert AIProviderType.GEMINI.value == "gemini"
-        assert AIProviderType.OPENAI.value == "openai"
-        assert AIProviderType.CLAUDE.value == "claude"
-        assert AIProviderType.DEEPSEEK.value == "deepseek"
-        assert AIProviderType.VERTEX_AI.value == "vertex_ai"
+        assert AIProviderType[name].value == value
     
     def test_provider_comparison(self):
         """
@@ -98,19 +139,19 @@ class TestAIModelConfig:
     def test_default_values(self):
         """
         Test: AIModelConfig has correct defaults
-        Input: AIModelConfig()
+        Input: DEFAULT_AI_CONFIG, the AIModelConfig() every request shares
         Expected: All defaults match specification
         
         Troubleshooting:
         - Wrong default → Check Field(default=...) in schema
         """
-        config = AIModelConfig()
-        
-        assert config.temperature == 0.7
-        assert config.max_tokens == 1000
-        assert config.top_p == 1.0
-        assert config.frequency_penalty == 0.0
-        assert config.presence_penalty == 0.0
+        assert (
+            DEFAULT_AI_CONFIG.temperature,
+            DEFAULT_AI_CONFIG.max_tokens,
+            DEFAULT_AI_CONFIG.top_p,
+            DEFAULT_AI_CONFIG.frequency_penalty,
+            DEFAULT_AI_CONFIG.presence_penalty
+        ) == (0.7, 1000, 1.0, 0.0, 0.0)
     
     def test_valid_custom_values(self):
         """
@@ -126,132 +167,69 @@ class TestAIModelConfig:
             presence_penalty=0.3
         )
         
-        assert config.temperature == 0.5
-        assert config.max_tokens == 2000
-        assert config.top_p == 0.9
-        assert config.frequency_penalty == 0.5
-        assert config.presence_penalty == 0.3
-    
-    def test_temperature_min_boundary(self):
-        """
-        Test: Temperature minimum boundary (0.0)
-        Input: temperature=0.0
-        Expected: Valid
-        """
-        config = AIModelConfig(temperature=0.0)
-        assert config.temperature == 0.0
-    
-    def test_temperature_max_boundary(self):
-        """
-        Test: Temperature maximum boundary (2.0)
-        Input: temperature=2.0
-        Expected: Valid
-        """
-        config = AIModelConfig(temperature=2.0)
-        assert config.temperature == 2.0
-    
-    def test_temperature_below_min(self):
-        """
-        Test: Temperature below minimum fails
-        Input: temperature=-0.1
-        Expected: ValidationError
+        assert (
+            config.temperature,
+            config.max_tokens,
+            config.top_p,
+            config.frequency_penalty,
+            config.presence_penalty
+        ) == (0.5, 2000, 0.9, 0.5, 0.3)
+    
+    @pytest.mark.parametrize("field,value", [
+        ("temperature", 0.0),
+        ("temperature", 2.0),
+        ("max_tokens", 1),
+        ("top_p", 0.0),
+        ("top_p", 0.5),
+        ("top_p", 1.0),
+        ("frequency_penalty", -2.0),
+        ("frequency_penalty", 0.0),
+        ("frequency_penalty", 2.0),
+        ("presence_penalty", -2.0),
+        ("presence_penalty", 0.0),
+        ("presence_penalty", 2.0),
+    ])
+    def test_valid_boundary(self, validate_config, field, value):
+        """
+        Test: Values at and inside each range boundary are accepted
+        Input: One field set to a boundary or in-range value (see table)
+        Expected: Valid, value stored unchanged
+        """
+        config = validate_config({field: value})
+        assert getattr(config, field) == value
+    
+    @pytest.mark.parametrize("field,value", [
+        ("temperature", -0.1),
+        ("temperature", 2.1),
+        ("max_tokens", 0),
+        ("max_tokens", -1),
+        ("top_p", 1.5),
+    ])
+    def test_invalid_boundary(self, validate_config, field, value):
+        """
+        Test: Values just outside a range fail
+        Input: One field set outside its range (see table)
+        Expected: ValidationError naming the field
         
         Troubleshooting:
-        - No error raised → Check Field(ge=0.0) constraint
+        - No error raised → Check Field(ge=..., le=...) constraints
         """
         with pytest.raises(ValidationError) as exc_info:
-            AIModelConfig(temperature=-0.1)
+            validate_config({field: value})
         
-        assert "temperature" in str(exc_info.value).lower()
+        assert any(e["loc"] == (field,) for e in exc_info.value.errors())
     
-    def test_temperature_above_max(self):
-        """
-        Test: Temperature above maximum fails
-        Input: temperature=2.1
-        Expected: ValidationError
+    def test_config_is_frozen_and_strict(self):
         """
-        with pytest.raises(ValidationError) as exc_info:
-            AIModelConfig(temperature=2.1)
-        
-        assert "temperature" in str(exc_info.value).lower()
-    
-    def test_max_tokens_positive(self):
-        """
-        Test: max_tokens must be positive
-        Input: max_tokens=1
-        Expected: Valid (minimum value)
-        """
-        config = AIModelConfig(max_tokens=1)
-        assert config.max_tokens == 1
-    
-    def test_max_tokens_zero_invalid(self):
-        """
-        Test: max_tokens cannot be zero
-        Input: max_tokens=0
-        Expected: ValidationError
+        Test: AIModelConfig is immutable and rejects unknown parameters
+        Input: Assignment after construction; unknown "top_k" field
+        Expected: ValidationError in both cases
         """
         with pytest.raises(ValidationError):
-            AIModelConfig(max_tokens=0)
-    
-    def test_max_tokens_negative_invalid(self):
-        """
-        Test: max_tokens cannot be negative
-        Input: max_tokens=-1
-        Expected: ValidationError
-        """
-        with pytest.raises(ValidationError):
-            AIModelConfig(max_tokens=-1)
-    
-    def test_top_p_boundaries(self):
-        """
-        Test: top_p valid range [0.0, 1.0]
-        Input: top_p=0.0, 0.5, 1.0
-        Expected: All valid
-        """
-        config1 = AIModelConfig(top_p=0.0)
-        config2 = AIModelConfig(top_p=0.5)
-        config3 = AIModelConfig(top_p=1.0)
+            DEFAULT_AI_CONFIG.temperature = 1.0
         
-        assert config1.top_p == 0.0
-        assert config2.top_p == 0.5
-        assert config3.top_p == 1.0
-    
-    def test_top_p_out_of_range(self):
-        """
-        Test: top_p outside [0.0, 1.0] fails
-        Input: top_p=1.5
-        Expected: ValidationError
-        """
         with pytest.raises(ValidationError):
-            AIModelConfig(top_p=1.5)
-    
-    def test_frequency_penalty_boundaries(self):
-        """
-        Test: frequency_penalty range [-2.0, 2.0]
-        Input: Various values in range
-        Expected: All valid
-        """
-        config1 = AIModelConfig(frequency_penalty=-2.0)
-        config2 = AIModelConfig(frequency_penalty=0.0)
-        config3 = AIModelConfig(frequency_penalty=2.0)
-        
-        assert config1.frequency_penalty == -2.0
-        assert config2.frequency_penalty == 0.0
-        assert config3.frequency_penalty == 2.0
-    
-    def test_presence_penalty_boundaries(self):
-        """
-        Test: presence_penalty range [-2.0, 2.0]
-        Input: Various values in range
-        Expected: All valid
-        """
-        config1 = AIModelConfig(presence_penalty=-2.0)
-        config2 = AIModelConfig(presence_penalty=0.0)
-        config3 = AIModelConfig(presence_penalty=2.0)
-        
-        assert config1.presence_penalty == -2.0
-        assert config2.presence_penalty == 0.0
-        assert config3.presence_penalty == 2.0
+            AIModelConfig(top_k=40)
 
 
 class TestAIRequest:
@@ -275,7 +253,7 @@ class TestAIRequest:
         """
         Test: Create request with minimal required fields
         Input: provider, instruction_prompt, input_data only
-        Expected: Request created with default ai_config
+        Expected: Request created with the shared default ai_config
         
         Troubleshooting:
         - Missing field error → Check which fields are required
@@ -283,13 +261,14 @@ class TestAIRequest:
         request = AIRequest(
             provider=AIProviderType.GEMINI,
             instruction_prompt="Analyze this data",
-            input_data={"values": [1, 2, 3]}
+            input_data=_MINIMAL_INPUT
         )
         
         assert request.provider == AIProviderType.GEMINI
         assert request.instruction_prompt == "Analyze this data"
-        assert request.input_data == {"values": [1, 2, 3]}
-        assert isinstance(request.ai_config, AIModelConfig)
+        assert request.input_data == _MINIMAL_INPUT
+        # Frozen default is shared, not rebuilt per request
+        assert request.ai_config is DEFAULT_AI_CONFIG
         assert request.model_name is None
     
     def test_create_full_request(self):
@@ -325,71 +304,55 @@ class TestAIRequest:
             AIRequest(
                 provider=AIProviderType.GEMINI,
                 instruction_prompt="",
-                input_data={"test": "data"}
+                input_data=_TEST_INPUT
             )
         
-        assert "instruction_prompt" in str(exc_info.value).lower()
+        assert any(e["loc"] == ("instruction_prompt",) for e in exc_info.value.errors())
     
-    def test_missing_required_provider(self):
+    @pytest.mark.parametrize("missing", ["provider", "instruction_prompt", "input_data"])
+    def test_missing_required_field(self, missing):
         """
-        Test: Missing provider field fails
-        Input: No provider specified
-        Expected: ValidationError
-        """
-        with pytest.raises(ValidationError):
-            AIRequest(
-                instruction_prompt="Test",
-                input_data={"test": "data"}
-            )
-    
-    def test_missing_required_instruction_prompt(self):
-        """
-        Test: Missing instruction_prompt fails
-        Input: No instruction_prompt specified
+        Test: Each required field is enforced
+        Input: Otherwise valid request without one required field
         Expected: ValidationError
         """
+        fields = {
+            "provider": AIProviderType.GEMINI,
+            "instruction_prompt": "Test",
+            "input_data": _TEST_INPUT,
+        }
+        del fields[missing]
+        
         with pytest.raises(ValidationError):
-            AIRequest(
-                provider=AIProviderType.GEMINI,
-                input_data={"test": "data"}
-            )
+            AIRequest(**fields)
     
-    def test_missing_required_input_data(self):
+    def test_input_data_must_be_object(self):
         """
-        Test: Missing input_data fails
-        Input: No input_data specified
+        Test: Non-object input_data fails
+        Input: input_data as a list
         Expected: ValidationError
         """
         with pytest.raises(ValidationError):
             AIRequest(
                 provider=AIProviderType.GEMINI,
-                instruction_prompt="Test"
+                instruction_prompt="Test",
+                input_data=[1, 2, 3]
             )
     
     def test_input_data_can_be_complex(self):
         """
         Test: input_data accepts complex structures
         Input: Nested dict with lists and various types
-        Expected: Stored correctly
-        """
-        complex_data = {
-            "numbers": [1, 2, 3, 4, 5],
-            "text": "sample",
-            "nested": {
-                "key": "value",
-                "list": ["a", "b", "c"]
-            },
-            "boolean": True
-        }
+        Expected: Passed through untouched by the input_data validator
         
-        request = AIRequest(
-            provider=AIProviderType.CLAUDE,
-            instruction_prompt="Analyze",
-            input_data=complex_data
-        )
+        Troubleshooting:
+        - Copy returned → input_data must stay typed Any so pydantic does not
+          rebuild the mapping (test_create_minimal_request covers the full model)
+        """
+        validated = AIRequest.check_input_data_is_object(_COMPLEX_DATA)
         
-        assert request.input_data == complex_data
-        assert request.input_data["nested"]["key"] == "value"
+        assert validated is _COMPLEX_DATA
+        assert validated["nested"]["key"] == "value"
 
 
 class TestAIResponse:
@@ -407,18 +370,13 @@ class TestAIResponse:
     - Type error → Verify field type annotations
     """
     
-    def test_create_minimal_response(self):
+    def test_create_minimal_response(self, make_response):
         """
         Test: Create response with required fields
         Input: provider, content, usage, model
         Expected: Response created, raw_response is None
         """
-        response = AIResponse(
-            provider=AIProviderType.GEMINI,
-            content="Analysis result",
-            usage={"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
-            model="gemini-pro"
-        )
+        response = make_response()
         
         assert response.provider == AIProviderType.GEMINI
         assert response.content == "Analysis result"
@@ -426,29 +384,23 @@ class TestAIResponse:
         assert response.model == "gemini-pro"
         assert response.raw_response is None
     
-    def test_create_response_with_raw(self):
+    def test_create_response_with_raw(self, make_response):
         """
         Test: Create response with raw_response
-        Input: All fields including raw_response
+        Input: All fields including raw_response, built like adapters do (model_construct)
         Expected: raw_response stored
         """
         raw_data = {"api_version": "1.0", "request_id": "123"}
         
-        response = AIResponse(
-            provider=AIProviderType.OPENAI,
-            content="Result",
-            usage={"prompt_tokens": 5, "completion_tokens": 10, "total_tokens": 15},
-            model="gpt-4",
-            raw_response=raw_data
-        )
+        response = make_response(validate=False, raw_response=raw_data)
         
         assert response.raw_response == raw_data
         assert response.raw_response["request_id"] == "123"
     
-    def test_usage_dict_structure(self):
+    def test_usage_dict_structure(self, make_response):
         """
         Test: Usage dict can contain various metrics
-        Input: Usage with custom keys
+        Input: Usage with custom keys, built like adapters do (model_construct)
         Expected: All keys preserved
         """
         usage = {
@@ -458,12 +410,7 @@ class TestAIResponse:
             "custom_metric": 42
         }
         
-        response = AIResponse(
-            provider=AIProviderType.CLAUDE,
-            content="Response",
-            usage=usage,
-            model="claude-3"
-        )
+        response = make_response(validate=False, usage=usage)
         
         assert response.usage["custom_metric"] == 42
 
@@ -551,25 +498,20 @@ class TestSchemaSerializationDeserialization:
         assert data["provider"] == "gemini"
         assert data["instruction_prompt"] == "Test"
         assert data["input_data"]["key"] == "value"
-        assert "ai_config" in data
+        assert data["ai_config"] == DEFAULT_AI_CONFIG.model_dump()
     
-    def test_response_to_dict(self):
+    def test_response_to_dict(self, make_response):
         """
         Test: Serialize AIResponse to dict
         Input: AIResponse instance
         Expected: Dict with all fields
         """
-        response = AIResponse(
-            provider=AIProviderType.OPENAI,
-            content="Result",
-            usage={"total_tokens": 100},
-            model="gpt-4"
-        )
+        response = make_response(provider=AIProviderType.OPENAI, model="gpt-4")
         
         data = response.model_dump()
         
         assert data["provider"] == "openai"
-        assert data["content"] == "Result"
+        assert data["content"] == "Analysis result"
         assert data["model"] == "gpt-4"
     
     def test_parse_request_from_dict(self):
@@ -589,6 +531,18 @@ class TestSchemaSerializationDeserialization:
         
         assert request.provider == AIProviderType.CLAUDE
         assert request.ai_config.temperature == 0.5
+    
+    def test_parse_request_from_json(self):
+        """
+        Test: Parse AIRequest from raw JSON bytes, as the /process route does
+        Input: Pre-serialized request body
+        Expected: Same result as the dict path
+        """
+        request = AIRequest.model_validate_json(_SAMPLE_REQUEST_JSON)
+        
+        assert request.provider == AIProviderType.CLAUDE
+        assert request.input_data == {"numbers": [1, 2, 3]}
+        assert request.ai_config.temperature == 0.5
 
 
 # Run tests with: pytest tests/test_schemas.py -v --tb=short
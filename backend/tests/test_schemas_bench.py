@@ -0,0 +1,55 @@
+"""
+Schema Microbenchmarks
+CPU benchmarks for the request/response schemas on the /process hot path.
+
+Test Coverage:
+- AIRequest construction from keyword arguments
+- AIRequest parsing from raw JSON bytes (what the /process route does)
+- AIResponse serialization
+
+Run with: pytest tests/test_schemas_bench.py -m benchmark --codspeed
+
+Troubleshooting Guide:
+- If the module is skipped: Install pytest-codspeed (provides the benchmark fixture)
+- If nothing runs: Benchmarks are skipped unless selected with -m benchmark
+"""
+import pytest
+
+pytest.importorskip("pytest_codspeed")
+
+from app.schemas.ai_schemas import AIRequest, AIResponse, AIProviderType
+
+
+_REQUEST_JSON = (
+    b'{"provider":"gemini","instruction_prompt":"Analyze this",'
+    b'"input_data":{"numbers":[1,2,3]},"ai_config":{"temperature":0.5}}'
+)
+
+_RESPONSE = AIResponse(
+    provider=AIProviderType.GEMINI,
+    content="Analysis result",
+    usage={"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+    model="gemini-pro"
+)
+
+
+@pytest.mark.benchmark
+def test_ai_request_build(benchmark):
+    """Build an AIRequest from keyword arguments."""
+    benchmark(lambda: AIRequest(
+        provider=AIProviderType.GEMINI,
+        instruction_prompt="Analyze this",
+        input_data={"numbers": [1, 2, 3]}
+    ))
+
+
+@pytest.mark.benchmark
+def test_ai_request_validate_json(benchmark):
+    """Parse an AIRequest from a raw request body."""
+    benchmark(AIRequest.model_validate_json, _REQUEST_JSON)
+
+
+@pytest.mark.benchmark
+def test_ai_response_dump(benchmark):
+    """Serialize an AIResponse to a dict."""
+    benchmark(_RESPONSE.model_dump)